@@ -0,0 +1,75 @@
+"""
+Compara la jerarquía de contracción con `shortest_path` (unidireccional y bidireccional) sobre grafos sintéticos.
+
+Uso, desde el directorio del proyecto:
+
+    python -m benchmarks.contraccion [--lado 60] [--nodos 1000] [--consultas 200] [--semilla 0]
+
+Para cada grafo muestra el tiempo de preprocesamiento, el número de atajos, el tiempo medio por consulta de cada
+método y la aceleración de la jerarquía respecto a Dijkstra. Antes de medir se comprueba que todas las distancias
+coinciden.
+"""
+import argparse
+import random
+import time
+
+from benchmarks.generadores import como_diccionarios, rejilla
+from modulo.contraccion import JerarquiaContraccion
+from modulo.Dijkstra import shortest_path
+from modulo.grafo_csr import GrafoCSR
+
+
+def grafo_aleatorio(n, grado, aleatorio):
+    """Grafo dirigido con un ciclo por todos los nodos (para que sea conexo) y `grado` aristas extra por nodo."""
+    grafo = {nodo: {nodo % n + 1: aleatorio.randint(1, 100)} for nodo in range(1, n + 1)}
+    for nodo in range(1, n + 1):
+        for _ in range(grado):
+            grafo[nodo][aleatorio.randint(1, n)] = aleatorio.randint(1, 100)
+    return {nodo: [(v, p) for v, p in aristas.items() if v != nodo] for nodo, aristas in grafo.items()}
+
+
+def medir(nombre, grafo, consultas, aleatorio):
+    csr = GrafoCSR.desde_ponderado(grafo)
+    inicio = time.perf_counter()
+    jerarquia = JerarquiaContraccion.construir(csr)
+    preprocesamiento = time.perf_counter() - inicio
+
+    nodos = list(grafo)
+    pares = [(aleatorio.choice(nodos), aleatorio.choice(nodos)) for _ in range(consultas)]
+    metodos = {
+        "dijkstra": lambda s, t: shortest_path(csr, s, t)[0],
+        "bidireccional": lambda s, t: shortest_path(csr, s, t, bidireccional=True)[0],
+        "jerarquia": jerarquia.distancia,
+    }
+    esperadas = [metodos["dijkstra"](s, t) for s, t in pares]
+    tiempos = {}
+    for metodo, consulta in metodos.items():
+        inicio = time.perf_counter()
+        obtenidas = [consulta(s, t) for s, t in pares]
+        tiempos[metodo] = (time.perf_counter() - inicio) / consultas
+        if obtenidas != esperadas:
+            raise AssertionError(f"{metodo} no coincide con dijkstra en {nombre}")
+
+    print(f"{nombre}: {len(csr)} nodos, {csr.num_aristas} aristas, {jerarquia.num_atajos} atajos, "
+          f"preprocesamiento {preprocesamiento:.2f} s")
+    for metodo, tiempo in tiempos.items():
+        print(f"  {metodo:<14} {tiempo * 1e3:8.3f} ms/consulta  x{tiempos['dijkstra'] / tiempo:.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--lado", type=int, default=60, help="lado de la rejilla")
+    parser.add_argument("--nodos", type=int, default=1000, help="nodos del grafo aleatorio")
+    parser.add_argument("--consultas", type=int, default=200, help="consultas por grafo")
+    parser.add_argument("--semilla", type=int, default=0)
+    argumentos = parser.parse_args()
+
+    aleatorio = random.Random(argumentos.semilla)
+    # Rejilla lado × lado con aristas en ambos sentidos y pesos entre 1 y 100, parecida a una red vial
+    rejilla_ponderada = como_diccionarios(rejilla(2 * argumentos.lado ** 2, argumentos.semilla))[0]
+    medir("rejilla", rejilla_ponderada, argumentos.consultas, aleatorio)
+    medir("aleatorio", grafo_aleatorio(argumentos.nodos, 2, aleatorio), argumentos.consultas, aleatorio)
+
+
+if __name__ == "__main__":
+    main()
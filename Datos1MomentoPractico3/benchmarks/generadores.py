@@ -0,0 +1,99 @@
+"""
+Generadores de grafos sintéticos con semilla para los benchmarks.
+
+Cada generador recibe el número aproximado de aristas y una semilla, y retorna una lista de aristas no dirigidas
+`(Nodo1, Nodo2, Peso)` como la que recibe `kruskal`: nodos desde 1, pesos enteros entre 1 y 100, sin lazos ni
+pares repetidos, y siempre conexa (para que `kruskal` y `dijkstra` no fallen). Con la misma semilla se obtiene
+exactamente el mismo grafo, lo que permite comparar resultados entre ejecuciones.
+"""
+import math
+import random
+
+
+def erdos_renyi(aristas, semilla=0):
+    """Grafo aleatorio con grado medio 8: un árbol aleatorio que lo hace conexo más pares uniformes al azar."""
+    aleatorio = random.Random(semilla)
+    n = max(2, aristas // 4)
+    pares = {(aleatorio.randrange(1, i), i) for i in range(2, n + 1)}
+    objetivo = min(aristas, n * (n - 1) // 2)
+    while len(pares) < objetivo:
+        nodo1, nodo2 = aleatorio.randint(1, n), aleatorio.randint(1, n)
+        if nodo1 != nodo2:
+            pares.add((min(nodo1, nodo2), max(nodo1, nodo2)))
+    return _con_pesos(sorted(pares), aleatorio)
+
+
+def rejilla(aristas, semilla=0):
+    """Rejilla cuadrada (grafo tipo red vial: grado 4 y diámetro grande) con cerca de `aristas` aristas."""
+    aleatorio = random.Random(semilla)
+    lado = max(2, round(math.sqrt(aristas / 2)))
+    pares = []
+    for fila in range(lado):
+        for columna in range(lado):
+            nodo = fila * lado + columna + 1
+            if columna + 1 < lado:
+                pares.append((nodo, nodo + 1))
+            if fila + 1 < lado:
+                pares.append((nodo, nodo + lado))
+    return _con_pesos(pares, aleatorio)
+
+
+def ley_potencia(aristas, semilla=0, grado=4):
+    """
+    Grafo de Barabási–Albert: cada nodo nuevo se conecta con `grado` nodos existentes elegidos con probabilidad
+    proporcional a su grado, lo que produce unos pocos nodos con grado muy alto.
+    """
+    aleatorio = random.Random(semilla)
+    n = max(grado + 1, aristas // grado + 1)
+    # Cada nodo aparece en `extremos` una vez por arista que lo toca: elegir uniformemente ahí es elegir por grado
+    extremos = list(range(1, grado + 1))
+    pares = []
+    for nodo in range(grado + 1, n + 1):
+        elegidos = set()
+        while len(elegidos) < grado:
+            elegidos.add(aleatorio.choice(extremos))
+        for vecino in elegidos:
+            pares.append((vecino, nodo))
+            extremos.append(vecino)
+        extremos.extend([nodo] * grado)
+    return _con_pesos(pares, aleatorio)
+
+
+def completo(aristas, semilla=0):
+    """Grafo completo con el mayor número de nodos cuyas aristas no superan `aristas` (al menos 2 nodos)."""
+    aleatorio = random.Random(semilla)
+    n = max(2, int((1 + math.sqrt(1 + 8 * aristas)) / 2))
+    return _con_pesos([(i, j) for i in range(1, n) for j in range(i + 1, n + 1)], aleatorio)
+
+
+def camino(aristas, semilla=0):
+    """Camino simple de `aristas` aristas: la profundidad máxima posible para una DFS."""
+    aleatorio = random.Random(semilla)
+    return _con_pesos([(i, i + 1) for i in range(1, aristas + 1)], aleatorio)
+
+
+GENERADORES = {
+    "erdos_renyi": erdos_renyi,
+    "rejilla": rejilla,
+    "ley_potencia": ley_potencia,
+    "completo": completo,
+    "camino": camino,
+}
+
+
+def como_diccionarios(aristas):
+    """
+    Convierte una lista de aristas no dirigidas en los dos formatos de diccionario del proyecto: el ponderado de
+    `dijkstra` (listas de `(destino, peso)`) y el de adyacencia de `contiene_ciclo`, ambos simétricos.
+    """
+    ponderado, adyacencia = {}, {}
+    for nodo1, nodo2, peso in aristas:
+        ponderado.setdefault(nodo1, []).append((nodo2, peso))
+        ponderado.setdefault(nodo2, []).append((nodo1, peso))
+        adyacencia.setdefault(nodo1, []).append(nodo2)
+        adyacencia.setdefault(nodo2, []).append(nodo1)
+    return ponderado, adyacencia
+
+
+def _con_pesos(pares, aleatorio):
+    return [(nodo1, nodo2, aleatorio.randint(1, 100)) for nodo1, nodo2 in pares]
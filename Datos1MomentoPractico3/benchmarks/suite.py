@@ -0,0 +1,248 @@
+"""
+Mide tiempo y memoria pico de los algoritmos del proyecto sobre grafos sintéticos, y detecta regresiones.
+
+Uso, desde el directorio del proyecto:
+
+    python -m benchmarks.suite [--aristas 1e3,1e4,1e5] [--generadores rejilla,camino] [--algoritmos kruskal]
+                               [--repeticiones 3] [--semilla 0] [--salida resultados.json]
+                               [--comparar base.json] [--tolerancia 0.2] [--sin-memoria]
+
+Para cada generador de `benchmarks.generadores`, cada tamaño y cada variante (formato de entrada, modo o motor)
+de cada algoritmo, se guarda el mejor tiempo de `--repeticiones` ejecuciones y la memoria pico de una ejecución
+aparte con `tracemalloc` (que hace más lenta la ejecución, por eso no se mide a la vez). La preparación de las
+entradas (listas, diccionarios, `GrafoCSR`) no se incluye en la medición.
+
+Con `--comparar`, cada medición se compara con la de un JSON anterior: las que empeoran más que `--tolerancia`
+(0.2 = 20 %) se marcan como regresión y el proceso termina con código 1, para poder usarlo en integración
+continua.
+"""
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from benchmarks.generadores import GENERADORES, como_diccionarios
+from modulo.boruvka import boruvka
+from modulo.componentes import connected_components
+from modulo.contiene_ciclo import contiene_ciclo
+from modulo.delta_stepping import delta_stepping
+from modulo.Dijkstra import dijkstra
+from modulo.grafo_csr import GrafoCSR
+from modulo.kruskal import UnionFind, kruskal
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class Entradas:
+    """Las representaciones de un mismo grafo que usan los algoritmos, construidas solo cuando se piden."""
+
+    def __init__(self, aristas):
+        self.lista = aristas
+        self._cache = {}
+
+    def _obtener(self, nombre, construir):
+        if nombre not in self._cache:
+            self._cache[nombre] = construir()
+        return self._cache[nombre]
+
+    @property
+    def csr(self):
+        return self._obtener("csr", lambda: GrafoCSR.desde_aristas(self.lista))
+
+    @property
+    def ponderado(self):
+        return self._obtener("diccionarios", lambda: como_diccionarios(self.lista))[0]
+
+    @property
+    def adyacencia(self):
+        return self._obtener("diccionarios", lambda: como_diccionarios(self.lista))[1]
+
+    @property
+    def extremos(self):
+        """Los extremos de las aristas como índices densos, para medir `UnionFind` sin internar nodos."""
+        def construir():
+            csr = self.csr
+            return [csr.indice(nodo1) for nodo1, _, _ in self.lista], [csr.indice(nodo2) for _, nodo2, _ in self.lista]
+        return self._obtener("extremos", construir)
+
+
+def _union_una_por_una(entradas):
+    xs, ys = entradas.extremos
+    uf = UnionFind(len(entradas.csr))
+    for x, y in zip(xs, ys):
+        uf.union(x, y)
+
+
+# algoritmo -> variante -> función que recibe las `Entradas` y ejecuta el algoritmo una vez
+ALGORITMOS = {
+    "kruskal": {
+        "ordenado": lambda e: kruskal(e.lista),
+        "heap": lambda e: kruskal(e.lista, modo="heap"),
+        "csr": lambda e: kruskal(e.csr),
+    },
+    "boruvka": {
+        "1-proceso": lambda e: boruvka(e.csr, procesos=1),
+    },
+    "union_find": {
+        "union": _union_una_por_una,
+        "union_many": lambda e: UnionFind(len(e.csr)).union_many(*e.extremos),
+    },
+    "contiene_ciclo": {
+        "dict": lambda e: contiene_ciclo(e.adyacencia),
+        "csr": lambda e: contiene_ciclo(e.csr),
+    },
+    "componentes": {
+        "python": lambda e: connected_components(e.csr, motor="python"),
+        "numpy": lambda e: connected_components(e.csr, motor="numpy"),
+    },
+    "dijkstra": {
+        "dict": lambda e: dijkstra(e.ponderado, 1),
+        "csr-heap": lambda e: dijkstra(e.csr, 1, cola="heap"),
+        "csr-auto": lambda e: dijkstra(e.csr, 1),
+        "delta-numpy": lambda e: delta_stepping(e.csr, 1, motor="numpy"),
+    },
+}
+
+# Variantes que requieren NumPy
+_CON_NUMPY = {("componentes", "numpy"), ("dijkstra", "delta-numpy")}
+
+
+def medir(funcion, entradas, repeticiones, con_memoria):
+    """Retorna `(mejor tiempo en segundos, memoria pico en bytes o None)` de `funcion(entradas)`."""
+    funcion(entradas)  # Calentamiento: también construye las entradas en caché fuera de la medición
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        gc.collect()
+        inicio = time.perf_counter()
+        funcion(entradas)
+        mejor = min(mejor, time.perf_counter() - inicio)
+
+    memoria = None
+    if con_memoria:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            funcion(entradas)
+            memoria = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return mejor, memoria
+
+
+def ejecutar(tamanos, generadores, algoritmos, repeticiones=3, semilla=0, con_memoria=True, informar=print):
+    """
+    Ejecuta todas las combinaciones y retorna la lista de resultados, cada uno un diccionario con `generador`,
+    `aristas`, `algoritmo`, `variante`, `segundos` y `memoria_pico` (bytes, o None).
+    """
+    resultados = []
+    for nombre_generador in generadores:
+        for tamano in tamanos:
+            entradas = Entradas(GENERADORES[nombre_generador](tamano, semilla))
+            for algoritmo in algoritmos:
+                for variante, funcion in ALGORITMOS[algoritmo].items():
+                    if numpy is None and (algoritmo, variante) in _CON_NUMPY:
+                        continue
+                    segundos, memoria = medir(funcion, entradas, repeticiones, con_memoria)
+                    resultado = {"generador": nombre_generador, "aristas": len(entradas.lista), "algoritmo": algoritmo,
+                                 "variante": variante, "segundos": segundos, "memoria_pico": memoria}
+                    resultados.append(resultado)
+                    informar(_formatear(resultado))
+    return resultados
+
+
+def comparar(resultados, base, tolerancia):
+    """
+    Compara los resultados con los de una ejecución anterior (misma forma que los de `ejecutar`).
+
+    :return: Lista de tuplas `(resultado, métrica, proporción)` con las mediciones que empeoraron más que
+        `tolerancia`; la proporción es valor nuevo / valor anterior.
+    """
+    anteriores = {_clave(resultado): resultado for resultado in base}
+    regresiones = []
+    for resultado in resultados:
+        anterior = anteriores.get(_clave(resultado))
+        if anterior is None:
+            continue
+        for metrica in ("segundos", "memoria_pico"):
+            nuevo, viejo = resultado.get(metrica), anterior.get(metrica)
+            if nuevo is None or not viejo:
+                continue
+            proporcion = nuevo / viejo
+            if proporcion > 1 + tolerancia:
+                regresiones.append((resultado, metrica, proporcion))
+    return regresiones
+
+
+def _clave(resultado):
+    return resultado["generador"], resultado["aristas"], resultado["algoritmo"], resultado["variante"]
+
+
+def _formatear(resultado):
+    memoria = resultado["memoria_pico"]
+    memoria = f"{memoria / 2 ** 20:9.2f} MiB" if memoria is not None else ""
+    return (f"{resultado['generador']:<13} {resultado['aristas']:>9} {resultado['algoritmo']:<15} "
+            f"{resultado['variante']:<12} {resultado['segundos'] * 1e3:11.3f} ms {memoria}")
+
+
+def _lista(texto, opciones=None):
+    valores = [valor.strip() for valor in texto.split(",") if valor.strip()]
+    if opciones is not None:
+        for valor in valores:
+            if valor not in opciones:
+                raise argparse.ArgumentTypeError(f"{valor!r} no es una opción válida ({', '.join(opciones)})")
+    return valores
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--aristas", type=lambda t: [int(float(v)) for v in _lista(t)], default=[1000, 10000, 100000],
+                        help="tamaños, en aristas, separados por comas (admite 1e6)")
+    parser.add_argument("--generadores", type=lambda t: _lista(t, GENERADORES), default=list(GENERADORES))
+    parser.add_argument("--algoritmos", type=lambda t: _lista(t, ALGORITMOS), default=list(ALGORITMOS))
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--salida", help="archivo JSON donde guardar los resultados")
+    parser.add_argument("--comparar", help="archivo JSON de una ejecución anterior")
+    parser.add_argument("--tolerancia", type=float, default=0.2, help="empeoramiento tolerado (0.2 = 20%%)")
+    parser.add_argument("--sin-memoria", action="store_true", help="no medir la memoria pico")
+    argumentos = parser.parse_args(argumentos)
+
+    resultados = ejecutar(argumentos.aristas, argumentos.generadores, argumentos.algoritmos,
+                          argumentos.repeticiones, argumentos.semilla, not argumentos.sin_memoria)
+
+    if argumentos.salida:
+        documento = {
+            "metadatos": {
+                "fecha": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "python": sys.version.split()[0],
+                "plataforma": platform.platform(),
+                "numpy": numpy.__version__ if numpy is not None else None,
+                "semilla": argumentos.semilla,
+                "repeticiones": argumentos.repeticiones,
+            },
+            "resultados": resultados,
+        }
+        with open(argumentos.salida, "w", encoding="utf-8") as archivo:
+            json.dump(documento, archivo, indent=2)
+
+    if argumentos.comparar:
+        with open(argumentos.comparar, encoding="utf-8") as archivo:
+            base = json.load(archivo)["resultados"]
+        regresiones = comparar(resultados, base, argumentos.tolerancia)
+        for resultado, metrica, proporcion in regresiones:
+            print(f"REGRESIÓN {metrica} x{proporcion:.2f}: {_formatear(resultado)}")
+        if regresiones:
+            return 1
+        print("Sin regresiones respecto a", argumentos.comparar)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
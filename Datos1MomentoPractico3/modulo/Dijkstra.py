@@ -1,6 +1,15 @@
 import heapq
+from array import array
 from collections import deque
 
+from modulo.colas_prioridad import ColaBuckets, ColaHeap, ColaIndexada, ColaRadix
+from modulo.componentes import connected_components
+from modulo.estadisticas import _fase
+from modulo.grafo_csr import GrafoCSR
+
+# Con pesos enteros hasta este valor se usa la cola de buckets de Dial; por encima, el radix heap
+_PESO_MAX_BUCKETS = 1 << 16
+
 def validar_grafo(grafo, nodo_inicio):
     """
     Valida que el grafo tenga la estructura adecuada.
@@ -36,45 +45,72 @@ def validar_grafo(grafo, nodo_inicio):
     :param nodo_inicio: int
         Un nodo de inicio en el grafo, el cual debe existir como una clave válida.
 
-    :return: None
-        La función no retorna ningún valor, pero lanza excepciones si el grafo es inválido.
+    :return: tuple
+        Una tupla `(solo_enteros, peso_max)` que indica si todos los pesos son enteros y cuál es el mayor peso
+        (0 si no hay aristas). `dijkstra` la usa para elegir la cola de prioridad.
 """
 
     if not isinstance(grafo, dict):
         raise ValueError("El grafo debe ser un diccionario.")
 
+    solo_enteros = True
+    peso_max = 0
     for origen, aristas in grafo.items():
-        if not isinstance(origen, int) or origen <= 0:
-            raise ValueError(f"Las llaves del grafo deben ser enteros positivos. Error en el nodo: {origen}")
-
-        if not isinstance(aristas, list):
-            raise ValueError(f"Las aristas de cada nodo deben estar en una lista. Error en el nodo: {origen}")
-
-        destinos_vistos = set()
-        for elemento in aristas:
-            if not isinstance(elemento, tuple) or len(elemento) != 2:
-                raise ValueError(
-                    f"Cada arista debe ser una tupla de 2 elementos (destino, peso). Error en la arista: ({origen}, {elemento})")
-            destino, peso = elemento
-            if not isinstance(destino, int) or destino <= 0:
-                raise ValueError(f"El destino debe ser un entero positivo. Error en la arista: ({origen}, {destino})")
-            if not isinstance(peso, (int, float)) or peso < 0:
-                raise ValueError(
-                    f"El peso de la arista debe ser un número no negativo. Error en la arista: ({origen}, {destino}, {peso})")
-            if destino in destinos_vistos:
-                raise ValueError(f"Existen múltiples aristas del nodo {origen} al nodo {destino}.")
-            destinos_vistos.add(destino)
+        enteros, maximo = _validar_aristas(origen, aristas)
+        solo_enteros = solo_enteros and enteros
+        peso_max = max(peso_max, maximo)
 
     if nodo_inicio not in grafo:
         raise ValueError(f"El nodo de inicio {nodo_inicio} debe ser una llave válida en el grafo.")
 
+    return solo_enteros, peso_max
+
+
+def _validar_aristas(origen, aristas):
+    """
+    Valida la llave `origen` y su lista de aristas con las reglas de `validar_grafo`. Retorna `(solo_enteros,
+    peso_max)` de esa lista.
+    """
+    if not isinstance(origen, int) or origen <= 0:
+        raise ValueError(f"Las llaves del grafo deben ser enteros positivos. Error en el nodo: {origen}")
+
+    if not isinstance(aristas, list):
+        raise ValueError(f"Las aristas de cada nodo deben estar en una lista. Error en el nodo: {origen}")
+
+    solo_enteros = True
+    peso_max = 0
+    destinos_vistos = set()
+    for elemento in aristas:
+        if not isinstance(elemento, tuple) or len(elemento) != 2:
+            raise ValueError(
+                f"Cada arista debe ser una tupla de 2 elementos (destino, peso). Error en la arista: ({origen}, {elemento})")
+        destino, peso = elemento
+        if not isinstance(destino, int) or destino <= 0:
+            raise ValueError(f"El destino debe ser un entero positivo. Error en la arista: ({origen}, {destino})")
+        if not isinstance(peso, (int, float)) or peso < 0:
+            raise ValueError(
+                f"El peso de la arista debe ser un número no negativo. Error en la arista: ({origen}, {destino}, {peso})")
+        if destino in destinos_vistos:
+            raise ValueError(f"Existen múltiples aristas del nodo {origen} al nodo {destino}.")
+        destinos_vistos.add(destino)
+        solo_enteros = solo_enteros and isinstance(peso, int)
+        if peso > peso_max:
+            peso_max = peso
+    return solo_enteros, peso_max
+
 
 def verificar_conectividad(grafo, nodo_inicio):
     """
     Verifica que el grafo sea conexo desde un nodo de inicio dado.
 
     La función utiliza una búsqueda en amplitud (BFS) para verificar la conectividad del grafo desde el nodo de inicio.
-    Si todos los nodos son alcanzables desde el nodo de inicio, se considera que el grafo es conexo.
+    Si todos los nodos son alcanzables desde el nodo de inicio, se considera que el grafo es conexo. Para un
+    `GrafoCSR` no dirigido, donde la alcanzabilidad no depende del nodo de inicio, se usa `connected_components`.
+
+    Los diccionarios y los `GrafoCSR` dirigidos siguen usando la BFS: sus aristas tienen sentido, y que todo sea
+    alcanzable desde el inicio no equivale a tener una sola componente débilmente conexa, que es lo que calcula
+    `connected_components`. Un diccionario se recorre directamente, sin convertirlo a `GrafoCSR`, porque la
+    conversión costaría lo mismo que la BFS.
 
     Condiciones Previas:
     - El parámetro `grafo` debe ser un diccionario de la forma descrita en `validar_grafo`.
@@ -88,8 +124,9 @@ def verificar_conectividad(grafo, nodo_inicio):
     Excepciones:
     - Lanza `ValueError` si el `nodo_inicio` no existe en el grafo.
 
-    :param grafo: dict
+    :param grafo: dict o GrafoCSR
         Un diccionario que representa el grafo, donde las claves son nodos y los valores son listas de aristas.
+        También se acepta un `GrafoCSR`.
     :param nodo_inicio: int
         Un nodo de inicio desde el cual se verifica la conectividad.
 
@@ -100,6 +137,13 @@ def verificar_conectividad(grafo, nodo_inicio):
     if nodo_inicio not in grafo:
         raise ValueError(f"El nodo de inicio {nodo_inicio} no existe en el grafo.")
 
+    if isinstance(grafo, GrafoCSR):
+        if not grafo.dirigido:
+            # Sin sentido en las aristas, alcanzar todo desde un nodo es tener una sola componente
+            _, tamanos = connected_components(grafo)
+            return len(tamanos) == 1
+        return _verificar_conectividad_csr(grafo, grafo.indice(nodo_inicio))
+
     # Usamos BFS (Búsqueda en amplitud) para verificar la conectividad
     visitados = set()
     cola = deque([nodo_inicio])  # Cola para BFS (búsqueda en amplitud)
@@ -116,7 +160,7 @@ def verificar_conectividad(grafo, nodo_inicio):
     return len(visitados) == len(grafo)
 
 
-def dijkstra(grafo, nodo_inicio):
+def dijkstra(grafo, nodo_inicio, cola="auto", max_distance=None, k_nearest=None, targets=None, estadisticas=None):
     """
     Calcula las distancias más cortas desde el nodo nodo_inicio a todos los demás nodos del grafo utilizando el
     algoritmo de Dijkstra.
@@ -136,44 +180,482 @@ def dijkstra(grafo, nodo_inicio):
 
     Excepciones:
     - Lanza `ValueError` si el grafo es disconexo, es decir, si no todos los nodos son alcanzables desde el nodo de inicio.
-
-    :param grafo: dict
+    - Lanza `ValueError` si la cola pedida no existe o no admite los pesos del grafo.
+    - Lanza `ValueError` si los límites de búsqueda no son válidos o si algún nodo de `targets` no existe.
+
+    Búsqueda acotada:
+    Si se da `max_distance`, `k_nearest` o `targets`, la búsqueda se detiene en cuanto se cumple el límite y solo
+    retorna los nodos asentados hasta ese momento, en orden de distancia. En este modo el grafo no tiene que ser
+    conexo, y el costo depende de la región explorada y no del tamaño del grafo: las distancias se guardan en un
+    diccionario que solo contiene los nodos alcanzados, y en un grafo de diccionario solo se validan las listas
+    de aristas de los nodos que se asientan (las colas "buckets" y "radix" sí requieren validar todo el grafo,
+    pues dependen de los pesos). Con "auto" se usa "radix" sobre un `GrafoCSR` de pesos enteros y "heap" en los
+    demás casos.
+
+    :param grafo: dict o GrafoCSR
         Un diccionario que representa el grafo, donde las claves son nodos y los valores son listas de tuplas `(destino, peso)`.
+        También se acepta un `GrafoCSR` ponderado, que ya fue validado al construirse y no se vuelve a validar. Para
+        muchas consultas sobre el mismo grafo conviene preparar una vez `GrafoCSR.desde_ponderado(grafo).congelar()`.
     :param nodo_inicio: int
         El nodo desde el cual se calcularán las distancias más cortas.
+    :param cola: str
+        Cola de prioridad a usar:
+        - "heap": `heapq` con entradas `(distancia, nodo)`.
+        - "buckets": cola de buckets de Dial; solo pesos enteros, y reserva un bucket por cada valor de 0 al peso máximo.
+        - "radix": radix heap; solo pesos enteros.
+        - "indexada": heap indexado con disminución de clave, sin entradas obsoletas.
+        - "auto" (por defecto): "buckets" si todos los pesos son enteros y no mayores que `_PESO_MAX_BUCKETS`,
+          "radix" si son enteros mayores, y "heap" si hay pesos flotantes.
+    :param max_distance: int o float, opcional
+        Solo se asientan los nodos a distancia menor o igual que este valor.
+    :param k_nearest: int, opcional
+        Se detiene tras asentar los `k_nearest` nodos más cercanos (incluido el de inicio), o los `k_nearest`
+        nodos de `targets` más cercanos si se da `targets`.
+    :param targets: iterable, opcional
+        Nodos de interés: se detiene al asentarlos todos y el resultado solo contiene nodos de este conjunto.
+    :param estadisticas: Estadisticas, opcional
+        Si se da, registra el tiempo de las fases "validacion" y "busqueda" (en la búsqueda acotada sobre un
+        diccionario, la validación perezosa de cada lista de aristas queda dentro de "busqueda") y los contadores
+        "inserciones" y "extracciones" de la cola, "extracciones_obsoletas" (entradas de nodos ya asentados),
+        "relajaciones" (aristas que mejoraron una distancia), "nodos_asentados" y "aristas_revisadas".
 
     :return: dict
         Un diccionario donde las claves son los nodos alcanzables desde el nodo de inicio y los valores son las distancias más cortas a esos nodos.
+        En la búsqueda acotada, solo los nodos asentados que cumplen los límites.
 """
 
+    if max_distance is not None or k_nearest is not None or targets is not None:
+        return _dijkstra_acotado(grafo, nodo_inicio, cola, max_distance, k_nearest, targets, estadisticas)
+
+    if isinstance(grafo, GrafoCSR):
+        return _dijkstra_csr(grafo, nodo_inicio, cola, estadisticas)
+
     # Validaciones
-    validar_grafo(grafo, nodo_inicio)
-    if not verificar_conectividad(grafo, nodo_inicio):
-        raise ValueError("El grafo es disconexo; no todos los nodos son alcanzables desde el nodo de inicio.")
+    with _fase(estadisticas, "validacion"):
+        solo_enteros, peso_max = validar_grafo(grafo, nodo_inicio)
 
     # Inicialización de distancias y cola de prioridad
     distancias = {nodo: float('inf') for nodo in grafo}  # Inicialización con 'inf' para todos los nodos
     distancias[nodo_inicio] = 0  # Distancia al nodo de inicio es 0
-    cola_prioridad = [(0, nodo_inicio)]  # Cola de prioridad con el nodo de inicio
+    cola_prioridad = _crear_cola(cola, solo_enteros, peso_max)
+    if estadisticas is not None:
+        cola_prioridad = _ColaContada(cola_prioridad)
+    insertar, extraer = cola_prioridad.insertar, cola_prioridad.extraer
+    insertar(0, nodo_inicio)  # Cola de prioridad con el nodo de inicio
     visitados = set()
 
-    # Dijkstra con optimización (usando heap para cola de prioridad)
-    while cola_prioridad:
-        distancia_actual, nodo_actual = heapq.heappop(cola_prioridad)
+    # Dijkstra con cola de prioridad (ver `_crear_cola`)
+    with _fase(estadisticas, "busqueda"):
+        while cola_prioridad:
+            distancia_actual, nodo_actual = extraer()
 
-        # Si el nodo ya fue visitado con una distancia más corta, continuamos
-        if nodo_actual in visitados:
-            continue
+            # Si el nodo ya fue visitado con una distancia más corta, continuamos
+            if nodo_actual in visitados:
+                continue
+
+            visitados.add(nodo_actual)
+
+            for destino, peso in grafo[nodo_actual]:
+                # Relajar las aristas
+                distancia_nueva = distancia_actual + peso
+                if distancia_nueva < distancias[destino]:
+                    distancias[destino] = distancia_nueva
+                    insertar(distancia_nueva, destino)
+
+    if estadisticas is not None:
+        _registrar_busqueda(estadisticas, cola_prioridad, len(visitados),
+                            sum(len(grafo[nodo]) for nodo in visitados))
+
+    # La conectividad se verifica con la misma búsqueda: si algún nodo no se asentó, no era alcanzable
+    if len(visitados) != len(grafo):
+        raise ValueError("El grafo es disconexo; no todos los nodos son alcanzables desde el nodo de inicio.")
+
+    return distancias
+
+
+def _verificar_conectividad_csr(grafo, inicio):
+    """BFS de `verificar_conectividad` sobre los índices de un `GrafoCSR`."""
+    offsets, destinos = grafo.offsets, grafo.destinos
+    visitados = bytearray(len(grafo))
+    visitados[inicio] = 1
+    cola = deque([inicio])
+    total = 1
+
+    while cola:
+        nodo = cola.popleft()
+        for k in range(offsets[nodo], offsets[nodo + 1]):
+            vecino = destinos[k]
+            if not visitados[vecino]:
+                visitados[vecino] = 1
+                total += 1
+                cola.append(vecino)
+
+    return total == len(grafo)
+
+
+def _dijkstra_acotado(grafo, nodo_inicio, cola, max_distance, k_nearest, targets, estadisticas=None):
+    """
+    Dijkstra con límites de distancia, de número de nodos o de nodos objetivo (ver `dijkstra`). Las distancias y
+    los visitados son diccionarios, así que solo ocupan memoria los nodos alcanzados.
+    """
+    with _fase(estadisticas, "validacion"):
+        if max_distance is not None and (not isinstance(max_distance, (int, float)) or max_distance < 0):
+            raise ValueError("La distancia máxima debe ser un número no negativo.")
+        if k_nearest is not None and (not isinstance(k_nearest, int) or k_nearest <= 0):
+            raise ValueError("El número de nodos más cercanos debe ser un entero positivo.")
+        infinito = float('inf')
+        if max_distance is None:
+            max_distance = infinito
+
+        if isinstance(grafo, GrafoCSR):
+            if grafo.pesos is None:
+                raise ValueError("El grafo debe ser ponderado.")
+            if nodo_inicio not in grafo:
+                raise ValueError(f"El nodo de inicio {nodo_inicio} debe ser una llave válida en el grafo.")
+            solo_enteros = grafo.tipo_pesos in ('q', 'Q')
+            peso_max = grafo.peso_max if solo_enteros else 0
+            if cola == "auto":
+                cola = "radix" if solo_enteros else "heap"
+            offsets, destinos, pesos, indice = grafo.offsets, grafo.destinos, grafo.pesos, grafo.indices
+            inicio = indice[nodo_inicio]
+            vecinos = lambda i: zip(destinos[offsets[i]:offsets[i + 1]], pesos[offsets[i]:offsets[i + 1]])
+            ids = grafo.ids
+        else:
+            if not isinstance(grafo, dict):
+                raise ValueError("El grafo debe ser un diccionario.")
+            if nodo_inicio not in grafo:
+                raise ValueError(f"El nodo de inicio {nodo_inicio} debe ser una llave válida en el grafo.")
+            if cola in ("buckets", "radix"):
+                solo_enteros, peso_max = validar_grafo(grafo, nodo_inicio)
+                vecinos = lambda nodo: grafo.get(nodo, [])
+            else:
+                solo_enteros, peso_max = False, 0
+                if cola == "auto":
+                    cola = "heap"
+
+                def vecinos(nodo):
+                    # Cada nodo se asienta una sola vez, así que cada lista se valida una sola vez
+                    aristas = grafo.get(nodo, [])
+                    _validar_aristas(nodo, aristas)
+                    return aristas
+            inicio = nodo_inicio
+            ids = indice = None
+
+        # Nodos objetivo, como índices del grafo
+        objetivos = None
+        if targets is not None:
+            objetivos = set()
+            for nodo in targets:
+                if nodo not in grafo:
+                    raise ValueError(f"El nodo {nodo} no existe en el grafo.")
+                objetivos.add(indice[nodo] if ids is not None else nodo)
+            k_nearest = len(objetivos) if k_nearest is None else min(k_nearest, len(objetivos))
+
+    distancias = {inicio: 0}
+    visitados = set()
+    resultado = {}
+    cola_prioridad = _crear_cola(cola, solo_enteros, peso_max)
+    if estadisticas is not None:
+        cola_prioridad = _ColaContada(cola_prioridad)
+    insertar, extraer = cola_prioridad.insertar, cola_prioridad.extraer
+    insertar(0, inicio)
+
+    fuera_del_radio = 1  # La extracción que cortó la búsqueda por distancia no es obsoleta
+    with _fase(estadisticas, "busqueda"):
+        while cola_prioridad and (k_nearest is None or len(resultado) < k_nearest):
+            distancia_actual, nodo_actual = extraer()
+            if nodo_actual in visitados:
+                continue
+            # Las distancias salen en orden creciente: ningún nodo pendiente está dentro del radio
+            if distancia_actual > max_distance:
+                break
+            visitados.add(nodo_actual)
+            if objetivos is None or nodo_actual in objetivos:
+                resultado[nodo_actual] = distancia_actual
+
+            for destino, peso in vecinos(nodo_actual):
+                distancia_nueva = distancia_actual + peso
+                if distancia_nueva < distancias.get(destino, infinito):
+                    distancias[destino] = distancia_nueva
+                    insertar(distancia_nueva, destino)
+        else:
+            fuera_del_radio = 0
+
+    if estadisticas is not None:
+        if ids is not None:
+            revisadas = sum(offsets[nodo + 1] - offsets[nodo] for nodo in visitados)
+        else:
+            revisadas = sum(len(grafo.get(nodo, [])) for nodo in visitados)
+        _registrar_busqueda(estadisticas, cola_prioridad, len(visitados), revisadas, fuera_del_radio)
+
+    if ids is not None:
+        return {ids[nodo]: distancia for nodo, distancia in resultado.items()}
+    return resultado
+
+
+def _crear_cola(cola, solo_enteros, peso_max):
+    """Crea la cola de prioridad pedida para `dijkstra`, o la elige según los pesos si es "auto"."""
+    if cola == "auto":
+        if not solo_enteros:
+            cola = "heap"
+        elif peso_max <= _PESO_MAX_BUCKETS:
+            cola = "buckets"
+        else:
+            cola = "radix"
+
+    if cola == "heap":
+        return ColaHeap()
+    if cola == "indexada":
+        return ColaIndexada()
+    if cola in ("buckets", "radix"):
+        if not solo_enteros:
+            raise ValueError(f"La cola \"{cola}\" solo admite pesos enteros.")
+        return ColaBuckets(peso_max) if cola == "buckets" else ColaRadix()
+    raise ValueError("La cola debe ser \"auto\", \"heap\", \"buckets\", \"radix\" o \"indexada\".")
+
+
+class _ColaContada:
+    """
+    Envuelve una cola de `colas_prioridad` y cuenta sus inserciones y extracciones. Solo se usa cuando se piden
+    estadísticas, así que la búsqueda normal llama directamente a los métodos de la cola.
+    """
+
+    def __init__(self, cola):
+        self.cola = cola
+        self.inserciones = 0
+        self.extracciones = 0
+
+    def __len__(self):
+        return len(self.cola)
+
+    def insertar(self, prioridad, nodo):
+        self.inserciones += 1
+        self.cola.insertar(prioridad, nodo)
 
-        visitados.add(nodo_actual)
+    def extraer(self):
+        self.extracciones += 1
+        return self.cola.extraer()
 
-        for destino, peso in grafo[nodo_actual]:
-            # Relajar las aristas
-            distancia_nueva = distancia_actual + peso
+
+def _registrar_busqueda(estadisticas, cola_contada, asentados, aristas_revisadas, descartadas=0):
+    """
+    Registra los contadores de una búsqueda de Dijkstra. Cada relajación exitosa inserta una entrada en la cola
+    (además de la del nodo de inicio) y cada extracción asienta un nodo, descarta una entrada obsoleta o, si se
+    da `descartadas`, corta la búsqueda.
+    """
+    estadisticas.sumar("inserciones", cola_contada.inserciones)
+    estadisticas.sumar("extracciones", cola_contada.extracciones)
+    estadisticas.sumar("extracciones_obsoletas", cola_contada.extracciones - asentados - descartadas)
+    estadisticas.sumar("relajaciones", cola_contada.inserciones - 1)
+    estadisticas.sumar("nodos_asentados", asentados)
+    estadisticas.sumar("aristas_revisadas", aristas_revisadas)
+
+
+def _dijkstra_csr(grafo, nodo_inicio, cola="auto", estadisticas=None):
+    """
+    Dijkstra sobre los índices de un `GrafoCSR`. Las distancias se guardan en una lista indexada por nodo y los
+    visitados en un bytearray; el resultado se traduce a los identificadores originales. El grafo ya fue validado
+    al construirse, así que no hay ninguna pasada previa a la búsqueda.
+    """
+    with _fase(estadisticas, "validacion"):
+        if grafo.pesos is None:
+            raise ValueError("El grafo debe ser ponderado.")
+        if nodo_inicio not in grafo:
+            raise ValueError(f"El nodo de inicio {nodo_inicio} debe ser una llave válida en el grafo.")
+        inicio = grafo.indice(nodo_inicio)
+        solo_enteros = grafo.tipo_pesos in ('q', 'Q')
+        # El peso máximo (calculado al construir el grafo) dimensiona los buckets
+        peso_max = grafo.peso_max if solo_enteros else 0
+
+    cola_prioridad = _crear_cola(cola, solo_enteros, peso_max)
+    if estadisticas is not None:
+        cola_prioridad = _ColaContada(cola_prioridad)
+    with _fase(estadisticas, "busqueda"):
+        distancias, asentados = _distancias_csr(grafo.offsets, grafo.destinos, grafo.pesos, inicio, cola_prioridad)
+
+    if estadisticas is not None:
+        offsets, infinito = grafo.offsets, float('inf')
+        revisadas = sum(offsets[i + 1] - offsets[i] for i, distancia in enumerate(distancias) if distancia != infinito)
+        _registrar_busqueda(estadisticas, cola_prioridad, asentados, revisadas)
+    if asentados != len(grafo):
+        raise ValueError("El grafo es disconexo; no todos los nodos son alcanzables desde el nodo de inicio.")
+
+    return dict(zip(grafo.ids, distancias))
+
+
+def _distancias_csr(offsets, destinos, pesos, inicio, cola_prioridad):
+    """
+    Núcleo de Dijkstra sobre arreglos CSR (o vistas de memoria con la misma forma) y una cola vacía de
+    `colas_prioridad`. Retorna la lista de distancias por índice (`inf` si el nodo no es alcanzable) y el número
+    de nodos asentados.
+    """
+    n = len(offsets) - 1
+    infinito = float('inf')
+    distancias = [infinito] * n
+    distancias[inicio] = 0
+    visitados = bytearray(n)
+    asentados = 0
+    insertar, extraer = cola_prioridad.insertar, cola_prioridad.extraer
+    insertar(0, inicio)
+
+    while cola_prioridad:
+        distancia_actual, nodo_actual = extraer()
+        if visitados[nodo_actual]:
+            continue
+        visitados[nodo_actual] = 1
+        asentados += 1
+
+        for k in range(offsets[nodo_actual], offsets[nodo_actual + 1]):
+            destino = destinos[k]
+            distancia_nueva = distancia_actual + pesos[k]
             if distancia_nueva < distancias[destino]:
                 distancias[destino] = distancia_nueva
-                heapq.heappush(cola_prioridad, (distancia_nueva, destino))
+                insertar(distancia_nueva, destino)
+
+    return distancias, asentados
+
+
+def shortest_path(grafo, origen, destino, bidireccional=False):
+    """
+    Calcula el camino más corto entre dos nodos del grafo.
+
+    A diferencia de `dijkstra`, la búsqueda se detiene en cuanto se asienta el nodo `destino`, así que solo explora
+    los nodos más cercanos al origen que el destino. Los predecesores se guardan en un arreglo compacto indexado
+    por nodo y el camino se reconstruye al final. En modo bidireccional se avanza a la vez desde el origen (sobre
+    el grafo) y desde el destino (sobre el grafo transpuesto), lo que suele explorar muchos menos nodos.
+
+    Condiciones Previas:
+    - `grafo` debe ser un diccionario de la forma descrita en `validar_grafo`, o un `GrafoCSR` ponderado.
+    - `origen` y `destino` deben ser nodos del grafo.
+
+    Condiciones Posteriores:
+    - Retorna la distancia mínima y la lista de nodos del camino, empezando en `origen` y terminando en `destino`.
+    - No exige que el grafo sea conexo: basta con que exista un camino entre ambos nodos.
+
+    Excepciones:
+    - Lanza `ValueError` si el grafo no es válido, si alguno de los nodos no existe o si no hay camino entre ellos.
+
+    :param grafo: dict o GrafoCSR
+        El grafo sobre el que se busca. Un diccionario se valida y se convierte a `GrafoCSR` en cada llamada; para
+        muchas consultas sobre el mismo grafo conviene construir el `GrafoCSR` una sola vez.
+    :param origen: int
+        Nodo de partida.
+    :param destino: int
+        Nodo de llegada.
+    :param bidireccional: bool
+        Si es True, usa la búsqueda bidireccional.
+
+    :return: tuple
+        Una tupla `(distancia, camino)`.
+"""
+    if not isinstance(grafo, GrafoCSR):
+        grafo = GrafoCSR.desde_ponderado(grafo)
+    if grafo.pesos is None:
+        raise ValueError("El grafo debe ser ponderado.")
+    for nodo in (origen, destino):
+        if nodo not in grafo:
+            raise ValueError(f"El nodo {nodo} no existe en el grafo.")
+
+    s, t = grafo.indice(origen), grafo.indice(destino)
+    if bidireccional:
+        distancia, camino = _camino_bidireccional(grafo, s, t)
+    else:
+        distancia, camino = _camino_unidireccional(grafo, s, t)
+
+    if camino is None:
+        raise ValueError(f"No existe un camino del nodo {origen} al nodo {destino}.")
+    return distancia, grafo.tabla.ids_de(camino)
+
+
+def _reconstruir_camino(predecesores, s, t):
+    """Sigue el arreglo de predecesores desde `t` hasta `s` y retorna el camino en orden."""
+    camino = [t]
+    while t != s:
+        t = predecesores[t]
+        camino.append(t)
+    camino.reverse()
+    return camino
+
+
+def _camino_unidireccional(grafo, s, t):
+    """Dijkstra desde `s` que termina al asentar `t`. Retorna `(distancia, camino)` o `(inf, None)`."""
+    offsets, destinos, pesos = grafo.offsets, grafo.destinos, grafo.pesos
+    infinito = float('inf')
+    n = len(grafo)
+    distancias = [infinito] * n
+    predecesores = array('q', [-1]) * n
+    visitados = bytearray(n)
+    distancias[s] = 0
+    cola_prioridad = [(0, s)]
+
+    while cola_prioridad:
+        distancia_actual, nodo_actual = heapq.heappop(cola_prioridad)
+        if visitados[nodo_actual]:
+            continue
+        if nodo_actual == t:
+            return distancia_actual, _reconstruir_camino(predecesores, s, t)
+        visitados[nodo_actual] = 1
+
+        for k in range(offsets[nodo_actual], offsets[nodo_actual + 1]):
+            vecino = destinos[k]
+            distancia_nueva = distancia_actual + pesos[k]
+            if distancia_nueva < distancias[vecino]:
+                distancias[vecino] = distancia_nueva
+                predecesores[vecino] = nodo_actual
+                heapq.heappush(cola_prioridad, (distancia_nueva, vecino))
+
+    return infinito, None
 
-    # Filtramos los nodos inalcanzables (con distancia infinita)
-    return {nodo: dist for nodo, dist in distancias.items() if dist < float('inf')}
 
+def _camino_bidireccional(grafo, s, t):
+    """
+    Dijkstra bidireccional: alterna una búsqueda hacia adelante desde `s` y otra hacia atrás desde `t` (sobre el
+    transpuesto), siempre avanzando la de menor tope. `mejor` guarda el camino más corto encontrado que une
+    ambas búsquedas; se termina cuando la suma de los topes ya no puede mejorarlo.
+    """
+    if s == t:
+        return 0, [s]
+
+    infinito = float('inf')
+    n = len(grafo)
+    lados = []
+    for g, inicio in ((grafo, s), (grafo.transpuesto(), t)):
+        distancias = [infinito] * n
+        distancias[inicio] = 0
+        lados.append((g.offsets, g.destinos, g.pesos, distancias, array('q', [-1]) * n, bytearray(n), [(0, inicio)]))
+
+    mejor, encuentro = infinito, None
+    while lados[0][6] and lados[1][6]:
+        if lados[0][6][0][0] + lados[1][6][0][0] >= mejor:
+            break
+        # Avanzamos el lado cuyo heap tiene el menor tope
+        lado = 0 if lados[0][6][0][0] <= lados[1][6][0][0] else 1
+        offsets, destinos, pesos, distancias, predecesores, visitados, cola_prioridad = lados[lado]
+        distancias_otro = lados[1 - lado][3]
+
+        distancia_actual, nodo_actual = heapq.heappop(cola_prioridad)
+        if visitados[nodo_actual]:
+            continue
+        visitados[nodo_actual] = 1
+
+        for k in range(offsets[nodo_actual], offsets[nodo_actual + 1]):
+            vecino = destinos[k]
+            distancia_nueva = distancia_actual + pesos[k]
+            if distancia_nueva < distancias[vecino]:
+                distancias[vecino] = distancia_nueva
+                predecesores[vecino] = nodo_actual
+                heapq.heappush(cola_prioridad, (distancia_nueva, vecino))
+            # Camino completo que pasa por la arista (nodo_actual, vecino)
+            total = distancia_nueva + distancias_otro[vecino]
+            if total < mejor:
+                mejor = total
+                encuentro = (nodo_actual, vecino) if lado == 0 else (vecino, nodo_actual)
+
+    if encuentro is None:
+        return infinito, None
+
+    u, v = encuentro
+    adelante = _reconstruir_camino(lados[0][4], s, u)
+    atras = _reconstruir_camino(lados[1][4], t, v)
+    atras.reverse()
+    return mejor, adelante + atras
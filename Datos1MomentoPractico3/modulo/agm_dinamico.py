@@ -0,0 +1,134 @@
+from collections import deque
+
+from modulo.kruskal import kruskal, validar_arista
+
+
+class AGMDinamico:
+    """
+    Mantiene un Árbol Generador Mínimo bajo inserciones de aristas y disminuciones de peso, sin recalcularlo.
+
+    Al insertar la arista (u, v, peso) entre dos nodos del mismo árbol se forma exactamente un ciclo: el camino
+    de u a v dentro del árbol más la arista nueva. Si la arista más pesada de ese camino pesa más que la nueva,
+    se reemplaza; si no, el árbol no cambia. Cada actualización cuesta un recorrido del árbol (O(n)), en lugar de
+    las O(m log m) operaciones de volver a ejecutar `kruskal` sobre todas las aristas.
+
+    Solo se guardan las aristas del árbol, no las del grafo completo.
+
+    :param aristas: Lista de tuplas (Nodo1, Nodo2, Peso) de un Árbol Generador Mínimo, como la que retorna
+        `kruskal`.
+
+    Condiciones Previas:
+    - `aristas` debe formar un árbol (o bosque) generador mínimo del grafo de interés.
+
+    Condiciones Posteriores:
+    - `aristas` y `peso_total` reflejan siempre el árbol mínimo del grafo con todas las actualizaciones aplicadas.
+      Si una arista une dos nodos que no estaban conectados (por ejemplo, un nodo nuevo), simplemente se agrega.
+    """
+
+    def __init__(self, aristas=()):
+        self.adyacencia = {}  # nodo -> {vecino: peso}
+        self.peso_total = 0
+        for arista in aristas:
+            nodo1, nodo2, peso = validar_arista(arista)
+            self._agregar(nodo1, nodo2, peso)
+
+    @classmethod
+    def desde_grafo(cls, grafo):
+        """Construye el árbol inicial ejecutando `kruskal` sobre `grafo`."""
+        return cls(kruskal(grafo))
+
+    def __len__(self):
+        return len(self.adyacencia)
+
+    @property
+    def aristas(self):
+        """Lista de tuplas (Nodo1, Nodo2, Peso) del árbol actual, con Nodo1 < Nodo2."""
+        return [(nodo, vecino, peso)
+                for nodo, vecinos in self.adyacencia.items()
+                for vecino, peso in vecinos.items() if nodo < vecino]
+
+    def insertar_arista(self, nodo1, nodo2, peso):
+        """
+        Inserta la arista (nodo1, nodo2, peso) en el grafo y actualiza el árbol.
+
+        :return: True si el árbol cambió, False si la arista no forma parte del nuevo árbol mínimo.
+
+        Lanza:
+        - ValueError si la arista no cumple las condiciones de `kruskal`.
+        """
+        validar_arista((nodo1, nodo2, peso))
+        if nodo1 == nodo2:
+            return False
+
+        camino = self._camino(nodo1, nodo2)
+        if camino is None:
+            # Los nodos estaban en árboles distintos (o alguno es nuevo): la arista los une
+            self._agregar(nodo1, nodo2, peso)
+            return True
+
+        # Arista más pesada del ciclo que cerraría la arista nueva
+        a, b = max(zip(camino, camino[1:]), key=lambda par: self.adyacencia[par[0]][par[1]])
+        if self.adyacencia[a][b] <= peso:
+            return False
+        self._quitar(a, b)
+        self._agregar(nodo1, nodo2, peso)
+        return True
+
+    def disminuir_peso(self, nodo1, nodo2, peso):
+        """
+        Disminuye a `peso` el peso de la arista (nodo1, nodo2) y actualiza el árbol.
+
+        Si la arista está en el árbol, el árbol sigue siendo mínimo y solo cambia su peso. Si no está, equivale a
+        insertarla con el nuevo peso.
+
+        :return: True si el árbol cambió (incluido un cambio de peso), False si no.
+
+        Lanza:
+        - ValueError si la arista está en el árbol y el nuevo peso es mayor que el actual, o si la arista no cumple
+          las condiciones de `kruskal`.
+        """
+        validar_arista((nodo1, nodo2, peso))
+        actual = self.adyacencia.get(nodo1, {}).get(nodo2)
+        if actual is None:
+            return self.insertar_arista(nodo1, nodo2, peso)
+        if peso > actual:
+            raise ValueError("Solo se permiten disminuciones de peso en las aristas del árbol.")
+        self.adyacencia[nodo1][nodo2] = self.adyacencia[nodo2][nodo1] = peso
+        self.peso_total -= actual - peso
+        return peso != actual
+
+    def _agregar(self, nodo1, nodo2, peso):
+        self.adyacencia.setdefault(nodo1, {})[nodo2] = peso
+        self.adyacencia.setdefault(nodo2, {})[nodo1] = peso
+        self.peso_total += peso
+
+    def _quitar(self, nodo1, nodo2):
+        peso = self.adyacencia[nodo1].pop(nodo2)
+        del self.adyacencia[nodo2][nodo1]
+        self.peso_total -= peso
+
+    def _camino(self, origen, destino):
+        """Retorna la lista de nodos del camino de origen a destino dentro del árbol, o None si no existe."""
+        if origen not in self.adyacencia or destino not in self.adyacencia:
+            return None
+
+        # BFS desde el origen guardando el padre de cada nodo alcanzado
+        padres = {origen: None}
+        cola = deque([origen])
+        while cola:
+            nodo = cola.popleft()
+            if nodo == destino:
+                break
+            for vecino in self.adyacencia[nodo]:
+                if vecino not in padres:
+                    padres[vecino] = nodo
+                    cola.append(vecino)
+        else:
+            return None
+
+        camino = []
+        nodo = destino
+        while nodo is not None:
+            camino.append(nodo)
+            nodo = padres[nodo]
+        return camino
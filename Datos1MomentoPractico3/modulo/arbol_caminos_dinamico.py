@@ -0,0 +1,192 @@
+import heapq
+
+from modulo.Dijkstra import dijkstra, validar_grafo
+
+
+class ArbolCaminosDinamico:
+    """
+    Mantiene las distancias más cortas desde un origen fijo bajo inserciones, eliminaciones y cambios de peso de
+    aristas, reparando solo la región afectada en lugar de volver a ejecutar `dijkstra`.
+
+    Se guarda el árbol de caminos más cortos (padre e hijos de cada nodo). Una disminución de peso, o una arista
+    nueva, solo puede acortar caminos: se propaga con Dijkstra a partir del nodo mejorado y se detiene donde las
+    distancias ya no cambian. Un aumento, o una eliminación, solo afecta si la arista está en el árbol: en ese caso
+    se invalida el subárbol que cuelga de ella, cada uno de sus nodos toma la mejor arista entrante desde fuera del
+    subárbol y un Dijkstra restringido al subárbol completa las distancias. En ambos casos el costo es proporcional
+    a los nodos cuya distancia o padre cambia y a sus aristas, no al tamaño del grafo.
+
+    :param grafo: Diccionario de la forma descrita en `validar_grafo`, como el que recibe `dijkstra`.
+    :param origen: Nodo de origen.
+
+    Condiciones Previas:
+    - `grafo` debe cumplir las reglas de `validar_grafo` y `origen` debe ser una de sus llaves. El grafo no tiene
+      que ser conexo: los nodos no alcanzables desde el origen empiezan con distancia `inf`.
+
+    Condiciones Posteriores:
+    - `distancia(nodo)` es siempre la distancia exacta del grafo con todas las actualizaciones aplicadas, o `inf`
+      si el nodo dejó de ser alcanzable. El grafo recibido no se modifica.
+    """
+
+    def __init__(self, grafo, origen):
+        # Se valida todo el grafo, porque la parte no alcanzable puede volverse alcanzable con una actualización.
+        # La búsqueda acotada sin límite de distancia no exige que el grafo sea conexo
+        validar_grafo(grafo, origen)
+        self.origen = origen
+        self.salientes = {nodo: dict(aristas) for nodo, aristas in grafo.items()}  # nodo -> {destino: peso}
+        # Un destino puede no ser llave del diccionario (un nodo sin aristas salientes): se agrega como en
+        # `insertar_arista`
+        for aristas in grafo.values():
+            for destino, _ in aristas:
+                self.salientes.setdefault(destino, {})
+        self.entrantes = {nodo: {} for nodo in self.salientes}  # nodo -> {origen: peso}
+        for nodo, aristas in self.salientes.items():
+            for destino, peso in aristas.items():
+                self.entrantes[destino][nodo] = peso
+
+        distancias = {nodo: float('inf') for nodo in self.salientes}
+        distancias.update(dijkstra(grafo, origen, max_distance=float('inf')))
+        self.distancias = distancias
+        self.padres = {nodo: None for nodo in self.salientes}  # None en el origen y en los nodos no alcanzables
+        self.hijos = {nodo: set() for nodo in self.salientes}
+        # El árbol se arma recorriendo desde el origen las aristas que realizan la distancia de su destino; recorrer
+        # (y no elegir cualquier predecesor) evita ciclos cuando hay aristas de peso 0
+        en_arbol = {origen}
+        pendientes = [origen]
+        while pendientes:
+            nodo = pendientes.pop()
+            for destino, peso in self.salientes[nodo].items():
+                if destino not in en_arbol and distancias[nodo] + peso == distancias[destino]:
+                    en_arbol.add(destino)
+                    self.padres[destino] = nodo
+                    self.hijos[nodo].add(destino)
+                    pendientes.append(destino)
+
+    def __len__(self):
+        return len(self.salientes)
+
+    def distancia(self, nodo):
+        """Retorna la distancia más corta del origen a `nodo` (`inf` si no es alcanzable)."""
+        if nodo not in self.distancias:
+            raise ValueError(f"El nodo {nodo} no existe en el grafo.")
+        return self.distancias[nodo]
+
+    def camino(self, nodo):
+        """Retorna la lista de nodos del camino más corto del origen a `nodo`, o None si no es alcanzable."""
+        if self.distancia(nodo) == float('inf'):
+            return None
+        camino = []
+        while nodo is not None:
+            camino.append(nodo)
+            nodo = self.padres[nodo]
+        camino.reverse()
+        return camino
+
+    def insertar_arista(self, nodo1, nodo2, peso):
+        """
+        Inserta la arista nodo1 -> nodo2 con el peso dado, o cambia su peso si ya existe. Los nodos que no existan
+        se agregan al grafo.
+
+        Lanza:
+        - ValueError si los nodos no son enteros positivos o si el peso no es un número no negativo.
+        """
+        _validar_arista(nodo1, nodo2, peso)
+        for nodo in (nodo1, nodo2):
+            if nodo not in self.salientes:
+                self.salientes[nodo], self.entrantes[nodo], self.hijos[nodo] = {}, {}, set()
+                self.distancias[nodo] = float('inf')
+                self.padres[nodo] = None
+        self.cambiar_peso(nodo1, nodo2, peso)
+
+    def eliminar_arista(self, nodo1, nodo2):
+        """
+        Elimina la arista nodo1 -> nodo2.
+
+        Lanza:
+        - ValueError si la arista no existe.
+        """
+        if nodo2 not in self.salientes.get(nodo1, {}):
+            raise ValueError(f"No existe una arista del nodo {nodo1} al nodo {nodo2}.")
+        del self.salientes[nodo1][nodo2]
+        del self.entrantes[nodo2][nodo1]
+        if self.padres[nodo2] == nodo1:
+            self._reparar_subarbol(nodo2)
+
+    def cambiar_peso(self, nodo1, nodo2, peso):
+        """
+        Cambia el peso de la arista nodo1 -> nodo2, o la inserta si no existe (entre nodos ya existentes).
+
+        Lanza:
+        - ValueError si alguno de los nodos no existe o si el peso no es un número no negativo.
+        """
+        _validar_arista(nodo1, nodo2, peso)
+        for nodo in (nodo1, nodo2):
+            if nodo not in self.salientes:
+                raise ValueError(f"El nodo {nodo} no existe en el grafo.")
+        anterior = self.salientes[nodo1].get(nodo2)
+        self.salientes[nodo1][nodo2] = self.entrantes[nodo2][nodo1] = peso
+
+        if anterior is not None and peso > anterior and self.padres[nodo2] == nodo1:
+            self._reparar_subarbol(nodo2)
+        elif self.distancias[nodo1] + peso < self.distancias[nodo2]:
+            self._asignar(nodo2, self.distancias[nodo1] + peso, nodo1)
+            self._propagar([(self.distancias[nodo2], nodo2)])
+
+    def _asignar(self, nodo, distancia, padre):
+        anterior = self.padres[nodo]
+        if anterior is not None:
+            self.hijos[anterior].discard(nodo)
+        if padre is not None:
+            self.hijos[padre].add(nodo)
+        self.padres[nodo] = padre
+        self.distancias[nodo] = distancia
+
+    def _propagar(self, cola_prioridad, region=None):
+        """
+        Dijkstra a partir de las entradas `(distancia, nodo)` de la cola, que ya tienen su distancia asignada.
+        Si se da `region`, solo se relajan aristas hacia nodos de ese conjunto.
+        """
+        heapq.heapify(cola_prioridad)
+        while cola_prioridad:
+            distancia_actual, nodo_actual = heapq.heappop(cola_prioridad)
+            if distancia_actual > self.distancias[nodo_actual]:
+                continue  # Entrada obsoleta
+            for destino, peso in self.salientes[nodo_actual].items():
+                if region is not None and destino not in region:
+                    continue
+                distancia_nueva = distancia_actual + peso
+                if distancia_nueva < self.distancias[destino]:
+                    self._asignar(destino, distancia_nueva, nodo_actual)
+                    heapq.heappush(cola_prioridad, (distancia_nueva, destino))
+
+    def _reparar_subarbol(self, raiz):
+        """Recalcula las distancias del subárbol de `raiz`, cuya arista hacia el padre se alargó o desapareció."""
+        # Nodos del subárbol: sus distancias pueden haber aumentado; las del resto del grafo no cambian
+        subarbol = {raiz}
+        pendientes = [raiz]
+        while pendientes:
+            for hijo in self.hijos[pendientes.pop()]:
+                subarbol.add(hijo)
+                pendientes.append(hijo)
+
+        infinito = float('inf')
+        for nodo in subarbol:
+            self._asignar(nodo, infinito, None)
+
+        # Cada nodo del subárbol parte de su mejor arista entrante desde fuera del subárbol
+        cola_prioridad = []
+        for nodo in subarbol:
+            for predecesor, peso in self.entrantes[nodo].items():
+                if predecesor not in subarbol and self.distancias[predecesor] + peso < self.distancias[nodo]:
+                    self._asignar(nodo, self.distancias[predecesor] + peso, predecesor)
+            if self.distancias[nodo] != infinito:
+                cola_prioridad.append((self.distancias[nodo], nodo))
+        self._propagar(cola_prioridad, subarbol)
+
+
+def _validar_arista(nodo1, nodo2, peso):
+    for nodo in (nodo1, nodo2):
+        if not isinstance(nodo, int) or nodo <= 0:
+            raise ValueError(f"Los nodos deben ser enteros positivos. Error en la arista: ({nodo1}, {nodo2})")
+    if not isinstance(peso, (int, float)) or peso < 0:
+        raise ValueError(
+            f"El peso de la arista debe ser un número no negativo. Error en la arista: ({nodo1}, {nodo2}, {peso})")
@@ -0,0 +1,185 @@
+import os
+from array import array
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+
+from modulo.grafo_csr import GrafoCSR
+from modulo.kruskal import UnionFind, validar_arista
+from modulo.tabla_ids import TablaIds
+
+# Por debajo de este número de aristas por proceso, repartir el trabajo cuesta más de lo que ahorra
+_MIN_ARISTAS_POR_PROCESO = 50000
+
+# Vistas a la memoria compartida dentro de cada proceso trabajador (ver `_iniciar_trabajador`)
+_compartido = {}
+
+
+def boruvka(grafo, procesos=None):
+    """
+    Calcula el Árbol Generador Mínimo con el algoritmo de Borůvka, repartiendo las aristas entre varios procesos.
+
+    En cada ronda, cada proceso recorre su tramo del arreglo de aristas y elige, para cada componente, la arista
+    más liviana que sale de ella. El proceso principal combina esas elecciones, une las componentes con un
+    `UnionFind` y publica las nuevas etiquetas de componente. Las aristas, pesos y etiquetas viven en memoria
+    compartida, de modo que el grafo no se copia ni se serializa por ronda.
+
+    Las aristas se comparan por `(peso, posición)`, el mismo orden total que usa `kruskal` al ordenar de forma
+    estable; con ese desempate el árbol es único, así que el resultado es exactamente el de `kruskal`.
+
+    :param grafo: Lista de tuplas (Nodo1, Nodo2, Peso) como la que recibe `kruskal`, o un `GrafoCSR` ponderado.
+    :param procesos: Número de procesos a usar; por defecto, el número de núcleos. Con 1 proceso, o con pocas
+        aristas por proceso, todo se ejecuta en el proceso actual.
+
+    :return: Lista de tuplas (Nodo1, Nodo2, Peso) del Árbol Generador Mínimo, en el mismo orden que `kruskal`.
+
+    Lanza:
+    - ValueError si el grafo no cumple las condiciones de `kruskal` (incluido que no sea conexo), si algún peso no
+      es menor que 2**63 (se guardan como enteros de 64 bits) o si el número de procesos no es positivo.
+    """
+    if procesos is None:
+        procesos = os.cpu_count() or 1
+    if procesos <= 0:
+        raise ValueError("El número de procesos debe ser un entero positivo.")
+
+    if isinstance(grafo, GrafoCSR):
+        origenes, destinos, pesos, ids = _aristas_desde_csr(grafo)
+        traducir = lambda k: (ids[origenes[k]], ids[destinos[k]], pesos[k])
+    else:
+        if not isinstance(grafo, list):
+            raise ValueError("El grafo debe ser una lista.")
+        tabla = TablaIds(tipo='Q')
+        origenes, destinos, pesos = array('q'), array('q'), array('q')
+        for arista in grafo:
+            nodo1, nodo2, peso = validar_arista(arista)
+            try:
+                origenes.append(tabla.internar(nodo1))
+                destinos.append(tabla.internar(nodo2))
+                pesos.append(peso)
+            except OverflowError:
+                raise ValueError(f"Los nodos deben ser menores que 2**64 y los pesos, menores que 2**63. Error en la "
+                                 f"arista: {arista}") from None
+        ids = tabla.ids
+        traducir = grafo.__getitem__
+
+    n = len(ids)
+    if n <= 1:
+        return []
+
+    procesos = max(1, min(procesos, len(pesos) // _MIN_ARISTAS_POR_PROCESO))
+    elegidas = _boruvka(origenes, destinos, pesos, n, procesos)
+    elegidas.sort(key=lambda k: (pesos[k], k))
+    return [traducir(k) for k in elegidas]
+
+
+def _aristas_desde_csr(grafo):
+    """Extrae los arreglos de aristas de un `GrafoCSR` (un solo sentido si no es dirigido), en orden de posición."""
+    if grafo.pesos is None:
+        raise ValueError("El grafo debe ser ponderado para obtener un Árbol Generador Mínimo.")
+    offsets, destinos_csr, pesos_csr = grafo.offsets, grafo.destinos, grafo.pesos
+    origenes, destinos, pesos = array('q'), array('q'), array(grafo.tipo_pesos)
+    for i in range(len(grafo)):
+        for k in range(offsets[i], offsets[i + 1]):
+            j = destinos_csr[k]
+            if grafo.dirigido or i < j:
+                origenes.append(i)
+                destinos.append(j)
+                pesos.append(pesos_csr[k])
+    return origenes, destinos, pesos, grafo.ids
+
+
+def _boruvka(origenes, destinos, pesos, n, procesos):
+    """Rondas de Borůvka; retorna las posiciones de las aristas elegidas."""
+    uf = UnionFind(n)
+    elegidas = []
+
+    pool = None
+    memorias = []
+    etiquetas = array('q', range(n))
+    try:
+        if procesos == 1:
+            buscar = lambda inicio, fin: _mejores_aristas(origenes, destinos, pesos, etiquetas, inicio, fin)
+            tramos = [(0, len(pesos))]
+        else:
+            arreglos = (origenes, destinos, pesos, etiquetas)
+            memorias = [_compartir(arreglo) for arreglo in arreglos]
+            descriptores = tuple((memoria.name, arreglo.typecode) for memoria, arreglo in zip(memorias, arreglos))
+            # Las etiquetas las escribe el proceso principal directamente en la memoria compartida
+            etiquetas = memorias[3].buf.cast('q')
+            pool = get_context().Pool(procesos, initializer=_iniciar_trabajador, initargs=descriptores)
+            tamano = -(-len(pesos) // procesos)
+            tramos = [(inicio, min(inicio + tamano, len(pesos))) for inicio in range(0, len(pesos), tamano)]
+
+        while uf.components > 1:
+            if pool is None:
+                parciales = [buscar(inicio, fin) for inicio, fin in tramos]
+            else:
+                parciales = pool.starmap(_mejores_aristas_trabajador, tramos)
+
+            # Combinamos las elecciones de cada tramo: la menor (peso, posición) por componente
+            mejores = {}
+            for parcial in parciales:
+                for componente, k in parcial.items():
+                    actual = mejores.get(componente)
+                    if actual is None or (pesos[k], k) < (pesos[actual], actual):
+                        mejores[componente] = k
+            if not mejores:
+                raise ValueError("El grafo no es conexo, no se puede obtener un Árbol Generador Mínimo.")
+
+            # Una misma arista puede ser la mejor de sus dos componentes; se agrega una sola vez
+            for k in sorted(set(mejores.values())):
+                if uf.union(origenes[k], destinos[k]):
+                    elegidas.append(k)
+
+            raices = uf.find_many(range(n))
+            for i in range(n):
+                etiquetas[i] = raices[i]
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        if isinstance(etiquetas, memoryview):
+            etiquetas.release()
+        for memoria in memorias:
+            memoria.close()
+            memoria.unlink()
+
+    return elegidas
+
+
+def _mejores_aristas(origenes, destinos, pesos, etiquetas, inicio, fin):
+    """
+    Para cada componente que toca el tramo `[inicio, fin)`, retorna la posición de la arista más liviana que la
+    conecta con otra componente, desempatando por posición.
+    """
+    mejores = {}
+    for k in range(inicio, fin):
+        a, b = etiquetas[origenes[k]], etiquetas[destinos[k]]
+        if a == b:
+            continue
+        peso = pesos[k]
+        for componente in (a, b):
+            actual = mejores.get(componente)
+            # Recorremos en orden de posición, así que ante pesos iguales se conserva la primera arista
+            if actual is None or peso < pesos[actual]:
+                mejores[componente] = k
+    return mejores
+
+
+def _compartir(arreglo):
+    """Copia un `array` a un bloque nuevo de memoria compartida."""
+    memoria = SharedMemory(create=True, size=max(arreglo.itemsize, len(arreglo) * arreglo.itemsize))
+    memoria.buf[:len(arreglo) * arreglo.itemsize] = arreglo.tobytes()
+    return memoria
+
+
+def _iniciar_trabajador(*descriptores):
+    """Adjunta, en el proceso trabajador, las vistas a los arreglos en memoria compartida."""
+    memorias = [SharedMemory(name=nombre) for nombre, _ in descriptores]
+    vistas = [memoria.buf.cast(tipo) for memoria, (_, tipo) in zip(memorias, descriptores)]
+    _compartido["memorias"] = memorias
+    _compartido["vistas"] = vistas
+
+
+def _mejores_aristas_trabajador(inicio, fin):
+    origenes, destinos, pesos, etiquetas = _compartido["vistas"]
+    return _mejores_aristas(origenes, destinos, pesos, etiquetas, inicio, fin)
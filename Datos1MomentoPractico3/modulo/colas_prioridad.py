@@ -0,0 +1,168 @@
+import heapq
+
+
+class ColaHeap:
+    """
+    Cola de prioridad perezosa sobre `heapq`: cada inserción agrega una entrada nueva y las entradas obsoletas se
+    descartan al extraerlas (quien la usa debe ignorar los nodos ya asentados).
+
+    Es la cola que `dijkstra` usa por defecto con pesos flotantes.
+    """
+
+    def __init__(self):
+        self.heap = []
+
+    def __len__(self):
+        return len(self.heap)
+
+    def insertar(self, prioridad, nodo):
+        heapq.heappush(self.heap, (prioridad, nodo))
+
+    def extraer(self):
+        """Retorna la tupla `(prioridad, nodo)` de menor prioridad."""
+        return heapq.heappop(self.heap)
+
+
+class ColaBuckets:
+    """
+    Cola de buckets de Dial para prioridades enteras y monótonas (cada prioridad insertada es mayor o igual que la
+    última extraída y, como mucho, `peso_max` mayor).
+
+    Usa `peso_max + 1` buckets en forma circular: el bucket `d % (peso_max + 1)` guarda los nodos con prioridad `d`.
+    Insertar es O(1) y no crea tuplas; extraer avanza un cursor sobre los buckets vacíos. Las entradas obsoletas
+    se extraen después de la buena y quien la usa debe ignorarlas, igual que con `ColaHeap`.
+
+    :param peso_max: Mayor peso de arista del grafo (entero no negativo).
+    """
+
+    def __init__(self, peso_max):
+        self.buckets = [[] for _ in range(peso_max + 1)]
+        self.actual = 0  # Prioridad del bucket bajo el cursor
+        self.total = 0
+
+    def __len__(self):
+        return self.total
+
+    def insertar(self, prioridad, nodo):
+        self.buckets[prioridad % len(self.buckets)].append(nodo)
+        self.total += 1
+
+    def extraer(self):
+        """Retorna la tupla `(prioridad, nodo)` de menor prioridad."""
+        buckets, k = self.buckets, len(self.buckets)
+        actual = self.actual
+        while not buckets[actual % k]:
+            actual += 1
+        self.actual = actual
+        self.total -= 1
+        return actual, buckets[actual % k].pop()
+
+
+class ColaRadix:
+    """
+    Radix heap para prioridades enteras monótonas (cada prioridad insertada es mayor o igual que la última
+    extraída), sin cota sobre el peso máximo.
+
+    El bucket `i` guarda las entradas cuya prioridad difiere de la última extraída en el bit `i - 1` como bit más
+    alto, así que hay a lo sumo 65 buckets para enteros de 64 bits. Cada entrada baja de bucket O(log C) veces en
+    total, donde C es el peso máximo. Las entradas obsoletas se tratan igual que en `ColaHeap`.
+    """
+
+    def __init__(self):
+        self.buckets = [[] for _ in range(65)]
+        self.ultimo = 0
+        self.total = 0
+
+    def __len__(self):
+        return self.total
+
+    def insertar(self, prioridad, nodo):
+        self.buckets[(prioridad ^ self.ultimo).bit_length()].append((prioridad, nodo))
+        self.total += 1
+
+    def extraer(self):
+        """Retorna la tupla `(prioridad, nodo)` de menor prioridad."""
+        buckets = self.buckets
+        if not buckets[0]:
+            i = 1
+            while not buckets[i]:
+                i += 1
+            # Redistribuimos el primer bucket no vacío respecto a su mínimo, que pasa a ser `ultimo`
+            entradas = buckets[i]
+            buckets[i] = []
+            ultimo = self.ultimo = min(entradas)[0]
+            for entrada in entradas:
+                buckets[(entrada[0] ^ ultimo).bit_length()].append(entrada)
+        self.total -= 1
+        return buckets[0].pop()
+
+
+class ColaIndexada:
+    """
+    Heap binario indexado con disminución de clave: cada nodo aparece a lo sumo una vez, así que la cola nunca
+    tiene entradas obsoletas y su tamaño está acotado por el número de nodos. Sirve para prioridades de cualquier
+    tipo comparable (por ejemplo, flotantes).
+
+    `insertar` agrega el nodo o, si ya está en la cola, disminuye su prioridad.
+    """
+
+    def __init__(self):
+        self.prioridades = []
+        self.nodos = []
+        self.posiciones = {}
+
+    def __len__(self):
+        return len(self.nodos)
+
+    def insertar(self, prioridad, nodo):
+        posicion = self.posiciones.get(nodo)
+        if posicion is None:
+            posicion = len(self.nodos)
+            self.prioridades.append(prioridad)
+            self.nodos.append(nodo)
+        elif prioridad < self.prioridades[posicion]:
+            self.prioridades[posicion] = prioridad
+        else:
+            return
+        self._subir(posicion, prioridad, nodo)
+
+    def extraer(self):
+        """Retorna la tupla `(prioridad, nodo)` de menor prioridad y saca el nodo de la cola."""
+        prioridades, nodos = self.prioridades, self.nodos
+        minimo = prioridades[0], nodos[0]
+        del self.posiciones[nodos[0]]
+        prioridad, nodo = prioridades.pop(), nodos.pop()
+        if nodos:
+            self._bajar(prioridad, nodo)
+        return minimo
+
+    def _subir(self, posicion, prioridad, nodo):
+        prioridades, nodos, posiciones = self.prioridades, self.nodos, self.posiciones
+        while posicion > 0:
+            padre = (posicion - 1) >> 1
+            if prioridades[padre] <= prioridad:
+                break
+            prioridades[posicion], nodos[posicion] = prioridades[padre], nodos[padre]
+            posiciones[nodos[posicion]] = posicion
+            posicion = padre
+        prioridades[posicion], nodos[posicion] = prioridad, nodo
+        posiciones[nodo] = posicion
+
+    def _bajar(self, prioridad, nodo):
+        """Coloca `(prioridad, nodo)` en la raíz y lo hunde hasta su lugar."""
+        prioridades, nodos, posiciones = self.prioridades, self.nodos, self.posiciones
+        n = len(nodos)
+        posicion = 0
+        while True:
+            hijo = 2 * posicion + 1
+            if hijo >= n:
+                break
+            if hijo + 1 < n and prioridades[hijo + 1] < prioridades[hijo]:
+                hijo += 1
+            if prioridades[hijo] >= prioridad:
+                break
+            prioridades[posicion], nodos[posicion] = prioridades[hijo], nodos[hijo]
+            posiciones[nodos[posicion]] = posicion
+            posicion = hijo
+        prioridades[posicion], nodos[posicion] = prioridad, nodo
+        posiciones[nodo] = posicion
@@ -0,0 +1,156 @@
+from array import array
+
+from modulo.grafo_csr import GrafoCSR
+from modulo.kruskal import UnionFind
+
+
+def connected_components(grafo, motor="auto"):
+    """
+    Etiqueta las componentes conexas de un grafo.
+
+    Las aristas se toman como no dirigidas, así que en un grafo dirigido se obtienen las componentes débilmente
+    conexas. El motor "numpy" propaga etiquetas de forma vectorizada sobre los arreglos CSR (cada ronda cuelga
+    cada raíz de la menor raíz vecina y comprime con saltos de punteros), sin bucles de Python por nodo ni por
+    arista. El motor "python" hace una sola pasada: una DFS por componente si el grafo no es dirigido, o una
+    llamada a `UnionFind.union_many` con todas las aristas si lo es.
+
+    `verificar_conectividad` la usa con un `GrafoCSR` no dirigido. `kruskal` y `contiene_ciclo` no la llaman:
+    el `UnionFind` de `kruskal` ya conoce el número de componentes al terminar, y `contiene_ciclo` no cuenta
+    como ciclo una arista repetida hacia el padre de la DFS, algo que no se deduce de contar aristas y
+    componentes.
+
+    Condiciones Previas:
+    - `grafo` debe ser un `GrafoCSR`, una lista de aristas como la que recibe `kruskal`, o un diccionario como el
+      que recibe `contiene_ciclo` (listas de vecinos) o `dijkstra` (listas de tuplas `(destino, peso)`).
+
+    Condiciones Posteriores:
+    - `etiquetas[i]` es la componente del nodo con índice `i` en el `GrafoCSR` (para un diccionario, el i-ésimo
+      nodo en el orden de sus claves). Las componentes se numeran 0..c-1 en el orden de su primer nodo, así que
+      ambos motores retornan exactamente las mismas etiquetas.
+    - `tamanos[c]` es el número de nodos de la componente `c`, y `len(tamanos)` el número de componentes.
+
+    Excepciones:
+    - Lanza `ValueError` si el grafo no es válido para su formato o si el motor no existe (o es "numpy" y NumPy
+      no está instalado).
+
+    :param grafo: GrafoCSR, list o dict
+        El grafo a etiquetar. Las listas y diccionarios se validan y se convierten a `GrafoCSR`.
+    :param motor: str
+        "numpy", "python" o "auto" (por defecto, NumPy si está instalado), como en `delta_stepping`.
+
+    :return: tuple
+        `(etiquetas, tamanos)`, dos `array('q')`.
+    """
+    grafo = _como_csr(grafo)
+
+    if motor not in ("auto", "numpy", "python"):
+        raise ValueError("El motor debe ser \"auto\", \"numpy\" o \"python\".")
+    if motor != "python":
+        try:
+            import numpy  # noqa: F401
+            motor = "numpy"
+        except ImportError:
+            if motor == "numpy":
+                raise ValueError("El motor \"numpy\" requiere tener NumPy instalado.")
+            motor = "python"
+
+    if len(grafo) == 0:
+        return array('q'), array('q')
+    if motor == "numpy":
+        return _componentes_numpy(grafo)
+    return _componentes_python(grafo)
+
+
+def _como_csr(grafo):
+    """Convierte un grafo en cualquiera de los formatos de entrada del proyecto a `GrafoCSR`."""
+    if isinstance(grafo, GrafoCSR):
+        return grafo
+    if isinstance(grafo, list):
+        return GrafoCSR.desde_aristas(grafo)
+    if isinstance(grafo, dict):
+        # Las listas de `dijkstra` contienen tuplas (destino, peso); las de `contiene_ciclo`, solo vecinos
+        primeros = (vecinos[0] for vecinos in grafo.values() if isinstance(vecinos, list) and vecinos)
+        if isinstance(next(primeros, None), tuple):
+            return GrafoCSR.desde_ponderado(grafo)
+    return GrafoCSR.desde_adyacencia(grafo)
+
+
+def _componentes_python(grafo):
+    """
+    Etiquetado sin NumPy. En un grafo no dirigido cada arista está en ambos sentidos y basta una DFS por
+    componente, que es lo más rápido en Python puro. En uno dirigido, una DFS por las aristas salientes no
+    alcanza a toda la componente débil, así que todas las aristas se unen en un lote con `UnionFind.union_many`.
+    """
+    n = len(grafo)
+    offsets, destinos = grafo.offsets, grafo.destinos
+    etiquetas = array('q', [-1]) * n
+    tamanos = array('q')
+
+    if not grafo.dirigido:
+        for raiz in range(n):
+            if etiquetas[raiz] != -1:
+                continue
+            etiqueta = len(tamanos)
+            etiquetas[raiz] = etiqueta
+            pila = [raiz]
+            tamano = 1
+            while pila:
+                nodo = pila.pop()
+                for vecino in destinos[offsets[nodo]:offsets[nodo + 1]]:
+                    if etiquetas[vecino] == -1:
+                        etiquetas[vecino] = etiqueta
+                        tamano += 1
+                        pila.append(vecino)
+            tamanos.append(tamano)
+        return etiquetas, tamanos
+
+    origenes = array('q')
+    for i in range(n):
+        origenes.extend([i] * (offsets[i + 1] - offsets[i]))
+    uf = UnionFind(n)
+    uf.union_many(origenes, destinos)
+
+    # Las raíces se numeran en el orden de su primer nodo
+    numeracion = array('q', [-1]) * n  # Etiqueta asignada a cada raíz
+    for i, raiz in enumerate(uf.find_many(range(n))):
+        etiqueta = numeracion[raiz]
+        if etiqueta == -1:
+            etiqueta = numeracion[raiz] = len(tamanos)
+            tamanos.append(0)
+        etiquetas[i] = etiqueta
+        tamanos[etiqueta] += 1
+    return etiquetas, tamanos
+
+
+def _componentes_numpy(grafo):
+    """
+    Propagación de etiquetas con NumPy. Cada nodo apunta a un nodo de índice menor o igual de su componente; en
+    cada ronda, la raíz mayor de cada arista entre árboles distintos se cuelga de la menor, y los saltos de
+    punteros dejan a cada nodo apuntando a su raíz. Al terminar, la raíz de cada componente es su menor índice.
+    """
+    import numpy as np
+
+    n = len(grafo)
+    offsets = np.asarray(grafo.offsets, dtype=np.int64)
+    origenes = np.repeat(np.arange(n, dtype=np.int64), np.diff(offsets))
+    destinos = np.asarray(grafo.destinos, dtype=np.int64)
+    raices = np.arange(n, dtype=np.int64)
+
+    while origenes.size:
+        raiz_origen, raiz_destino = raices[origenes], raices[destinos]
+        distintas = raiz_origen != raiz_destino
+        # Las aristas dentro de un mismo árbol ya no aportan y se descartan para las rondas siguientes
+        origenes, destinos = origenes[distintas], destinos[distintas]
+        raiz_origen, raiz_destino = raiz_origen[distintas], raiz_destino[distintas]
+        if not origenes.size:
+            break
+        np.minimum.at(raices, np.maximum(raiz_origen, raiz_destino), np.minimum(raiz_origen, raiz_destino))
+        while True:
+            saltos = raices[raices]
+            if np.array_equal(saltos, raices):
+                break
+            raices = saltos
+
+    # Las raíces son el menor índice de su componente, así que ordenarlas da el orden del primer nodo
+    _, etiquetas, tamanos = np.unique(raices, return_inverse=True, return_counts=True)
+    return array('q', etiquetas.astype(np.int64).tobytes()), array('q', tamanos.astype(np.int64).tobytes())
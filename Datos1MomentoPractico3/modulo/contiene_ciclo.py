@@ -1,10 +1,22 @@
-def contiene_ciclo(grafo):
+from array import array
+
+from modulo.estadisticas import _fase
+from modulo.grafo_csr import GrafoCSR
+
+
+def contiene_ciclo(grafo, testigo=False, estadisticas=None):
     """
     Verifica si un grafo no dirigido contiene ciclos.
 
     La función utiliza una búsqueda en profundidad (DFS) para detectar ciclos en un grafo no dirigido.
     Realiza la DFS desde cada nodo no visitado y verifica si existe algún ciclo en el grafo.
 
+    La DFS trabaja sobre los índices de un `GrafoCSR` (un diccionario se convierte primero) y guarda su estado en
+    arreglos compactos: el padre de cada nodo, el árbol de la DFS al que pertenece y la siguiente arista por
+    revisar. La pila solo contiene el camino actual, así que cada nodo entra en ella una sola vez y su tamaño
+    está acotado por el número de nodos. Con `testigo=True` se retorna además el ciclo encontrado, que se arma
+    con los padres de los dos extremos de la arista que lo cierra, sin otro recorrido.
+
     Condiciones Previas:
     - El grafo debe ser representado como un diccionario (dict) donde las claves son enteros mayores que 0
       (representando los nodos) y los valores son listas de enteros mayores que 0, que representan los nodos
@@ -16,6 +28,10 @@ def contiene_ciclo(grafo):
     Condiciones Posteriores:
     - Retorna True si el grafo contiene al menos un ciclo.
     - Retorna False si el grafo no contiene ciclos.
+    - Un lazo (u, u) es un ciclo. Las entradas repetidas hacia el padre en la DFS (una arista listada dos veces)
+      no lo son.
+    - Con `testigo=True`, retorna la lista de nodos de un ciclo, en orden (cada nodo es adyacente al siguiente y
+      el último al primero), o None si el grafo no tiene ciclos.
 
     Excepciones:
     - Lanza ValueError si el grafo no cumple con las condiciones previas. Esto incluye:
@@ -27,38 +43,100 @@ def contiene_ciclo(grafo):
     :param grafo: dict
         Un diccionario que representa un grafo no dirigido, donde las claves son nodos (enteros positivos)
         y los valores son listas de nodos (enteros positivos) representando los nodos a los que cada nodo está conectado.
+        También se acepta un `GrafoCSR`, que se recorre directamente sobre sus arreglos.
+    :param testigo: bool
+        Si es True, retorna los nodos del ciclo encontrado en lugar de un booleano.
+    :param estadisticas: Estadisticas, opcional
+        Si se da, registra el tiempo de las fases "validacion" (la conversión del diccionario) y "busqueda", y los
+        contadores "nodos_visitados" y "aristas_revisadas" (entradas de adyacencia revisadas: cada arista se ve
+        desde sus dos extremos) hasta encontrar el primer ciclo o terminar.
 
-    :return: bool
+    :return: bool, o list o None si `testigo` es True
         Retorna True si el grafo contiene un ciclo, False de lo contrario.
     """
 
-    # Validación del grafo
-    if not isinstance(grafo, dict):
-        raise ValueError("El grafo debe ser un diccionario.")  # El grafo debe ser un diccionario
-
-    for nodo, vecinos in grafo.items():
-        if not isinstance(nodo, int) or nodo <= 0:
-            raise ValueError("Las claves del grafo deben ser enteros positivos.")  # El nodo debe ser un número positivo
-        if not all(isinstance(vecino, int) and vecino > 0 for vecino in vecinos):
-            raise ValueError(
-                "Las listas de adyacencia deben contener solo enteros positivos.")  # Las conexiones deben ser enteros positivos
-        if any(vecino not in grafo for vecino in vecinos):
-            raise ValueError(
-                "El grafo contiene conexiones a nodos inexistentes.")  # El grafo no debe tener conexiones inválidas
-
-    # Conjunto de nodos visitados para el recorrido DFS
-    visitados = set()
-
-    # Iteramos sobre todos los nodos del grafo
-    for nodo in grafo:
-        if nodo not in visitados:  # Si el nodo no ha sido visitado aún, iniciamos el recorrido DFS desde él
-            pila = [(nodo, None)]  # Usamos una pila para simular el recorrido DFS iterativo
-            while pila:
-                nodo_actual, padre = pila.pop()  # Extraemos el nodo actual y su nodo padre
-                visitados.add(nodo_actual)  # Marcamos el nodo actual como visitado
-                for vecino in grafo[nodo_actual]:  # Recorremos los vecinos del nodo actual
-                    if vecino not in visitados:  # Si el vecino no ha sido visitado
-                        pila.append((vecino, nodo_actual))  # Lo añadimos a la pila para recorrerlo más tarde
-                    elif vecino != padre:  # Si encontramos un vecino que ya fue visitado y no es el padre, encontramos un ciclo
-                        return True  # Se ha detectado un ciclo
-    return False  # Si hemos recorrido todo el grafo sin encontrar ciclos, retornamos False
+    if not isinstance(grafo, GrafoCSR):
+        # Validación del grafo: mismas reglas que GrafoCSR.desde_adyacencia, que además lo compacta
+        with _fase(estadisticas, "validacion"):
+            grafo = GrafoCSR.desde_adyacencia(grafo)
+
+    with _fase(estadisticas, "busqueda"):
+        ciclo = _buscar_ciclo(grafo, estadisticas)
+    if testigo:
+        return None if ciclo is None else grafo.tabla.ids_de(ciclo)
+    return ciclo is not None
+
+
+def _buscar_ciclo(grafo, estadisticas=None):
+    """
+    DFS iterativa sobre los índices de un `GrafoCSR`. Retorna la lista de índices de un ciclo, o None.
+
+    Una arista (nodo, vecino) hacia un nodo ya visitado del mismo árbol cierra un ciclo, salvo que sea la arista
+    del árbol vista desde cualquiera de sus extremos (vecino es el padre de nodo, o nodo es el padre de vecino).
+    Los vecinos ya visitados no se vuelven a apilar, así que un nodo alcanzado por dos caminos no aparece
+    duplicado en la pila ni se confunde con una arista de retroceso.
+    """
+    offsets, destinos = grafo.offsets, grafo.destinos
+    n = len(grafo)
+    padres = array('q', [-1]) * n
+    arboles = array('q', [-1]) * n  # Raíz del árbol de la DFS de cada nodo; -1 si no fue visitado
+    siguiente = array('q', offsets[:-1])  # Próxima arista por revisar de cada nodo
+
+    for raiz in range(n):
+        if arboles[raiz] != -1:
+            continue
+        arboles[raiz] = raiz
+        pila = [raiz]  # Camino de la raíz al nodo actual
+        while pila:
+            nodo = pila[-1]
+            k = siguiente[nodo]
+            if k == offsets[nodo + 1]:
+                pila.pop()  # Todas sus aristas fueron revisadas
+                continue
+            siguiente[nodo] = k + 1
+            vecino = destinos[k]
+            if arboles[vecino] == -1:
+                arboles[vecino] = raiz
+                padres[vecino] = nodo
+                pila.append(vecino)
+            elif arboles[vecino] == raiz and vecino != padres[nodo] and padres[vecino] != nodo:
+                if estadisticas is not None:
+                    _registrar_recorrido(estadisticas, offsets, arboles, siguiente)
+                return _ciclo(padres, nodo, vecino)
+    if estadisticas is not None:
+        _registrar_recorrido(estadisticas, offsets, arboles, siguiente)
+    return None
+
+
+def _registrar_recorrido(estadisticas, offsets, arboles, siguiente):
+    """
+    Cuenta lo que recorrió `_buscar_ciclo` a partir de su propio estado, sin contadores dentro del ciclo: los
+    nodos con árbol asignado y, por cada nodo, las aristas que avanzó `siguiente` desde su offset.
+    """
+    estadisticas.sumar("nodos_visitados", len(arboles) - arboles.count(-1))
+    estadisticas.sumar("aristas_revisadas", sum(siguiente) - (sum(offsets) - offsets[-1]))
+
+
+def _ciclo(padres, nodo, vecino):
+    """
+    Arma el ciclo que cierra la arista (nodo, vecino): el camino de `nodo` hasta el ancestro común más cercano
+    y de ahí hasta `vecino`.
+    """
+    ancestros = set()
+    actual = vecino
+    while actual != -1:
+        ancestros.add(actual)
+        actual = padres[actual]
+
+    ciclo = [nodo]
+    while ciclo[-1] not in ancestros:
+        ciclo.append(padres[ciclo[-1]])
+    comun = ciclo[-1]
+
+    bajada = []
+    actual = vecino
+    while actual != comun:
+        bajada.append(actual)
+        actual = padres[actual]
+    ciclo.extend(reversed(bajada))
+    return ciclo
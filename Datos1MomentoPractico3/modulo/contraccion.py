@@ -0,0 +1,302 @@
+import heapq
+from array import array
+
+from modulo.grafo_csr import GrafoCSR, _acumular
+
+# Nodos que puede asentar cada búsqueda de testigos; cortarla antes solo agrega atajos de más, nunca da
+# distancias incorrectas
+_LIMITE_TESTIGOS = 64
+
+
+class JerarquiaContraccion:
+    """
+    Jerarquía de contracción para consultas de camino más corto sobre un grafo estático.
+
+    El preprocesamiento contrae los nodos uno a uno, del menos al más importante. Al contraer v, para cada par de
+    vecinos (u, w) con aristas u -> v -> w se busca un camino testigo de u a w que no pase por v y no sea más
+    largo; si no existe, se agrega el atajo u -> w con el peso del camino por v. Así, la distancia entre dos nodos
+    cualesquiera se puede obtener con un camino que primero sube y luego baja en el orden de contracción.
+
+    La consulta es una búsqueda bidireccional en la que ambos lados solo siguen aristas hacia nodos de mayor
+    rango: hacia adelante sobre el grafo "arriba" y hacia atrás sobre el grafo "abajo". Estos dos grafos se
+    guardan en arreglos compactos (como un `GrafoCSR`), junto con el nodo intermedio de cada atajo (-1 en las
+    aristas originales) para desempacar los caminos.
+
+    Usar `construir` para el preprocesamiento.
+
+    :param grafo: `GrafoCSR` ponderado original.
+    :param rangos: `array('q')` con la posición de cada nodo en el orden de contracción.
+    :param arriba: Tupla `(offsets, destinos, pesos, intermedios)` de las aristas u -> w con rango(u) < rango(w).
+    :param abajo: Tupla `(offsets, destinos, pesos, intermedios)` de las aristas u -> w con rango(u) > rango(w),
+        guardadas al revés (en la fila de w), para la búsqueda hacia atrás.
+    """
+
+    def __init__(self, grafo, rangos, arriba, abajo):
+        self.grafo = grafo
+        self.rangos = rangos
+        self.arriba = arriba
+        self.abajo = abajo
+
+    @property
+    def num_atajos(self):
+        """Número de atajos agregados durante el preprocesamiento."""
+        return sum(1 for intermedio in self.arriba[3] if intermedio >= 0) + \
+            sum(1 for intermedio in self.abajo[3] if intermedio >= 0)
+
+    @classmethod
+    def construir(cls, grafo):
+        """
+        Ordena y contrae los nodos del grafo.
+
+        El orden se elige con una cola de prioridad perezosa sobre la diferencia de aristas (atajos que habría que
+        agregar menos aristas que se quitan) más el número de vecinos ya contraídos, que reparte las
+        contracciones por todo el grafo. Antes de contraer un nodo se recalcula su prioridad; si ya no es la
+        menor, se reinserta.
+
+        :param grafo: Grafo dirigido ponderado, como diccionario (mismo formato que `dijkstra`) o `GrafoCSR`.
+
+        :return: `JerarquiaContraccion`.
+
+        Lanza:
+        - ValueError si el grafo no es válido.
+        """
+        if not isinstance(grafo, GrafoCSR):
+            grafo = GrafoCSR.desde_ponderado(grafo)
+        if grafo.pesos is None:
+            raise ValueError("El grafo debe ser ponderado.")
+        n = len(grafo)
+
+        # Grafo de trabajo: aristas salientes y entrantes de los nodos aún no contraídos, con su intermedio
+        salientes = [{} for _ in range(n)]
+        entrantes = [{} for _ in range(n)]
+        offsets, destinos, pesos = grafo.offsets, grafo.destinos, grafo.pesos
+        for u in range(n):
+            for k in range(offsets[u], offsets[u + 1]):
+                w = destinos[k]
+                if w != u:
+                    salientes[u][w] = entrantes[w][u] = (pesos[k], -1)
+
+        # Todas las aristas, originales y atajos, con su intermedio; se reparten entre arriba y abajo al final
+        aristas = {}
+        for u in range(n):
+            for w, arista in salientes[u].items():
+                aristas[u, w] = arista
+
+        contraidos = bytearray(n)
+        vecinos_contraidos = array('q', [0]) * n
+        rangos = array('q', [0]) * n
+
+        def prioridad(v, atajos):
+            return len(atajos) - len(salientes[v]) - len(entrantes[v]) + vecinos_contraidos[v]
+
+        cola_prioridad = [(prioridad(v, _atajos(v, salientes, entrantes)), v) for v in range(n)]
+        heapq.heapify(cola_prioridad)
+        rango = 0
+        while cola_prioridad:
+            _, v = heapq.heappop(cola_prioridad)
+            if contraidos[v]:
+                continue
+            # Actualización perezosa: si la prioridad empeoró y ya no es la menor, se reinserta
+            atajos = _atajos(v, salientes, entrantes)
+            actual = prioridad(v, atajos)
+            if cola_prioridad and actual > cola_prioridad[0][0]:
+                heapq.heappush(cola_prioridad, (actual, v))
+                continue
+
+            for u, w, peso in atajos:
+                anterior = salientes[u].get(w)
+                if anterior is None or peso < anterior[0]:
+                    salientes[u][w] = entrantes[w][u] = aristas[u, w] = (peso, v)
+
+            contraidos[v] = 1
+            rangos[v] = rango
+            rango += 1
+            for u in entrantes[v]:
+                del salientes[u][v]
+                vecinos_contraidos[u] += 1
+            for w in salientes[v]:
+                del entrantes[w][v]
+                vecinos_contraidos[w] += 1
+            salientes[v], entrantes[v] = {}, {}
+
+        arriba = [[] for _ in range(n)]
+        abajo = [[] for _ in range(n)]
+        for (u, w), (peso, intermedio) in aristas.items():
+            if rangos[u] < rangos[w]:
+                arriba[u].append((w, peso, intermedio))
+            else:
+                abajo[w].append((u, peso, intermedio))
+        return cls(grafo, rangos, _compactar(arriba, grafo.tipo_pesos), _compactar(abajo, grafo.tipo_pesos))
+
+    def distancia(self, origen, destino):
+        """
+        Retorna la distancia más corta de `origen` a `destino`, igual a la de `dijkstra`.
+
+        Lanza:
+        - ValueError si alguno de los nodos no existe o si no hay camino entre ellos.
+        """
+        return self.shortest_path(origen, destino, desempacar=False)[0]
+
+    def shortest_path(self, origen, destino, desempacar=True):
+        """
+        Calcula el camino más corto entre dos nodos.
+
+        :param desempacar: Si es False, no reconstruye el camino y retorna `None` en su lugar.
+
+        :return: Tupla `(distancia, camino)`, igual que `Dijkstra.shortest_path`.
+
+        Lanza:
+        - ValueError si alguno de los nodos no existe o si no hay camino entre ellos.
+        """
+        for nodo in (origen, destino):
+            if nodo not in self.grafo:
+                raise ValueError(f"El nodo {nodo} no existe en el grafo.")
+        s, t = self.grafo.indice(origen), self.grafo.indice(destino)
+
+        mejor, encuentro, adelante, atras = self._busqueda(s, t)
+        if encuentro is None:
+            raise ValueError(f"No existe un camino del nodo {origen} al nodo {destino}.")
+        if not desempacar:
+            return mejor, None
+
+        # Aristas de la jerarquía desde s hasta el encuentro, y desde el encuentro hasta t
+        subida = _aristas_hasta(adelante, s, encuentro)
+        bajada = [(v, u, intermedio) for u, v, intermedio in reversed(_aristas_hasta(atras, t, encuentro))]
+        camino = [s]
+        for u, w, intermedio in subida + bajada:
+            self._desempacar(u, w, intermedio, camino)
+        return mejor, self.grafo.tabla.ids_de(camino)
+
+    def _busqueda(self, s, t):
+        """
+        Búsqueda bidireccional ascendente. Alterna el lado con menor tope y lo detiene cuando su tope ya no puede
+        mejorar `mejor`. Con "stall-on-demand", un nodo al que se llega más corto bajando desde un nodo ya
+        alcanzado de mayor rango no puede estar en el camino óptimo, así que no se expande.
+
+        Retorna `(mejor, encuentro, predecesores_adelante, predecesores_atras)`, con `encuentro` None si no hay
+        camino.
+        """
+        infinito = float('inf')
+        # Cada lado: grafo que recorre, grafo inverso para detenerse, distancias, predecesores, visitados, cola
+        lados = ((self.arriba, self.abajo, {s: 0}, {}, set(), [(0, s)]),
+                 (self.abajo, self.arriba, {t: 0}, {}, set(), [(0, t)]))
+        mejor, encuentro = infinito, None
+        while True:
+            topes = [lado[5][0][0] if lado[5] else infinito for lado in lados]
+            if min(topes) >= mejor:
+                break
+            indice = 0 if topes[0] <= topes[1] else 1
+            (offsets, destinos, pesos, intermedios), inverso, distancias, predecesores, visitados, cola_prioridad = \
+                lados[indice]
+            distancias_otro = lados[1 - indice][2]
+
+            distancia_actual, nodo_actual = heapq.heappop(cola_prioridad)
+            if nodo_actual in visitados:
+                continue
+            visitados.add(nodo_actual)
+            otra = distancias_otro.get(nodo_actual)
+            if otra is not None and distancia_actual + otra < mejor:
+                mejor, encuentro = distancia_actual + otra, nodo_actual
+
+            offsets_inv, destinos_inv, pesos_inv, _ = inverso
+            detenido = False
+            for k in range(offsets_inv[nodo_actual], offsets_inv[nodo_actual + 1]):
+                superior = distancias.get(destinos_inv[k])
+                if superior is not None and superior + pesos_inv[k] < distancia_actual:
+                    detenido = True
+                    break
+            if detenido:
+                continue
+
+            for k in range(offsets[nodo_actual], offsets[nodo_actual + 1]):
+                vecino = destinos[k]
+                distancia_nueva = distancia_actual + pesos[k]
+                if distancia_nueva < distancias.get(vecino, infinito):
+                    distancias[vecino] = distancia_nueva
+                    predecesores[vecino] = (nodo_actual, intermedios[k])
+                    heapq.heappush(cola_prioridad, (distancia_nueva, vecino))
+        return mejor, encuentro, lados[0][3], lados[1][3]
+
+    def _desempacar(self, u, w, intermedio, camino):
+        """Agrega a `camino` los nodos originales de la arista u -> w de la jerarquía, sin incluir u."""
+        pendientes = [(u, w, intermedio)]
+        while pendientes:
+            u, w, intermedio = pendientes.pop()
+            if intermedio < 0:
+                camino.append(w)
+                continue
+            # El atajo u -> w reemplaza a u -> intermedio -> w; el intermedio tiene menor rango que ambos
+            pendientes.append((intermedio, w, self._intermedio(intermedio, w)))
+            pendientes.append((u, intermedio, self._intermedio(u, intermedio)))
+
+    def _intermedio(self, u, w):
+        """Intermedio de la arista u -> w de la jerarquía, buscándola en arriba o en abajo según los rangos."""
+        if self.rangos[u] < self.rangos[w]:
+            offsets, destinos, _, intermedios = self.arriba
+            fila, vecino = u, w
+        else:
+            offsets, destinos, _, intermedios = self.abajo
+            fila, vecino = w, u
+        for k in range(offsets[fila], offsets[fila + 1]):
+            if destinos[k] == vecino:
+                return intermedios[k]
+        raise ValueError(f"La arista {u} -> {w} no existe en la jerarquía.")
+
+
+def _atajos(v, salientes, entrantes):
+    """Atajos `(u, w, peso)` necesarios al contraer v, según búsquedas de testigos que evitan v."""
+    atajos = []
+    for u, (peso_entrada, _) in entrantes[v].items():
+        objetivos = {w: peso_entrada + peso_salida for w, (peso_salida, _) in salientes[v].items() if w != u}
+        if not objetivos:
+            continue
+        distancias = _testigos(u, v, max(objetivos.values()), salientes)
+        for w, peso in objetivos.items():
+            if distancias.get(w, float('inf')) > peso:
+                atajos.append((u, w, peso))
+    return atajos
+
+
+def _testigos(u, v, limite, salientes):
+    """Dijkstra acotado desde u, sin pasar por v, hasta la distancia `limite` o `_LIMITE_TESTIGOS` nodos."""
+    distancias = {u: 0}
+    visitados = set()
+    cola_prioridad = [(0, u)]
+    while cola_prioridad and len(visitados) < _LIMITE_TESTIGOS:
+        distancia_actual, nodo_actual = heapq.heappop(cola_prioridad)
+        if nodo_actual in visitados:
+            continue
+        if distancia_actual > limite:
+            break
+        visitados.add(nodo_actual)
+        for vecino, (peso, _) in salientes[nodo_actual].items():
+            if vecino == v:
+                continue
+            distancia_nueva = distancia_actual + peso
+            if distancia_nueva < distancias.get(vecino, float('inf')):
+                distancias[vecino] = distancia_nueva
+                heapq.heappush(cola_prioridad, (distancia_nueva, vecino))
+    return distancias
+
+
+def _compactar(filas, tipo_pesos):
+    """Convierte listas de `(destino, peso, intermedio)` por nodo en arreglos CSR."""
+    offsets = _acumular([len(fila) for fila in filas])
+    destinos, pesos, intermedios = array('q'), array(tipo_pesos), array('q')
+    for fila in filas:
+        for destino, peso, intermedio in fila:
+            destinos.append(destino)
+            pesos.append(peso)
+            intermedios.append(intermedio)
+    return offsets, destinos, pesos, intermedios
+
+
+def _aristas_hasta(predecesores, inicio, nodo):
+    """Aristas `(u, w, intermedio)` del árbol de búsqueda desde `inicio` hasta `nodo`, en orden."""
+    aristas = []
+    while nodo != inicio:
+        predecesor, intermedio = predecesores[nodo]
+        aristas.append((predecesor, nodo, intermedio))
+        nodo = predecesor
+    aristas.reverse()
+    return aristas
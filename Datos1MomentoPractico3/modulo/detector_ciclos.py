@@ -0,0 +1,103 @@
+from modulo.kruskal import UnionFind
+from modulo.tabla_ids import TablaIds
+
+
+class DetectorCiclos:
+    """
+    Detecta en línea si un grafo no dirigido que crece arista por arista contiene un ciclo.
+
+    Mantiene un `UnionFind` sobre los nodos vistos: una arista cierra un ciclo exactamente cuando sus dos extremos
+    ya están en la misma componente. Cada inserción cuesta un par de búsquedas (tiempo casi constante amortizado),
+    en lugar de la DFS sobre todo el grafo que hace `contiene_ciclo` en cada llamada. Los nodos se internan con una
+    `TablaIds`, así que no tienen que estar numerados de 1 a n.
+
+    Un lazo (u, u) es un ciclo, igual que en `contiene_ciclo`. Una arista repetida se trata como arista paralela y
+    también cierra un ciclo: el detector no guarda las aristas, solo las componentes, así que no puede
+    distinguirla de una arista nueva. Quien necesite ignorar duplicados debe filtrarlos antes.
+
+    :param aristas: Iterable inicial de pares (Nodo1, Nodo2).
+
+    Condiciones Posteriores:
+    - Sin aristas repetidas, `tiene_ciclo` es True si y solo si `contiene_ciclo` lo sería sobre el grafo con todas
+      las aristas agregadas.
+    - `primera_arista_ciclo` es la primera arista agregada que cerró un ciclo, o None.
+    """
+
+    def __init__(self, aristas=()):
+        self.tabla = TablaIds()
+        self.union_find = None  # Se crea con el primer nodo, pues `UnionFind` exige al menos uno
+        self.num_aristas = 0
+        self.primera_arista_ciclo = None
+        self.agregar_aristas(aristas)
+
+    def __len__(self):
+        return len(self.tabla)
+
+    @property
+    def tiene_ciclo(self):
+        """True si alguna de las aristas agregadas cerró un ciclo."""
+        return self.primera_arista_ciclo is not None
+
+    def agregar_arista(self, nodo1, nodo2):
+        """
+        Agrega la arista no dirigida (nodo1, nodo2).
+
+        :return: True si la arista cierra un ciclo (sus extremos ya estaban conectados), False si no.
+
+        Lanza:
+        - ValueError si algún nodo no es un entero positivo.
+        """
+        _validar_nodo(nodo1)
+        _validar_nodo(nodo2)
+        x, y = self._indice(nodo1), self._indice(nodo2)
+        self.num_aristas += 1
+        if self.union_find.union(x, y):
+            return False
+        if self.primera_arista_ciclo is None:
+            self.primera_arista_ciclo = (nodo1, nodo2)
+        return True
+
+    def agregar_aristas(self, aristas):
+        """
+        Agrega un lote de aristas no dirigidas con una sola llamada a `UnionFind.union_many`.
+
+        :param aristas: Iterable de pares (Nodo1, Nodo2).
+        :return: True si el grafo contiene un ciclo después de agregar el lote.
+
+        Lanza:
+        - ValueError si algún nodo no es un entero positivo (las aristas anteriores del lote no se agregan).
+        """
+        aristas = list(aristas)
+        for arista in aristas:
+            if not isinstance(arista, tuple) or len(arista) != 2:
+                raise ValueError(f"Cada arista debe ser una tupla (Nodo1, Nodo2). Error en la arista: {arista}")
+            for nodo in arista:
+                _validar_nodo(nodo)
+        xs = [self._indice(nodo1) for nodo1, _ in aristas]
+        ys = [self._indice(nodo2) for _, nodo2 in aristas]
+        if not aristas:
+            return self.tiene_ciclo
+
+        unidos = self.union_find.union_many(xs, ys)
+        self.num_aristas += len(aristas)
+        if self.primera_arista_ciclo is None:
+            primera = unidos.find(0)
+            if primera >= 0:
+                self.primera_arista_ciclo = aristas[primera]
+        return self.tiene_ciclo
+
+    def _indice(self, nodo):
+        """Índice denso de `nodo`, agregándolo al `UnionFind` si es nuevo."""
+        if nodo in self.tabla:
+            return self.tabla.indices[nodo]
+        indice = self.tabla.internar(nodo)
+        if self.union_find is None:
+            self.union_find = UnionFind(1)
+        else:
+            self.union_find.agregar()
+        return indice
+
+
+def _validar_nodo(nodo):
+    if not isinstance(nodo, int) or nodo <= 0:
+        raise ValueError(f"Los nodos deben ser enteros positivos. Error en el nodo: {nodo}")
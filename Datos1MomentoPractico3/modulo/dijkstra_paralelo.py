@@ -0,0 +1,220 @@
+import os
+from array import array
+from collections import deque
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+
+from modulo.Dijkstra import _crear_cola, _distancias_csr
+from modulo.grafo_csr import GrafoCSR
+
+# Por debajo de este número de orígenes por proceso, repartir el trabajo cuesta más de lo que ahorra
+_MIN_ORIGENES_POR_PROCESO = 4
+
+# Filas enviadas y aún no consumidas por cada proceso: con 2 cada proceso tiene la siguiente tarea lista al terminar
+# una, y la memoria de `dijkstra_many_filas` queda acotada aunque el consumidor sea lento
+_TAREAS_POR_PROCESO = 2
+
+# Distancia de los nodos no alcanzables en las filas enteras (`array('q')` no puede guardar `inf`)
+SIN_CAMINO = 2 ** 63 - 1
+
+# Vistas a la memoria compartida y parámetros de la cola dentro de cada proceso trabajador
+_compartido = {}
+
+
+class MatrizDistancias:
+    """
+    Matriz compacta de distancias origen × nodo, guardada por filas en un único arreglo.
+
+    La fila `i` corresponde a `origenes[i]` y la columna `j` al nodo `ids[j]`. Con pesos enteros el arreglo es un
+    `array('q')`, para que las distancias sean las mismas de `dijkstra` (un float64 las redondearía a partir de
+    2**53), y los nodos no alcanzables guardan `SIN_CAMINO`; con pesos flotantes, o si la suma de los pesos
+    pudiera no caber en int64, es un `array('d')` con `inf`. `distancia` y `como_diccionario` retornan `inf` en
+    ambos casos.
+    """
+
+    def __init__(self, origenes, ids, datos):
+        self.origenes = list(origenes)
+        self.ids = ids
+        self.datos = datos
+        self._filas = {origen: i for i, origen in enumerate(self.origenes)}
+        self._columnas = {nodo: j for j, nodo in enumerate(ids)}
+
+    def __len__(self):
+        return len(self.origenes)
+
+    def fila(self, origen):
+        """Retorna la fila de `origen`, sin copiar sus valores, como un arreglo indexado igual que `ids`."""
+        n = len(self.ids)
+        i = self._fila(origen)
+        return self.datos[i * n:(i + 1) * n]
+
+    def distancia(self, origen, destino):
+        """Retorna la distancia más corta de `origen` a `destino` (`inf` si no es alcanzable)."""
+        if destino not in self._columnas:
+            raise ValueError(f"El nodo {destino} no existe en el grafo.")
+        return _con_infinito(self.datos[self._fila(origen) * len(self.ids) + self._columnas[destino]])
+
+    def como_diccionario(self, origen):
+        """Retorna la fila de `origen` como diccionario nodo -> distancia, con el formato de `dijkstra`."""
+        return dict(zip(self.ids, map(_con_infinito, self.fila(origen))))
+
+    def _fila(self, origen):
+        if origen not in self._filas:
+            raise ValueError(f"El nodo {origen} no es un origen de la matriz.")
+        return self._filas[origen]
+
+
+def dijkstra_many(grafo, sources, workers=None, cola="auto"):
+    """
+    Calcula las distancias más cortas desde varios orígenes sobre el mismo grafo, repartiendo los orígenes entre
+    varios procesos.
+
+    El grafo se valida y se convierte a `GrafoCSR` una sola vez. Sus arreglos se copian a memoria compartida al
+    iniciar los procesos, de modo que cada tarea solo envía el índice del origen y recibe una fila de distancias.
+
+    :param grafo: Grafo dirigido ponderado, como diccionario (mismo formato que `dijkstra`) o `GrafoCSR`.
+    :param sources: Iterable con los nodos de origen.
+    :param workers: Número de procesos a usar; por defecto, el número de núcleos. Con 1 proceso, o con pocos
+        orígenes por proceso, todo se ejecuta en el proceso actual.
+    :param cola: Cola de prioridad a usar, con los mismos valores que en `dijkstra`.
+
+    :return: `MatrizDistancias` con una fila por origen, en el orden de `sources`.
+
+    Condiciones Posteriores:
+    - A diferencia de `dijkstra`, el grafo no tiene que ser conexo: los nodos no alcanzables quedan con `inf`.
+
+    Lanza:
+    - ValueError si el grafo no es válido, si algún origen no existe o si el número de procesos no es positivo.
+    """
+    grafo, origenes, info_cola = _preparar(grafo, sources, workers, cola)
+    n = len(grafo)
+    datos = array(info_cola[-1], bytes(8 * n * len(origenes)))
+    for i, (_, fila) in enumerate(_filas(grafo, origenes, workers, info_cola)):
+        datos[i * n:(i + 1) * n] = fila
+    return MatrizDistancias(origenes, grafo.ids, datos)
+
+
+def dijkstra_many_filas(grafo, sources, workers=None, cola="auto"):
+    """
+    Igual que `dijkstra_many`, pero retorna un generador de tuplas `(origen, fila)` en el orden de `sources`,
+    donde `fila` es un arreglo indexado igual que los ids del `GrafoCSR`, del tipo descrito en `MatrizDistancias`
+    (con pesos enteros, `array('q')` con `SIN_CAMINO` en los nodos no alcanzables). Los orígenes se envían a los
+    procesos de a poco: nunca hay más de `_TAREAS_POR_PROCESO` × procesos filas en cálculo o calculadas sin
+    consumir, así que la memoria no depende del número de orígenes.
+
+    Los parámetros se validan al llamar a la función, no al empezar a iterar.
+    """
+    grafo, origenes, info_cola = _preparar(grafo, sources, workers, cola)
+    return _filas(grafo, origenes, workers, info_cola)
+
+
+def _preparar(grafo, sources, workers, cola):
+    """
+    Valida los parámetros comunes y retorna el `GrafoCSR`, la lista de orígenes y la tupla
+    `(cola, solo_enteros, peso_max, tipo)` con la que cada proceso crea sus colas y sus filas (`tipo` es el
+    código del `array` de las filas).
+    """
+    if workers is not None and workers <= 0:
+        raise ValueError("El número de procesos debe ser un entero positivo.")
+    if not isinstance(grafo, GrafoCSR):
+        if not isinstance(grafo, dict) or not grafo:
+            raise ValueError("El grafo debe ser un diccionario no vacío.")
+        grafo = GrafoCSR.desde_ponderado(grafo)
+    if grafo.pesos is None:
+        raise ValueError("El grafo debe ser ponderado.")
+    origenes = list(sources)
+    for origen in origenes:
+        if origen not in grafo:
+            raise ValueError(f"El nodo de inicio {origen} debe ser una llave válida en el grafo.")
+
+    solo_enteros = grafo.tipo_pesos in ('q', 'Q')
+    peso_max = grafo.peso_max if solo_enteros else 0
+    _crear_cola(cola, solo_enteros, peso_max)  # Valida la cola antes de lanzar procesos
+    # Un camino tiene a lo sumo n - 1 aristas, así que con esta cota toda distancia cabe en int64
+    tipo = 'q' if solo_enteros and peso_max * len(grafo) < SIN_CAMINO else 'd'
+    return grafo, origenes, (cola, solo_enteros, peso_max, tipo)
+
+
+def _filas(grafo, origenes, workers, info_cola):
+    """Generador de `(origen, fila)` que reparte los orígenes entre los procesos."""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(origenes) // _MIN_ORIGENES_POR_PROCESO))
+    indices = [grafo.indice(origen) for origen in origenes]
+
+    if workers == 1:
+        arreglos = (grafo.offsets, grafo.destinos, grafo.pesos)
+        for origen, inicio in zip(origenes, indices):
+            yield origen, _fila(arreglos, inicio, *info_cola)
+        return
+
+    memorias = []
+    pool = None
+    try:
+        arreglos = (grafo.offsets, grafo.destinos, grafo.pesos)
+        memorias = [_compartir(arreglo) for arreglo in arreglos]
+        descriptores = tuple((memoria.name, len(memoryview(arreglo).cast('B')), tipo)
+                             for memoria, arreglo, tipo in zip(memorias, arreglos, ('q', 'q', grafo.tipo_pesos)))
+        pool = get_context().Pool(workers, initializer=_iniciar_trabajador,
+                                  initargs=(descriptores, info_cola))
+        enviar = lambda inicio: pool.apply_async(_fila_trabajador, (inicio,))
+        for origen, fila in zip(origenes, _en_ventana(enviar, indices, _TAREAS_POR_PROCESO * workers)):
+            yield origen, fila
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+        for memoria in memorias:
+            memoria.close()
+            memoria.unlink()
+
+
+def _en_ventana(enviar, argumentos, ventana):
+    """
+    Envía una tarea por cada elemento de `argumentos` con `enviar` (que retorna un resultado asíncrono con `get`,
+    como `Pool.apply_async`) y produce los resultados en orden. A diferencia de `Pool.imap`, que envía todas las
+    tareas de una vez y acumula sus resultados, solo envía una tarea nueva cuando se consume un resultado, así
+    que nunca hay más de `ventana` tareas enviadas cuyo resultado no se consumió.
+    """
+    pendientes = deque()
+    for argumento in argumentos:
+        if len(pendientes) == ventana:
+            yield pendientes.popleft().get()
+        pendientes.append(enviar(argumento))
+    while pendientes:
+        yield pendientes.popleft().get()
+
+
+def _fila(arreglos, inicio, cola, solo_enteros, peso_max, tipo):
+    offsets, destinos, pesos = arreglos
+    distancias, _ = _distancias_csr(offsets, destinos, pesos, inicio, _crear_cola(cola, solo_enteros, peso_max))
+    if tipo == 'q':
+        infinito = float('inf')
+        return array('q', [SIN_CAMINO if distancia == infinito else distancia for distancia in distancias])
+    return array('d', distancias)
+
+
+def _con_infinito(distancia):
+    return float('inf') if distancia == SIN_CAMINO else distancia
+
+
+def _compartir(arreglo):
+    """Copia un `array` (o una vista de memoria congelada) a un bloque nuevo de memoria compartida."""
+    datos = memoryview(arreglo).cast('B')
+    memoria = SharedMemory(create=True, size=max(1, len(datos)))
+    memoria.buf[:len(datos)] = datos
+    return memoria
+
+
+def _iniciar_trabajador(descriptores, info_cola):
+    """Adjunta, en el proceso trabajador, las vistas a los arreglos CSR en memoria compartida."""
+    memorias = [SharedMemory(name=nombre) for nombre, _, _ in descriptores]
+    _compartido["memorias"] = memorias
+    # El bloque puede ser más grande que el arreglo (se redondea a páginas), así que recortamos la vista
+    _compartido["vistas"] = [memoria.buf[:tamano].cast(tipo)
+                             for memoria, (_, tamano, tipo) in zip(memorias, descriptores)]
+    _compartido["cola"] = info_cola
+
+
+def _fila_trabajador(inicio):
+    return _fila(_compartido["vistas"], inicio, *_compartido["cola"])
@@ -0,0 +1,65 @@
+import time
+from contextlib import contextmanager, nullcontext
+
+
+class Estadisticas:
+    """
+    Contadores y tiempos por fase de una o más ejecuciones de los algoritmos del proyecto.
+
+    `dijkstra`, `kruskal` y `contiene_ciclo` aceptan el parámetro `estadisticas`; si se les pasa una instancia,
+    registran en ella sus contadores (operaciones de la cola, aristas revisadas, búsquedas de `UnionFind`, ...) y
+    el tiempo de cada fase (validación, ordenamiento, búsqueda). Si no se pasa, no se registra nada: los contadores
+    se obtienen de envoltorios que solo se usan cuando se piden estadísticas, o de los arreglos que el algoritmo
+    ya mantiene, así que los ciclos internos son los mismos en ambos casos.
+
+    Una misma instancia acumula varias ejecuciones; `como_diccionario` retorna una copia que se puede serializar
+    con `json` para enviarla a un sistema de métricas.
+
+    Condiciones Posteriores:
+    - `contadores` mapea el nombre de cada contador a un entero.
+    - `tiempos` mapea el nombre de cada fase a los segundos acumulados en ella.
+    """
+
+    def __init__(self):
+        self.contadores = {}
+        self.tiempos = {}
+
+    def sumar(self, nombre, cantidad=1):
+        """Suma `cantidad` al contador `nombre` (que empieza en 0)."""
+        self.contadores[nombre] = self.contadores.get(nombre, 0) + cantidad
+
+    def maximo(self, nombre, valor):
+        """Guarda en el contador `nombre` el mayor valor visto."""
+        if valor > self.contadores.get(nombre, valor - 1):
+            self.contadores[nombre] = valor
+
+    @contextmanager
+    def fase(self, nombre):
+        """
+        Mide el tiempo del bloque `with` y lo suma al de la fase `nombre`, también si el bloque lanza una
+        excepción.
+        """
+        inicio = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.tiempos[nombre] = self.tiempos.get(nombre, 0.0) + time.perf_counter() - inicio
+
+    def como_diccionario(self):
+        """
+        :return: dict con las llaves "contadores" y "tiempos", copias de los diccionarios de la instancia.
+        """
+        return {"contadores": dict(self.contadores), "tiempos": dict(self.tiempos)}
+
+    def reiniciar(self):
+        """Borra todos los contadores y tiempos."""
+        self.contadores.clear()
+        self.tiempos.clear()
+
+    def __repr__(self):
+        return f"Estadisticas(contadores={self.contadores!r}, tiempos={self.tiempos!r})"
+
+
+def _fase(estadisticas, nombre):
+    """El temporizador de la fase `nombre`, o un contexto que no hace nada si no se piden estadísticas."""
+    return nullcontext() if estadisticas is None else estadisticas.fase(nombre)
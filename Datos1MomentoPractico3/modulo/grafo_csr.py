@@ -0,0 +1,470 @@
+import mmap
+from array import array
+from itertools import count
+
+from modulo.tabla_ids import TablaIds
+
+# Sellos de versión que se asignan a los grafos al congelarlos
+_versiones = count(1)
+
+# Formato binario de `guardar`/`cargar`: firma de 8 bytes y un encabezado de 5 enteros de 64 bits (marca de orden
+# de bytes, n, m, dirigido, tipo de pesos) más el peso máximo (8 bytes, del tipo de los pesos), seguidos de
+# offsets, destinos, pesos e ids, todos de 8 bytes
+_FIRMA = b'GRAFOCSR'
+_MARCA_ORDEN = 0x0102030405060708
+_TAMANO_ENCABEZADO = len(_FIRMA) + 6 * 8
+_CODIGOS_PESOS = {None: 0, 'q': 1, 'd': 2}
+
+
+class GrafoCSR:
+    """
+    Representación compacta de un grafo en formato CSR (Compressed Sparse Row).
+
+    Las aristas salientes del nodo con índice `i` ocupan las posiciones `offsets[i]` a `offsets[i + 1] - 1` de los
+    arreglos `destinos` y `pesos`. Los nodos originales (ids) se internan en índices densos `0..n-1`, de modo que
+    los algoritmos recorren arreglos contiguos de enteros en lugar de diccionarios y tuplas de Python.
+
+    Condiciones Previas:
+    - `offsets` debe tener `n + 1` posiciones, empezar en 0 y ser no decreciente.
+    - `destinos` debe contener índices dentro del rango [0, n-1].
+    - `pesos` debe tener la misma longitud que `destinos`, o ser None si el grafo no es ponderado.
+    - `ids` debe contener los identificadores originales de los nodos, en el orden de sus índices.
+
+    Condiciones Posteriores:
+    - Los grafos construidos con `desde_aristas`, `desde_adyacencia` y `desde_ponderado` ya fueron validados con
+      las mismas reglas que `kruskal`, `contiene_ciclo` y `dijkstra` aplican a sus formatos de entrada, por lo que
+      esas funciones no vuelven a validarlos.
+    - Tras `congelar()`, los arreglos son de solo lectura y `version` identifica esa instancia inmutable.
+    - `peso_max` es el mayor peso (0 si no hay aristas, None si el grafo no es ponderado). Se calcula una sola vez
+      al construir el grafo, para que las consultas que dimensionan sus colas con él no recorran los pesos; por
+      eso los arreglos no deben modificarse después (`congelar()` lo garantiza).
+
+    :param offsets: array
+        Arreglo de `n + 1` enteros con el inicio de las aristas de cada nodo.
+    :param destinos: array
+        Arreglo con el índice del nodo destino de cada arista.
+    :param pesos: array o None
+        Arreglo con el peso de cada arista, o None si el grafo no es ponderado.
+    :param ids: TablaIds o iterable
+        Tabla con el identificador original de cada nodo, o los identificadores en el orden de sus índices.
+    :param dirigido: bool
+        False si cada arista no dirigida está almacenada en ambos sentidos.
+    :param peso_max: int o float, opcional
+        El mayor peso, si ya se conoce (por ejemplo, al cargar un archivo); si no, se calcula a partir de `pesos`.
+    """
+
+    def __init__(self, offsets, destinos, pesos, ids, dirigido=True, peso_max=None):
+        self.offsets = offsets
+        self.destinos = destinos
+        self.pesos = pesos
+        if pesos is not None and peso_max is None:
+            peso_max = max(pesos, default=0)
+        self.peso_max = peso_max if pesos is not None else None
+        self.tabla = ids if isinstance(ids, TablaIds) else TablaIds(ids)
+        self.ids = self.tabla.ids
+        self.dirigido = dirigido
+        self.version = None
+        self._transpuesto = None
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __contains__(self, nodo):
+        return nodo in self.indices
+
+    @property
+    def indices(self):
+        """Diccionario id original -> índice denso (el de la tabla de ids)."""
+        return self.tabla.indices
+
+    @property
+    def num_aristas(self):
+        """Número de aristas almacenadas (cada arista no dirigida cuenta dos veces)."""
+        return len(self.destinos)
+
+    def indice(self, nodo):
+        """
+        Retorna el índice denso del nodo original `nodo`.
+
+        :param nodo: Identificador original del nodo.
+        :return: int con el índice del nodo dentro de los arreglos CSR.
+
+        Excepciones:
+        - Lanza ValueError si el nodo no existe en el grafo.
+        """
+        return self.tabla.indice(nodo)
+
+    def vecinos(self, nodo):
+        """
+        Retorna la lista de tuplas `(destino, peso)` de las aristas salientes del nodo original `nodo`.
+
+        Pensado para inspección; los algoritmos recorren directamente los arreglos.
+        """
+        i = self.indice(nodo)
+        inicio, fin = self.offsets[i], self.offsets[i + 1]
+        pesos = self.pesos
+        return [(self.ids[self.destinos[k]], pesos[k] if pesos is not None else None) for k in range(inicio, fin)]
+
+    @property
+    def congelado(self):
+        """True si el grafo ya fue congelado con `congelar()`."""
+        return self.version is not None
+
+    @property
+    def tipo_pesos(self):
+        """Código de tipo de `array` de los pesos ('q' enteros, 'd' flotantes), o None si no es ponderado."""
+        if self.pesos is None:
+            return None
+        return getattr(self.pesos, "typecode", None) or self.pesos.format
+
+    def congelar(self):
+        """
+        Congela el grafo: sus arreglos pasan a ser vistas de solo lectura y recibe un sello de versión único.
+
+        Un grafo congelado es el "grafo validado" que conviene reutilizar entre consultas: ya se validó al
+        construirlo, no puede modificarse, y su `version` permite a los índices o cachés derivados (por ejemplo,
+        de landmarks) comprobar que corresponden a este mismo grafo.
+
+        :return: El mismo grafo, para poder encadenar `GrafoCSR.desde_ponderado(grafo).congelar()`.
+        """
+        if self.version is None:
+            self.offsets = memoryview(self.offsets).toreadonly()
+            self.destinos = memoryview(self.destinos).toreadonly()
+            if self.pesos is not None:
+                self.pesos = memoryview(self.pesos).toreadonly()
+            self.version = next(_versiones)
+            if self._transpuesto is not None and self._transpuesto is not self:
+                self._transpuesto.congelar()
+        return self
+
+    def transpuesto(self):
+        """
+        Retorna el grafo con todas las aristas invertidas, compartiendo la tabla de ids.
+
+        Un grafo no dirigido es su propio transpuesto. El resultado se guarda para no reconstruirlo en cada
+        consulta (por ejemplo, en las búsquedas bidireccionales).
+
+        :return: GrafoCSR dirigido con la arista j -> i por cada arista i -> j.
+        """
+        if not self.dirigido:
+            return self
+        if self._transpuesto is None:
+            n = len(self)
+            offsets, destinos, pesos = self.offsets, self.destinos, self.pesos
+            grados = array('q', bytes(8 * n))
+            for j in destinos:
+                grados[j] += 1
+            offsets_t = _acumular(grados)
+            cursor = array('q', offsets_t[:-1])
+            destinos_t = array('q', bytes(8 * len(destinos)))
+            pesos_t = array(self.tipo_pesos, bytes(pesos.itemsize * len(pesos))) if pesos is not None else None
+            for i in range(n):
+                for k in range(offsets[i], offsets[i + 1]):
+                    j = destinos[k]
+                    destinos_t[cursor[j]] = i
+                    if pesos_t is not None:
+                        pesos_t[cursor[j]] = pesos[k]
+                    cursor[j] += 1
+            self._transpuesto = GrafoCSR(offsets_t, destinos_t, pesos_t, self.tabla, dirigido=True,
+                                         peso_max=self.peso_max)
+            if self.congelado:
+                self._transpuesto.congelar()
+        return self._transpuesto
+
+    def guardar(self, ruta):
+        """
+        Escribe el grafo en un archivo binario que `cargar` puede mapear a memoria sin copiarlo.
+
+        El archivo contiene una firma, un encabezado (n, m, si es dirigido, el tipo de los pesos y el peso máximo)
+        y luego los arreglos offsets, destinos, pesos e ids tal como están en memoria, con enteros de 64 bits (y
+        flotantes dobles para pesos no enteros) en el orden de bytes de la máquina.
+
+        Excepciones:
+        - Lanza ValueError si algún id de nodo no es un entero de 64 bits con signo.
+
+        :param ruta: Ruta del archivo a escribir.
+        """
+        try:
+            ids = array('q', self.ids)
+        except (TypeError, OverflowError):
+            raise ValueError("Los ids de los nodos deben ser enteros de 64 bits para guardar el grafo.") from None
+        encabezado = array('q', [_MARCA_ORDEN, len(self), self.num_aristas, int(self.dirigido),
+                                 _CODIGOS_PESOS[self.tipo_pesos]])
+        peso_max = array(self.tipo_pesos or 'q', [self.peso_max or 0])
+        with open(ruta, 'wb') as archivo:
+            archivo.write(_FIRMA)
+            for arreglo in (encabezado, peso_max, self.offsets, self.destinos, self.pesos, ids):
+                if arreglo is not None:
+                    archivo.write(memoryview(arreglo).cast('B'))
+
+    @classmethod
+    def cargar(cls, ruta):
+        """
+        Carga un grafo escrito con `guardar`, mapeando el archivo a memoria (`mmap`) en lugar de leerlo.
+
+        Los arreglos del grafo son vistas de solo lectura sobre el mapa, así que la carga no copia ni recorre las
+        aristas y tarda lo mismo para cualquier tamaño de grafo; las páginas se leen del disco a medida que los
+        algoritmos las usan. Varios procesos que carguen el mismo archivo comparten una única copia en la caché de
+        páginas del sistema. El diccionario id -> índice se arma recién la primera vez que se busca un nodo por
+        su id.
+
+        Condiciones Posteriores:
+        - El grafo retornado está congelado (ver `congelar`). Su contenido no se vuelve a validar: se confía en
+          que el archivo fue escrito por `guardar` a partir de un grafo ya validado.
+
+        Excepciones:
+        - Lanza ValueError si el archivo no es un grafo escrito con `guardar`, si está truncado o si fue escrito
+          en una máquina con otro orden de bytes.
+
+        :param ruta: Ruta del archivo.
+        :return: GrafoCSR congelado cuyos arreglos están mapeados desde el archivo.
+        """
+        with open(ruta, 'rb') as archivo:
+            try:
+                mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # Archivo vacío
+                raise ValueError(f"El archivo {ruta} no es un grafo guardado.") from None
+        vista = memoryview(mapa)
+        if len(vista) < _TAMANO_ENCABEZADO or bytes(vista[:len(_FIRMA)]) != _FIRMA:
+            raise ValueError(f"El archivo {ruta} no es un grafo guardado.")
+        marca, n, m, dirigido, codigo_pesos = vista[len(_FIRMA):_TAMANO_ENCABEZADO - 8].cast('q')
+        if marca != _MARCA_ORDEN:
+            raise ValueError(f"El grafo {ruta} fue guardado en una máquina con otro orden de bytes.")
+        tipo_pesos = {codigo: tipo for tipo, codigo in _CODIGOS_PESOS.items()}.get(codigo_pesos, 'x')
+        if tipo_pesos == 'x' or len(vista) != _TAMANO_ENCABEZADO + 8 * ((n + 1) + m + (m if tipo_pesos else 0) + n):
+            raise ValueError(f"El grafo {ruta} está incompleto o dañado.")
+
+        posicion = _TAMANO_ENCABEZADO
+
+        def siguiente(cantidad, tipo):
+            nonlocal posicion
+            arreglo = vista[posicion:posicion + 8 * cantidad].cast(tipo)
+            posicion += 8 * cantidad
+            return arreglo
+
+        offsets = siguiente(n + 1, 'q')
+        destinos = siguiente(m, 'q')
+        pesos = siguiente(m, tipo_pesos) if tipo_pesos else None
+        ids = siguiente(n, 'q')
+        # El peso máximo viene en el encabezado, así que la carga sigue sin recorrer los pesos
+        peso_max = vista[_TAMANO_ENCABEZADO - 8:_TAMANO_ENCABEZADO].cast(tipo_pesos)[0] if tipo_pesos else None
+        return cls(offsets, destinos, pesos, _TablaIdsMapeada(ids), dirigido=bool(dirigido),
+                   peso_max=peso_max).congelar()
+
+    @classmethod
+    def desde_aristas(cls, aristas):
+        """
+        Construye un grafo no dirigido a partir de una lista de aristas `(Nodo1, Nodo2, Peso)` como la que recibe
+        `kruskal`. Cada arista se almacena en ambos sentidos.
+
+        Excepciones:
+        - Lanza ValueError si la lista no cumple las condiciones de `kruskal`: no es una lista, alguna arista no es
+          una tupla de tres enteros, o algún nodo o peso no es positivo.
+
+        :param aristas: list
+            Lista de tuplas (Nodo1, Nodo2, Peso).
+        :return: GrafoCSR no dirigido con pesos enteros.
+        """
+        if not isinstance(aristas, list):
+            raise ValueError("El grafo debe ser una lista.")
+
+        tabla = TablaIds()
+        grados = array('q')
+        for arista in aristas:
+            if not isinstance(arista, tuple) or len(arista) != 3:
+                raise ValueError("Cada arista debe ser una tupla (Nodo1, Nodo2, Peso).")
+            if not all(isinstance(x, int) for x in arista):
+                raise ValueError("Cada elemento de la arista debe ser un número entero.")
+            nodo1, nodo2, peso = arista
+            if nodo1 <= 0 or nodo2 <= 0 or peso < 0:
+                raise ValueError("Los nodos y el peso deben ser enteros positivos.")
+            for nodo in (nodo1, nodo2):
+                i = tabla.internar(nodo)
+                if i == len(grados):
+                    grados.append(0)
+                grados[i] += 1
+
+        offsets = _acumular(grados)
+        # Posición de escritura de la siguiente arista de cada nodo
+        cursor = array('q', offsets[:-1])
+        m = offsets[-1]
+        destinos = array('q', bytes(8 * m))
+        pesos = array('q', bytes(8 * m))
+        indices = tabla.indices
+        for nodo1, nodo2, peso in aristas:
+            i, j = indices[nodo1], indices[nodo2]
+            destinos[cursor[i]] = j
+            pesos[cursor[i]] = peso
+            cursor[i] += 1
+            destinos[cursor[j]] = i
+            pesos[cursor[j]] = peso
+            cursor[j] += 1
+
+        return cls(offsets, destinos, pesos, tabla, dirigido=False)
+
+    @classmethod
+    def desde_arreglos(cls, origenes, destinos, pesos, ids, dirigido=True):
+        """
+        Construye un grafo a partir de sus aristas ya internadas, dadas como arreglos paralelos de índices densos,
+        ordenándolas por origen en O(n + m) (conteo de grados y suma prefija). Es el paso final de los lectores
+        por lotes de `lectura_aristas`, que acumulan las aristas en arreglos en lugar de tuplas.
+
+        Condiciones Previas:
+        - Los índices de `origenes` y `destinos` deben estar dentro del rango [0, len(ids) - 1]. No se validan.
+
+        :param origenes: array con el índice del origen de cada arista.
+        :param destinos: array con el índice del destino de cada arista.
+        :param pesos: array con el peso de cada arista, o None.
+        :param ids: TablaIds (o iterable) con los identificadores originales.
+        :param dirigido: Si es False, cada arista se almacena en ambos sentidos, como en `desde_aristas`.
+        :return: GrafoCSR.
+        """
+        tabla = ids if isinstance(ids, TablaIds) else TablaIds(ids)
+        n = len(tabla)
+        grados = array('q', bytes(8 * n))
+        for i in origenes:
+            grados[i] += 1
+        if not dirigido:
+            for j in destinos:
+                grados[j] += 1
+
+        offsets = _acumular(grados)
+        cursor = array('q', offsets[:-1])
+        m = offsets[-1]
+        destinos_csr = array('q', bytes(8 * m))
+        pesos_csr = array(pesos.typecode, bytes(pesos.itemsize * m)) if pesos is not None else None
+        for k in range(len(origenes)):
+            i, j = origenes[k], destinos[k]
+            destinos_csr[cursor[i]] = j
+            if pesos_csr is not None:
+                pesos_csr[cursor[i]] = pesos[k]
+            cursor[i] += 1
+            if not dirigido:
+                destinos_csr[cursor[j]] = i
+                if pesos_csr is not None:
+                    pesos_csr[cursor[j]] = pesos[k]
+                cursor[j] += 1
+
+        return cls(offsets, destinos_csr, pesos_csr, tabla, dirigido=dirigido)
+
+    @classmethod
+    def desde_adyacencia(cls, grafo):
+        """
+        Construye un grafo no ponderado a partir de un diccionario de listas de adyacencia como el que recibe
+        `contiene_ciclo`. Las listas se copian tal cual, por lo que un grafo simétrico queda almacenado en ambos
+        sentidos.
+
+        Excepciones:
+        - Lanza ValueError si el diccionario no cumple las condiciones de `contiene_ciclo`: no es un diccionario,
+          las claves o vecinos no son enteros positivos, o hay conexiones a nodos inexistentes.
+
+        :param grafo: dict
+            Diccionario {nodo: [vecinos]}.
+        :return: GrafoCSR no dirigido y sin pesos.
+        """
+        if not isinstance(grafo, dict):
+            raise ValueError("El grafo debe ser un diccionario.")
+
+        tabla = TablaIds(grafo)
+        indices = tabla.indices
+        grados = array('q')
+        for nodo, vecinos in grafo.items():
+            if not isinstance(nodo, int) or nodo <= 0:
+                raise ValueError("Las claves del grafo deben ser enteros positivos.")
+            if not all(isinstance(vecino, int) and vecino > 0 for vecino in vecinos):
+                raise ValueError("Las listas de adyacencia deben contener solo enteros positivos.")
+            grados.append(len(vecinos))
+
+        offsets = _acumular(grados)
+        destinos = array('q')
+        for vecinos in grafo.values():
+            try:
+                destinos.extend(indices[vecino] for vecino in vecinos)
+            except KeyError:
+                raise ValueError("El grafo contiene conexiones a nodos inexistentes.") from None
+
+        return cls(offsets, destinos, None, tabla, dirigido=False)
+
+    @classmethod
+    def desde_ponderado(cls, grafo):
+        """
+        Construye un grafo dirigido a partir de un diccionario de listas de tuplas `(destino, peso)` como el que
+        recibe `dijkstra`. Los destinos que no aparecen como claves se agregan como nodos sin aristas salientes.
+
+        Excepciones:
+        - Lanza ValueError si el diccionario no cumple las condiciones de `validar_grafo` (sin contar el nodo de
+          inicio).
+
+        :param grafo: dict
+            Diccionario {nodo: [(destino, peso)]}.
+        :return: GrafoCSR dirigido; los pesos se guardan como enteros si todos lo son, o como flotantes si no.
+        """
+        if not isinstance(grafo, dict):
+            raise ValueError("El grafo debe ser un diccionario.")
+
+        tabla = TablaIds(grafo)
+        grados = array('q')
+        solo_enteros = True
+        for origen, aristas in grafo.items():
+            if not isinstance(origen, int) or origen <= 0:
+                raise ValueError(f"Las llaves del grafo deben ser enteros positivos. Error en el nodo: {origen}")
+            if not isinstance(aristas, list):
+                raise ValueError(f"Las aristas de cada nodo deben estar en una lista. Error en el nodo: {origen}")
+
+            destinos_vistos = set()
+            for elemento in aristas:
+                if not isinstance(elemento, tuple) or len(elemento) != 2:
+                    raise ValueError(
+                        f"Cada arista debe ser una tupla de 2 elementos (destino, peso). Error en la arista: ({origen}, {elemento})")
+                destino, peso = elemento
+                if not isinstance(destino, int) or destino <= 0:
+                    raise ValueError(f"El destino debe ser un entero positivo. Error en la arista: ({origen}, {destino})")
+                if not isinstance(peso, (int, float)) or peso < 0:
+                    raise ValueError(
+                        f"El peso de la arista debe ser un número no negativo. Error en la arista: ({origen}, {destino}, {peso})")
+                if destino in destinos_vistos:
+                    raise ValueError(f"Existen múltiples aristas del nodo {origen} al nodo {destino}.")
+                destinos_vistos.add(destino)
+                solo_enteros = solo_enteros and isinstance(peso, int)
+            grados.append(len(aristas))
+
+        offsets = _acumular(grados)
+        destinos = array('q')
+        pesos = array('q' if solo_enteros else 'd')
+        for aristas in grafo.values():
+            for destino, peso in aristas:
+                j = tabla.internar(destino)
+                if j == len(offsets) - 1:
+                    # Destino sin lista propia: se agrega como nodo sin aristas salientes
+                    offsets.append(offsets[-1])
+                destinos.append(j)
+                pesos.append(peso)
+
+        return cls(offsets, destinos, pesos, tabla, dirigido=True)
+
+
+class _TablaIdsMapeada(TablaIds):
+    """
+    `TablaIds` de solo lectura sobre los ids de un grafo cargado con `GrafoCSR.cargar`. El diccionario inverso
+    id -> índice se arma la primera vez que se usa, para que cargar un grafo no dependa de su tamaño.
+    """
+
+    def __init__(self, ids):
+        self.ids = ids
+        self._indices = None
+
+    @property
+    def indices(self):
+        if self._indices is None:
+            self._indices = dict(zip(self.ids, range(len(self.ids))))
+        return self._indices
+
+
+def _acumular(grados):
+    """Convierte un arreglo de grados en el arreglo de offsets CSR (suma prefija con un 0 inicial)."""
+    offsets = array('q', [0])
+    total = 0
+    for grado in grados:
+        total += grado
+        offsets.append(total)
+    return offsets
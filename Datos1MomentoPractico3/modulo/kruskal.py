@@ -1,8 +1,20 @@
+import heapq
+from array import array
+
+from modulo.estadisticas import _fase
+from modulo.grafo_csr import GrafoCSR
+from modulo.tabla_ids import TablaIds
+
+
 class UnionFind:
     """
     Implementa la estructura de datos Union-Find (Disjoint Set Union - DSU) con optimizaciones.
     Permite gestionar conjuntos disjuntos de nodos y realizar las operaciones de unión y búsqueda.
 
+    Los padres y tamaños se guardan en arreglos compactos de enteros (`array`), la búsqueda es iterativa con
+    división de caminos a la mitad (path halving) y la unión se hace por tamaño, por lo que ninguna operación
+    depende del límite de recursión de Python.
+
     :param n: El número de nodos (enteros positivos) en el conjunto.
         - n debe ser un entero positivo que representa la cantidad de nodos.
 
@@ -10,18 +22,22 @@ class UnionFind:
 
     Condiciones Previas:
     - n debe ser un entero positivo.
+
+    Condiciones Posteriores:
+    - `components` mantiene el número de conjuntos disjuntos actuales.
     """
 
     def __init__(self, n):
         if n <= 0:
             raise ValueError("El número de nodos debe ser un entero positivo.")
-        self.parent = list(range(n))
-        self.rank = [0] * n
+        self.parent = array('q', range(n))
+        self.size = array('q', [1]) * n
+        self.components = n
 
     def find(self, x):
         """
         Encuentra el representante (raíz) del conjunto al que pertenece el nodo x,
-        con compresión de caminos para mejorar la eficiencia.
+        con compresión de caminos (path halving) para mejorar la eficiencia.
 
         :param x: Nodo del cual se quiere encontrar el representante.
         :return: El índice del representante del conjunto que contiene a x.
@@ -29,14 +45,16 @@ class UnionFind:
         Condiciones Previas:
         - x debe ser un entero dentro del rango [0, n-1].
         """
-        if self.parent[x] != x:
-            # Comprimir el camino durante la búsqueda
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
+        parent = self.parent
+        while parent[x] != x:
+            # Cada nodo del camino pasa a apuntar a su abuelo
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
 
     def union(self, x, y):
         """
-        Une los conjuntos de los nodos x y y utilizando la técnica de unión por rango.
+        Une los conjuntos de los nodos x y y utilizando la técnica de unión por tamaño.
 
         :param x: Nodo 1 a unir.
         :param y: Nodo 2 a unir.
@@ -49,26 +67,193 @@ class UnionFind:
         rootX = self.find(x)
         rootY = self.find(y)
 
-        if rootX != rootY:
-            # Unión por rango: el conjunto con menor altura se convierte en hijo del conjunto con mayor altura
-            if self.rank[rootX] > self.rank[rootY]:
-                self.parent[rootY] = rootX
-            elif self.rank[rootX] < self.rank[rootY]:
-                self.parent[rootX] = rootY
-            else:
-                self.parent[rootY] = rootX
-                self.rank[rootX] += 1
-            return True
-        return False
+        if rootX == rootY:
+            return False
+
+        # Unión por tamaño: el conjunto más pequeño se cuelga del más grande
+        size = self.size
+        if size[rootX] < size[rootY]:
+            rootX, rootY = rootY, rootX
+        self.parent[rootY] = rootX
+        size[rootX] += size[rootY]
+        self.components -= 1
+        return True
 
+    def agregar(self):
+        """
+        Agrega un nodo nuevo, en un conjunto propio, y retorna su índice (el anterior `n`).
+
+        Permite usar la estructura cuando los nodos llegan de a poco, como en `DetectorCiclos`.
+        """
+        indice = len(self.parent)
+        self.parent.append(indice)
+        self.size.append(1)
+        self.components += 1
+        return indice
+
+    def find_many(self, nodos):
+        """
+        Encuentra el representante de cada nodo de una secuencia en una sola llamada.
+
+        :param nodos: Secuencia de enteros dentro del rango [0, n-1].
+        :return: array de enteros con el representante de cada nodo, en el mismo orden.
+        """
+        parent = self.parent
+        raices = array('q', bytes(8 * len(nodos)))
+        for i, x in enumerate(nodos):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            raices[i] = x
+        return raices
 
-def kruskal(grafo):
+    def union_many(self, xs, ys):
+        """
+        Une por pares los nodos de dos secuencias de igual longitud (por ejemplo, los extremos de un lote de
+        aristas).
+
+        :param xs: Secuencia de enteros dentro del rango [0, n-1].
+        :param ys: Secuencia de enteros dentro del rango [0, n-1], de la misma longitud que `xs`.
+        :return: bytearray con 1 en las posiciones cuyo par unió dos conjuntos distintos y 0 en las demás.
+
+        Excepciones:
+        - Lanza ValueError si las secuencias tienen longitudes distintas.
+        """
+        if len(xs) != len(ys):
+            raise ValueError("Las secuencias de nodos a unir deben tener la misma longitud.")
+
+        parent, size = self.parent, self.size
+        unidos = bytearray(len(xs))
+        componentes = self.components
+        for i in range(len(xs)):
+            x, y = xs[i], ys[i]
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            while parent[y] != y:
+                parent[y] = parent[parent[y]]
+                y = parent[y]
+            if x == y:
+                continue
+            if size[x] < size[y]:
+                x, y = y, x
+            parent[y] = x
+            size[x] += size[y]
+            componentes -= 1
+            unidos[i] = 1
+        self.components = componentes
+        return unidos
+
+    def component_size(self, x):
+        """
+        Retorna el número de nodos del conjunto que contiene a x.
+
+        :param x: Nodo dentro del rango [0, n-1].
+        :return: int con el tamaño del conjunto.
+        """
+        return self.size[self.find(x)]
+
+
+class UnionFindInstrumentado(UnionFind):
+    """
+    `UnionFind` que registra sus operaciones en un objeto `Estadisticas`, para medir el costo real de la
+    compresión de caminos sin tocar la clase base (que no paga ningún costo por las mediciones).
+
+    Contadores registrados:
+    - "busquedas": llamadas a `find`, incluidas las de `union`.
+    - "pasos_busqueda": total de saltos hacia el padre en esas búsquedas (la longitud de los caminos recorridos).
+    - "camino_maximo": el camino más largo recorrido en una búsqueda.
+    - "uniones" y "uniones_redundantes": llamadas a `union` que unieron dos conjuntos o que no lo hicieron.
+
+    `find_many` y `union_many` se resuelven con `find` y `union`, así que sus operaciones también se cuentan.
+
+    :param n: El número de nodos, como en `UnionFind`.
+    :param estadisticas: `Estadisticas` donde se acumulan los contadores.
+    """
+
+    def __init__(self, n, estadisticas):
+        super().__init__(n)
+        self.estadisticas = estadisticas
+
+    def find(self, x):
+        parent = self.parent
+        pasos = 0
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+            pasos += 1
+        estadisticas = self.estadisticas
+        estadisticas.sumar("busquedas")
+        estadisticas.sumar("pasos_busqueda", pasos)
+        estadisticas.maximo("camino_maximo", pasos)
+        return x
+
+    def union(self, x, y):
+        unido = super().union(x, y)
+        self.estadisticas.sumar("uniones" if unido else "uniones_redundantes")
+        return unido
+
+    def find_many(self, nodos):
+        return array('q', [self.find(x) for x in nodos])
+
+    def union_many(self, xs, ys):
+        if len(xs) != len(ys):
+            raise ValueError("Las secuencias de nodos a unir deben tener la misma longitud.")
+        return bytearray(self.union(x, y) for x, y in zip(xs, ys))
+
+
+class _IteradorContado:
+    """Envuelve un iterable y cuenta los elementos consumidos, para saber cuántas aristas revisó `kruskal`."""
+
+    def __init__(self, iterable):
+        self.iterador = iter(iterable)
+        self.cantidad = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        valor = next(self.iterador)
+        self.cantidad += 1
+        return valor
+
+
+def validar_arista(arista):
+    """
+    Valida una arista con las reglas de `kruskal`.
+
+    :param arista: Tupla (Nodo1, Nodo2, Peso).
+    :return: La misma arista, para poder desempaquetarla directamente.
+
+    Lanza:
+    - ValueError si la arista no es una tupla de tres enteros o si algún nodo o el peso no es positivo.
+    """
+    if not isinstance(arista, tuple) or len(arista) != 3:
+        raise ValueError("Cada arista debe ser una tupla (Nodo1, Nodo2, Peso).")
+    if not all(isinstance(x, int) for x in arista):
+        raise ValueError("Cada elemento de la arista debe ser un número entero.")
+    nodo1, nodo2, peso = arista
+    if nodo1 <= 0 or nodo2 <= 0 or peso < 0:
+        raise ValueError("Los nodos y el peso deben ser enteros positivos.")
+    return arista
+
+
+def kruskal(grafo, modo="ordenado", estadisticas=None):
     """
     Implementa el algoritmo de Kruskal para encontrar el Árbol Generador Mínimo (AGM) de un grafo no dirigido ponderado.
 
     :param grafo: Lista de tuplas (Nodo1, Nodo2, Peso), cada tupla representa una arista.
         - El grafo es no dirigido, es decir, (Nodo1, Nodo2, Peso) es equivalente a (Nodo2, Nodo1, Peso).
         - Las aristas deben estar ponderadas con un valor numérico entero no negativo.
+        - También se acepta un `GrafoCSR`; si no es dirigido, cada arista se considera una sola vez.
+    :param modo: Estrategia para recorrer las aristas en orden de peso.
+        - "ordenado": ordena una copia de todas las aristas (O(m log m)).
+        - "heap": construye un heap en O(m) y extrae aristas solo hasta que el árbol está completo, de modo que
+          las aristas que sobran nunca se ordenan. Ambos modos retornan exactamente el mismo árbol.
+    :param estadisticas: `Estadisticas` opcional donde se registran los tiempos de las fases "validacion",
+        "ordenamiento" y "union", el contador "aristas_revisadas" (aristas recorridas hasta completar el árbol) y
+        los contadores de `UnionFindInstrumentado`. En el modo "heap" el heap se construye y se consume durante
+        la fase "union".
 
     :return: Lista de tuplas (Nodo1, Nodo2, Peso) que representan las aristas del Árbol Generador Mínimo.
 
@@ -77,14 +262,24 @@ def kruskal(grafo):
         - No es una lista.
         - Alguna tupla no tiene tres elementos.
         - Los nodos o el peso no son enteros o son negativos.
+        - Algún nodo no es menor que 2**64 (los nodos se internan como enteros sin signo de 64 bits).
         - El grafo no es conexo.
+    - ValueError si el modo no es "ordenado" ni "heap".
 
     Condiciones Previas:
-    - El grafo debe ser conexo y estar representado como una lista de aristas con nodos numerados a partir de 1.
+    - El grafo debe ser conexo y estar representado como una lista de aristas cuyos nodos son enteros positivos
+      (no es necesario que sean consecutivos; se internan en índices densos con `TablaIds`).
 
     Condiciones Posteriores:
     - Se retorna una lista de aristas que forman el Árbol Generador Mínimo.
+    - La lista recibida no se modifica.
     """
+    if modo not in ("ordenado", "heap"):
+        raise ValueError("El modo debe ser \"ordenado\" o \"heap\".")
+
+    if isinstance(grafo, GrafoCSR):
+        return _kruskal_csr(grafo, modo, estadisticas)
+
     # Validación del formato del grafo
     if not isinstance(grafo, list):
         raise ValueError("El grafo debe ser una lista.")
@@ -92,23 +287,19 @@ def kruskal(grafo):
     if len(grafo) == 0:
         return []
 
-    # Validar que todas las aristas son tuplas de tres elementos
-    for arista in grafo:
-        if not isinstance(arista, tuple) or len(arista) != 3:
-            raise ValueError("Cada arista debe ser una tupla (Nodo1, Nodo2, Peso).")
-        if not all(isinstance(x, int) for x in arista):
-            raise ValueError("Cada elemento de la arista debe ser un número entero.")
-        nodo1, nodo2, peso = arista
-        if nodo1 <= 0 or nodo2 <= 0 or peso < 0:
-            raise ValueError("Los nodos y el peso deben ser enteros positivos.")
+    # Validar que todas las aristas son tuplas de tres elementos e internar sus nodos en índices densos,
+    # de modo que los identificadores no necesitan ser consecutivos
+    tabla = TablaIds(tipo='Q')
+    with _fase(estadisticas, "validacion"):
+        try:
+            for arista in grafo:
+                nodo1, nodo2, _ = validar_arista(arista)
+                tabla.internar(nodo1)
+                tabla.internar(nodo2)
+        except OverflowError:
+            raise ValueError(f"Los nodos deben ser menores que 2**64. Error en la arista: {arista}") from None
 
-    # Determinar el número total de nodos a partir de las aristas
-    nodos = set()
-    for nodo1, nodo2, _ in grafo:
-        nodos.add(nodo1)
-        nodos.add(nodo2)
-
-    n = len(nodos)  # Número de nodos distintos en el grafo
+    n = len(tabla)  # Número de nodos distintos en el grafo
 
     # Si el grafo tiene solo un nodo, no necesita aristas
     if n == 1:
@@ -119,19 +310,204 @@ def kruskal(grafo):
         raise ValueError("El grafo no es conexo, no se puede obtener un Árbol Generador Mínimo.")
 
     # Crear el objeto Union-Find
-    uf = UnionFind(n)
+    uf = UnionFind(n) if estadisticas is None else UnionFindInstrumentado(n, estadisticas)
 
-    # Ordenar las aristas por peso (de menor a mayor)
-    grafo.sort(key=lambda x: x[2])
+    # Recorrer las aristas por peso (de menor a mayor) sin modificar la lista original
+    with _fase(estadisticas, "ordenamiento"):
+        if modo == "ordenado":
+            aristas = sorted(grafo, key=lambda x: x[2])
+        else:
+            aristas = (grafo[k] for k in _posiciones_por_peso([arista[2] for arista in grafo]))
+    if estadisticas is not None:
+        aristas = _IteradorContado(aristas)
 
+    indices = tabla.indices
     resultado = []
-    for nodo1, nodo2, peso in grafo:
-        # Usar Union-Find para agregar las aristas sin formar ciclos
-        if uf.union(nodo1 - 1, nodo2 - 1):  # Restamos 1 porque los nodos son positivos
-            resultado.append((nodo1, nodo2, peso))
+    with _fase(estadisticas, "union"):
+        for nodo1, nodo2, peso in aristas:
+            # Usar Union-Find para agregar las aristas sin formar ciclos
+            if uf.union(indices[nodo1], indices[nodo2]):
+                resultado.append((nodo1, nodo2, peso))
+                if uf.components == 1:  # El árbol ya está completo; el resto de aristas formaría ciclos
+                    break
+    if estadisticas is not None:
+        estadisticas.sumar("aristas_revisadas", aristas.cantidad)
 
     # Verificar si el grafo es conexo
     if len(resultado) != n - 1:
         raise ValueError("El grafo no es conexo, no se puede obtener un Árbol Generador Mínimo.")
 
     return resultado
+
+
+def prim_dense(matriz):
+    """
+    Calcula el Árbol Generador Mínimo de un grafo denso dado como matriz de distancias, con el algoritmo de Prim
+    en su versión O(n²) sobre matriz de adyacencia.
+
+    Pensado para grafos completos o casi completos (por ejemplo, matrices de distancias), donde la lista de aristas
+    que recibe `kruskal` tendría O(n²) tuplas. Aquí nunca se construyen tuplas de aristas: en cada paso se
+    actualiza la distancia de cada nodo al árbol con la fila del último nodo agregado. Si la matriz es un arreglo
+    de NumPy, ese paso se hace de forma vectorizada.
+
+    :param matriz: Matriz cuadrada n x n (lista de listas o arreglo de NumPy) con el peso de la arista entre los
+        nodos i+1 y j+1 en la posición [i][j].
+        - Los pesos deben ser números no negativos; `float('inf')` indica que no hay arista.
+        - La diagonal se ignora.
+
+    :return: Lista de tuplas (Nodo1, Nodo2, Peso) del Árbol Generador Mínimo, con nodos numerados a partir de 1,
+        en el orden en que Prim agrega cada nodo (Nodo1 ya está en el árbol, Nodo2 es el nodo agregado).
+
+    Lanza:
+    - ValueError si la matriz no es cuadrada, si algún peso no es un número no negativo o si el grafo no es conexo.
+
+    Condiciones Previas:
+    - La matriz debe ser simétrica; solo se consulta la fila del nodo que se agrega al árbol.
+
+    Condiciones Posteriores:
+    - Ante empates, se agrega primero el nodo de menor índice, tanto con listas como con NumPy.
+    """
+    if hasattr(matriz, "shape"):
+        return _prim_dense_numpy(matriz)
+
+    n = len(matriz)
+    for fila in matriz:
+        if len(fila) != n:
+            raise ValueError("La matriz de distancias debe ser cuadrada.")
+        if not all(isinstance(peso, (int, float)) and peso >= 0 for peso in fila):
+            raise ValueError("Los pesos de la matriz deben ser números no negativos.")
+    if n <= 1:
+        return []
+
+    infinito = float('inf')
+    en_arbol = [False] * n
+    en_arbol[0] = True
+    mejor = list(matriz[0])  # Distancia de cada nodo al árbol
+    mejor[0] = infinito
+    padre = [0] * n
+
+    resultado = []
+    for _ in range(n - 1):
+        # Los nodos del árbol tienen distancia infinita, así que nunca se vuelven a elegir
+        nodo = min(range(n), key=mejor.__getitem__)
+        if mejor[nodo] == infinito:
+            raise ValueError("El grafo no es conexo, no se puede obtener un Árbol Generador Mínimo.")
+        resultado.append((padre[nodo] + 1, nodo + 1, matriz[padre[nodo]][nodo]))
+        en_arbol[nodo] = True
+        mejor[nodo] = infinito
+
+        for vecino, peso in enumerate(matriz[nodo]):
+            if peso < mejor[vecino] and not en_arbol[vecino]:
+                mejor[vecino] = peso
+                padre[vecino] = nodo
+
+    return resultado
+
+
+def _prim_dense_numpy(matriz):
+    """Versión vectorizada de `prim_dense` para arreglos de NumPy: cada paso opera sobre filas completas."""
+    import numpy as np
+
+    if matriz.ndim != 2 or matriz.shape[0] != matriz.shape[1]:
+        raise ValueError("La matriz de distancias debe ser cuadrada.")
+    if not np.issubdtype(matriz.dtype, np.number) or np.isnan(matriz).any() or (matriz < 0).any():
+        raise ValueError("Los pesos de la matriz deben ser números no negativos.")
+    n = matriz.shape[0]
+    if n <= 1:
+        return []
+
+    en_arbol = np.zeros(n, dtype=bool)
+    en_arbol[0] = True
+    mejor = matriz[0].astype(np.float64)
+    mejor[0] = np.inf
+    padre = np.zeros(n, dtype=np.int64)
+
+    resultado = []
+    for _ in range(n - 1):
+        nodo = int(np.argmin(mejor))
+        if mejor[nodo] == np.inf:
+            raise ValueError("El grafo no es conexo, no se puede obtener un Árbol Generador Mínimo.")
+        origen = int(padre[nodo])
+        resultado.append((origen + 1, nodo + 1, matriz[origen, nodo].item()))
+        en_arbol[nodo] = True
+        mejor[nodo] = np.inf
+
+        fila = matriz[nodo]
+        mejora = (fila < mejor) & ~en_arbol
+        mejor[mejora] = fila[mejora]
+        padre[mejora] = nodo
+
+    return resultado
+
+
+def _posiciones_por_peso(pesos):
+    """
+    Genera perezosamente las posiciones de `pesos` en orden creciente de peso, desempatando por posición (igual
+    que un ordenamiento estable). El heap se construye en O(m) y cada extracción cuesta O(log m), así que quien
+    deja de consumir el generador no paga por ordenar las aristas restantes.
+
+    Con pesos enteros cada entrada del heap es un solo entero `peso * m + posición`, más compacto y rápido de
+    comparar que una tupla.
+    """
+    m = len(pesos)
+    if all(isinstance(peso, int) for peso in pesos):
+        heap = [peso * m + k for k, peso in enumerate(pesos)]
+        heapq.heapify(heap)
+        while heap:
+            yield heapq.heappop(heap) % m
+    else:
+        heap = [(peso, k) for k, peso in enumerate(pesos)]
+        heapq.heapify(heap)
+        while heap:
+            yield heapq.heappop(heap)[1]
+
+
+def _kruskal_csr(grafo, modo="ordenado", estadisticas=None):
+    """
+    Kruskal sobre un `GrafoCSR`. Las aristas se ordenan como índices sobre los arreglos CSR, sin construir tuplas
+    intermedias, y el resultado se traduce a los identificadores originales de los nodos.
+    """
+    n = len(grafo)
+    if n <= 1:
+        return []
+
+    offsets, destinos, pesos = grafo.offsets, grafo.destinos, grafo.pesos
+    if pesos is None:
+        raise ValueError("El grafo debe ser ponderado para obtener un Árbol Generador Mínimo.")
+
+    # Origen de cada arista, en el mismo orden que `destinos`. El grafo ya fue validado al construirse, así que la
+    # fase "validacion" no existe aquí
+    origenes = array('q', bytes(8 * len(destinos)))
+    with _fase(estadisticas, "ordenamiento"):
+        for i in range(n):
+            for k in range(offsets[i], offsets[i + 1]):
+                origenes[k] = i
+
+        # En un grafo no dirigido cada arista está dos veces; nos quedamos con el sentido origen < destino
+        if grafo.dirigido:
+            candidatas = range(len(destinos))
+        else:
+            candidatas = [k for k in range(len(destinos)) if origenes[k] < destinos[k]]
+        if modo == "ordenado":
+            en_orden = sorted(candidatas, key=pesos.__getitem__)
+        else:
+            en_orden = (candidatas[k] for k in _posiciones_por_peso([pesos[k] for k in candidatas]))
+    if estadisticas is not None:
+        en_orden = _IteradorContado(en_orden)
+
+    uf = UnionFind(n) if estadisticas is None else UnionFindInstrumentado(n, estadisticas)
+    ids = grafo.ids
+    resultado = []
+    with _fase(estadisticas, "union"):
+        for k in en_orden:
+            if uf.union(origenes[k], destinos[k]):
+                resultado.append((ids[origenes[k]], ids[destinos[k]], pesos[k]))
+                if uf.components == 1:
+                    break
+    if estadisticas is not None:
+        estadisticas.sumar("aristas_revisadas", en_orden.cantidad)
+
+    if len(resultado) != n - 1:
+        raise ValueError("El grafo no es conexo, no se puede obtener un Árbol Generador Mínimo.")
+
+    return resultado
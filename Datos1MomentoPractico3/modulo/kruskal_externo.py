@@ -0,0 +1,155 @@
+import heapq
+import os
+import tempfile
+from array import array
+
+from modulo.kruskal import UnionFind, validar_arista
+from modulo.lectura_aristas import leer_lotes
+from modulo.tabla_ids import TablaIds
+
+# Estimación de los bytes que ocupa en memoria una arista (tupla de tres enteros más su entrada en la lista)
+_BYTES_POR_ARISTA = 120
+# Bytes de una arista en un archivo de corrida: (peso, nodo1, nodo2) como enteros de 64 bits
+_BYTES_POR_ARISTA_EN_DISCO = 24
+# Mayor peso que cabe en una corrida
+_PESO_MAX = 2 ** 63 - 1
+
+
+def kruskal_externo(aristas, memoria_max=64 * 2 ** 20, directorio=None):
+    """
+    Implementa el algoritmo de Kruskal en memoria externa, para listas de aristas que no caben en memoria.
+
+    Las aristas se leen por bloques; cada bloque se ordena por peso y se escribe a disco como una corrida binaria.
+    Luego las corridas se mezclan (mezcla de k vías con `heapq.merge`) y el flujo ordenado alimenta un `UnionFind`.
+    Las aristas del Árbol Generador Mínimo se producen a medida que se aceptan, y la lectura se detiene en cuanto
+    el árbol está completo. Entre aristas de igual peso se prefiere la de nodos internados primero, por lo que con
+    pesos repetidos el árbol puede diferir del de `kruskal` (con el mismo peso total).
+
+    :param aristas: Iterable de tuplas (Nodo1, Nodo2, Peso), o ruta a un archivo de texto con una arista por línea
+        (`nodo1 nodo2 peso`, separados por espacios o comas; se ignoran las líneas vacías y las que empiezan
+        con `#`).
+    :param memoria_max: Presupuesto aproximado de memoria, en bytes, para las aristas en memoria.
+    :param directorio: Directorio donde crear los archivos temporales; por defecto el del sistema.
+
+    :return: Generador de tuplas (Nodo1, Nodo2, Peso) del Árbol Generador Mínimo, en orden creciente de peso.
+
+    Lanza:
+    - ValueError si alguna arista no cumple las condiciones de `kruskal`, si algún peso no es menor que 2**63 (las
+      corridas los guardan como enteros de 64 bits), si el presupuesto de memoria no es positivo o si el grafo no
+      es conexo (esto último, al terminar de consumir el generador).
+
+    Condiciones Previas:
+    - Los nodos distintos (no las aristas) deben caber en memoria, pues el `UnionFind` tiene un elemento por nodo.
+
+    Condiciones Posteriores:
+    - Los archivos temporales se eliminan al agotar o cerrar el generador.
+    """
+    if memoria_max <= 0:
+        raise ValueError("El presupuesto de memoria debe ser un entero positivo.")
+    if isinstance(aristas, (str, os.PathLike)):
+        aristas = leer_aristas_texto(aristas)
+
+    return _kruskal_externo(aristas, max(1, memoria_max // _BYTES_POR_ARISTA), directorio)
+
+
+def kruskal_externo_a_archivo(aristas, salida, memoria_max=64 * 2 ** 20, directorio=None):
+    """
+    Ejecuta `kruskal_externo` y escribe las aristas del Árbol Generador Mínimo en un archivo de texto, una por
+    línea (`nodo1 nodo2 peso`), a medida que se obtienen.
+
+    :param aristas: Iterable de aristas o ruta a un archivo de texto, como en `kruskal_externo`.
+    :param salida: Ruta del archivo de salida.
+    :param memoria_max: Presupuesto aproximado de memoria, en bytes.
+    :param directorio: Directorio para los archivos temporales.
+
+    :return: int con el número de aristas escritas.
+    """
+    total = 0
+    with open(salida, "w", encoding="utf-8") as archivo:
+        for nodo1, nodo2, peso in kruskal_externo(aristas, memoria_max, directorio):
+            archivo.write(f"{nodo1} {nodo2} {peso}\n")
+            total += 1
+    return total
+
+
+def leer_aristas_texto(ruta):
+    """
+    Lee perezosamente un archivo de texto (o gzip) con una arista `nodo1 nodo2 peso` por línea, por lotes de
+    `lectura_aristas.leer_lotes`.
+
+    :param ruta: Ruta del archivo.
+    :return: Generador de tuplas (Nodo1, Nodo2, Peso) de enteros.
+
+    Lanza:
+    - ValueError si alguna línea no tiene exactamente tres enteros, o si algún nodo o peso no es positivo.
+    """
+    for origenes, destinos, pesos in leer_lotes(ruta, solo_enteros=True):
+        yield from zip(origenes, destinos, pesos)
+
+
+def _kruskal_externo(aristas, aristas_por_bloque, directorio):
+    with tempfile.TemporaryDirectory(dir=directorio) as carpeta:
+        tabla = TablaIds(tipo='Q')
+        corridas = []
+        bloque = []
+        for arista in aristas:
+            nodo1, nodo2, peso = validar_arista(arista)
+            # Se valida aunque el bloque no llegue a disco, para que el resultado no dependa de `memoria_max`
+            if peso > _PESO_MAX:
+                raise ValueError(f"Los pesos deben ser menores que 2**63. Error en la arista: {arista}")
+            try:
+                bloque.append((peso, tabla.internar(nodo1), tabla.internar(nodo2)))
+            except OverflowError:
+                raise ValueError(f"Los nodos deben ser menores que 2**64. Error en la arista: {arista}") from None
+            if len(bloque) >= aristas_por_bloque:
+                corridas.append(_escribir_corrida(bloque, carpeta, len(corridas)))
+                bloque = []
+
+        n = len(tabla)
+        if n <= 1:
+            return
+
+        # El último bloque no necesita ir a disco: se mezcla directamente desde memoria
+        bloque.sort()
+        # Cada lector usa una fracción del presupuesto como búfer de lectura
+        tamano_bufer = max(1024, aristas_por_bloque // (len(corridas) + 1))
+        lectores = [_leer_corrida(ruta, tamano_bufer) for ruta in corridas]
+        try:
+            uf = UnionFind(n)
+            ids = tabla.ids
+            for peso, i, j in heapq.merge(bloque, *lectores):
+                if uf.union(i, j):
+                    yield ids[i], ids[j], peso
+                    if uf.components == 1:
+                        return
+        finally:
+            # Cerramos explícitamente los archivos de las corridas antes de borrar la carpeta temporal
+            for lector in lectores:
+                lector.close()
+
+    raise ValueError("El grafo no es conexo, no se puede obtener un Árbol Generador Mínimo.")
+
+
+def _escribir_corrida(bloque, carpeta, numero):
+    """Ordena un bloque de aristas `(peso, i, j)` y lo escribe como corrida binaria de enteros de 64 bits."""
+    bloque.sort()
+    ruta = os.path.join(carpeta, f"corrida-{numero}.bin")
+    plano = array('q')
+    for arista in bloque:
+        plano.extend(arista)
+    with open(ruta, "wb") as archivo:
+        plano.tofile(archivo)
+    return ruta
+
+
+def _leer_corrida(ruta, aristas_por_lectura):
+    """Lee una corrida binaria por búferes y produce sus aristas `(peso, i, j)` en orden."""
+    with open(ruta, "rb") as archivo:
+        while True:
+            datos = archivo.read(aristas_por_lectura * _BYTES_POR_ARISTA_EN_DISCO)
+            if not datos:
+                return
+            plano = array('q')
+            plano.frombytes(datos)
+            for k in range(0, len(plano), 3):
+                yield plano[k], plano[k + 1], plano[k + 2]
@@ -0,0 +1,220 @@
+import heapq
+import random
+import zlib
+from array import array
+
+from modulo.Dijkstra import _crear_cola, _distancias_csr, _reconstruir_camino
+from modulo.grafo_csr import GrafoCSR
+
+# Encabezado del archivo del índice: firma, número de nodos, de aristas, de landmarks y huella del grafo
+_FIRMA = b'ALT1'
+
+
+class IndiceLandmarks:
+    """
+    Índice de landmarks para consultas A* de camino más corto (ALT: A*, Landmarks y desigualdad Triangular).
+
+    Para cada landmark L se guardan las distancias desde L a todos los nodos y desde todos los nodos hasta L. Por
+    la desigualdad triangular, para cualquier par (v, t):
+
+        d(v, t) >= d(L, t) - d(L, v)    y    d(v, t) >= d(v, L) - d(t, L)
+
+    así que el máximo de esas cotas sobre los landmarks es una estimación admisible y consistente de la distancia
+    restante. A* con esa estimación retorna las mismas distancias que `dijkstra`, pero dirige la búsqueda hacia el
+    destino y asienta muchos menos nodos.
+
+    Usar `construir` para el preprocesamiento y `guardar`/`cargar` para reutilizarlo entre ejecuciones.
+
+    :param grafo: `GrafoCSR` ponderado sobre el que se construyó el índice.
+    :param landmarks: `array('q')` con los índices (en el `GrafoCSR`) de los landmarks.
+    :param desde: `array('d')` de k × n con `desde[i * n + v] = d(landmark i, v)`.
+    :param hacia: `array('d')` de k × n con `hacia[i * n + v] = d(v, landmark i)`.
+    """
+
+    def __init__(self, grafo, landmarks, desde, hacia):
+        self.grafo = grafo
+        self.landmarks = landmarks
+        self.desde = desde
+        self.hacia = hacia
+
+    def __len__(self):
+        return len(self.landmarks)
+
+    @classmethod
+    def construir(cls, grafo, k=8, semilla=None):
+        """
+        Elige `k` landmarks y calcula sus tablas de distancias con dos ejecuciones de Dijkstra por landmark (sobre
+        el grafo y sobre su transpuesto).
+
+        Los landmarks se eligen por el criterio del más lejano: el primero es el nodo más lejano a un nodo
+        aleatorio, y cada siguiente es el nodo cuya distancia al landmark más cercano ya elegido es máxima. Los
+        nodos no alcanzables desde ningún landmark se prefieren, de modo que cada componente recibe alguno.
+
+        :param grafo: Grafo dirigido ponderado, como diccionario (mismo formato que `dijkstra`) o `GrafoCSR`.
+        :param k: Número de landmarks.
+        :param semilla: Semilla para elegir el nodo inicial.
+
+        :return: `IndiceLandmarks`.
+
+        Lanza:
+        - ValueError si el grafo no es válido o si `k` no está entre 1 y el número de nodos.
+        """
+        if not isinstance(grafo, GrafoCSR):
+            grafo = GrafoCSR.desde_ponderado(grafo)
+        if grafo.pesos is None:
+            raise ValueError("El grafo debe ser ponderado.")
+        n = len(grafo)
+        if not 1 <= k <= n:
+            raise ValueError("El número de landmarks debe estar entre 1 y el número de nodos del grafo.")
+
+        transpuesto = grafo.transpuesto()
+        solo_enteros = grafo.tipo_pesos in ('q', 'Q')
+        peso_max = grafo.peso_max if solo_enteros else 0
+
+        def distancias(g, inicio):
+            cola = _crear_cola("auto", solo_enteros, peso_max)
+            return _distancias_csr(g.offsets, g.destinos, g.pesos, inicio, cola)[0]
+
+        # El primer landmark es el nodo más lejano a un nodo aleatorio
+        inicio = random.Random(semilla).randrange(n)
+        cercania = distancias(grafo, inicio)
+        landmarks, desde, hacia = array('q'), array('d'), array('d')
+        for _ in range(k):
+            elegido = max((v for v in range(n) if v not in landmarks), key=cercania.__getitem__)
+            landmarks.append(elegido)
+            fila = distancias(grafo, elegido)
+            desde.extend(fila)
+            hacia.extend(distancias(transpuesto, elegido))
+            cercania = fila if len(landmarks) == 1 else [min(a, b) for a, b in zip(cercania, fila)]
+        return cls(grafo, landmarks, desde, hacia)
+
+    def shortest_path(self, origen, destino):
+        """
+        Calcula el camino más corto entre dos nodos con A* guiado por los landmarks.
+
+        :return: Tupla `(distancia, camino)`, igual que `Dijkstra.shortest_path`.
+
+        Lanza:
+        - ValueError si alguno de los nodos no existe o si no hay camino entre ellos.
+        """
+        for nodo in (origen, destino):
+            if nodo not in self.grafo:
+                raise ValueError(f"El nodo {nodo} no existe en el grafo.")
+        s, t = self.grafo.indice(origen), self.grafo.indice(destino)
+        distancia, camino, _ = self._a_estrella(s, t)
+        if camino is None:
+            raise ValueError(f"No existe un camino del nodo {origen} al nodo {destino}.")
+        return distancia, self.grafo.tabla.ids_de(camino)
+
+    def guardar(self, ruta):
+        """
+        Escribe el índice en un archivo binario: encabezado, landmarks y las dos tablas de distancias.
+
+        El encabezado incluye una huella del grafo, que `cargar` compara para rechazar un índice construido sobre
+        otro grafo.
+        """
+        n = len(self.grafo)
+        encabezado = array('q', [n, self.grafo.num_aristas, len(self.landmarks), _huella(self.grafo)])
+        with open(ruta, 'wb') as archivo:
+            archivo.write(_FIRMA)
+            encabezado.tofile(archivo)
+            self.landmarks.tofile(archivo)
+            self.desde.tofile(archivo)
+            self.hacia.tofile(archivo)
+
+    @classmethod
+    def cargar(cls, ruta, grafo):
+        """
+        Lee un índice escrito con `guardar`.
+
+        :param ruta: Ruta del archivo.
+        :param grafo: El mismo grafo sobre el que se construyó el índice (diccionario o `GrafoCSR`).
+
+        :return: `IndiceLandmarks`.
+
+        Lanza:
+        - ValueError si el archivo no es un índice de landmarks, si está truncado o si fue construido sobre otro
+          grafo.
+        """
+        if not isinstance(grafo, GrafoCSR):
+            grafo = GrafoCSR.desde_ponderado(grafo)
+        with open(ruta, 'rb') as archivo:
+            if archivo.read(len(_FIRMA)) != _FIRMA:
+                raise ValueError(f"El archivo {ruta} no es un índice de landmarks.")
+            encabezado, landmarks, desde, hacia = array('q'), array('q'), array('d'), array('d')
+            try:
+                encabezado.fromfile(archivo, 4)
+                n, m, k, huella = encabezado
+                if (n, m, huella) != (len(grafo), grafo.num_aristas, _huella(grafo)):
+                    raise ValueError(f"El índice {ruta} fue construido sobre otro grafo.")
+                landmarks.fromfile(archivo, k)
+                desde.fromfile(archivo, k * n)
+                hacia.fromfile(archivo, k * n)
+            except EOFError:
+                raise ValueError(f"El índice {ruta} está truncado.") from None
+        return cls(grafo, landmarks, desde, hacia)
+
+    def _cota(self, v, t):
+        """Cota inferior de d(v, t) según los landmarks (`inf` si prueban que t no es alcanzable desde v)."""
+        n = len(self.grafo)
+        desde, hacia = self.desde, self.hacia
+        infinito = float('inf')
+        cota = 0
+        for base in range(0, len(desde), n):
+            # Un término con inf - inf no aporta información y se omite
+            desde_v, hacia_t = desde[base + v], hacia[base + t]
+            if desde_v != infinito:
+                cota = max(cota, desde[base + t] - desde_v)
+            if hacia_t != infinito:
+                cota = max(cota, hacia[base + v] - hacia_t)
+        return cota
+
+    def _a_estrella(self, s, t):
+        """
+        A* desde `s` hasta `t`. Retorna `(distancia, camino, asentados)`, con `(inf, None, asentados)` si no hay
+        camino.
+        """
+        grafo = self.grafo
+        offsets, destinos, pesos = grafo.offsets, grafo.destinos, grafo.pesos
+        infinito = float('inf')
+        n = len(grafo)
+        distancias = [infinito] * n
+        predecesores = array('q', [-1]) * n
+        visitados = bytearray(n)
+        cotas = {}  # Cada cota se calcula una sola vez por consulta
+        distancias[s] = 0
+        cola_prioridad = [(self._cota(s, t), s)]
+        asentados = 0
+
+        while cola_prioridad:
+            _, nodo_actual = heapq.heappop(cola_prioridad)
+            if visitados[nodo_actual]:
+                continue
+            visitados[nodo_actual] = 1
+            asentados += 1
+            if nodo_actual == t:
+                return distancias[t], _reconstruir_camino(predecesores, s, t), asentados
+
+            distancia_actual = distancias[nodo_actual]
+            for k in range(offsets[nodo_actual], offsets[nodo_actual + 1]):
+                vecino = destinos[k]
+                distancia_nueva = distancia_actual + pesos[k]
+                if distancia_nueva < distancias[vecino]:
+                    cota = cotas.get(vecino)
+                    if cota is None:
+                        cota = cotas[vecino] = self._cota(vecino, t)
+                    if cota == infinito:
+                        continue
+                    distancias[vecino] = distancia_nueva
+                    predecesores[vecino] = nodo_actual
+                    heapq.heappush(cola_prioridad, (distancia_nueva + cota, vecino))
+
+        return infinito, None, asentados
+
+
+def _huella(grafo):
+    """Huella CRC32 de los arreglos del grafo, para detectar un índice construido sobre otro grafo."""
+    huella = 0
+    for arreglo in (grafo.offsets, grafo.destinos, grafo.pesos):
+        huella = zlib.crc32(memoryview(arreglo).cast('B'), huella)
+    return huella
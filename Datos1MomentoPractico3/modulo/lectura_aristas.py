@@ -0,0 +1,303 @@
+import gzip
+import math
+import re
+from array import array
+
+from modulo.grafo_csr import GrafoCSR
+from modulo.tabla_ids import TablaIds
+
+# Bytes que se leen del archivo por lote
+_TAMANO_LOTE = 1 << 20
+# Los archivos gzip empiezan con estos dos bytes
+_FIRMA_GZIP = b'\x1f\x8b'
+# Líneas de comentario (su primer campo empieza con #) y líneas sin campos, incluido su salto de línea
+_COMENTARIOS = re.compile(rb'^(?:[^\S\n]|,)*#.*\n?', re.M)
+_LINEAS_VACIAS = re.compile(rb'^(?:[^\S\n]|,)*\n', re.M)
+# Mayor entero que cabe en un array('q')
+_MAX_ENTERO = (1 << 63) - 1
+_LIMITE_FLOTANTE = float(1 << 63)
+
+
+def leer_lotes(ruta, con_pesos=True, solo_enteros=False, tamano_lote=_TAMANO_LOTE):
+    """
+    Lee un archivo de texto de aristas por lotes y produce cada lote como arreglos tipados.
+
+    Cada línea tiene la forma `nodo1 nodo2 peso` (o `nodo1 nodo2` si `con_pesos` es False), con los campos
+    separados por espacios o comas; se ignoran las líneas vacías y las que empiezan con `#`. El archivo puede
+    estar comprimido con gzip (se detecta por su contenido, no por la extensión).
+
+    El archivo se lee en bloques de `tamano_lote` bytes cortados en el último salto de línea. Cada bloque se
+    convierte completo de una vez: se separan todos sus campos con una sola llamada y cada columna pasa a un
+    `array` con `map(int, ...)`, sin un bucle de Python por línea (un marcador al final de cada línea permite
+    comprobar que todas tienen el número de campos correcto). Solo si el bloque tiene algún error se vuelve
+    a recorrer línea por línea, para informar el número de la línea culpable.
+
+    Condiciones Posteriores:
+    - Cada lote cumple las reglas de `kruskal` y `validar_grafo` que se pueden comprobar arista por arista: los
+      nodos son enteros positivos y los pesos, números finitos no negativos (enteros si `solo_enteros` es True). Las
+      reglas que dependen de todo el grafo (aristas repetidas, conectividad) quedan para quien arma el grafo.
+    - La memoria usada no depende del tamaño del archivo, solo de `tamano_lote`.
+
+    Excepciones:
+    - Lanza ValueError, indicando el número de línea, si alguna línea no tiene la forma esperada o si sus
+      valores no cumplen las reglas anteriores.
+
+    :param ruta: Ruta del archivo (de texto o gzip).
+    :param con_pesos: Si las líneas tienen una tercera columna con el peso.
+    :param solo_enteros: Si es True, un peso no entero es un error (como en `kruskal`).
+    :param tamano_lote: Bytes aproximados por lote.
+
+    :return: Generador de tuplas `(origenes, destinos, pesos)`: `array('q')` con los nodos de cada extremo y
+        `array('q')` o `array('d')` con los pesos (según si todos los del lote son enteros), o None si
+        `con_pesos` es False.
+    """
+    if tamano_lote <= 0:
+        raise ValueError("El tamaño del lote debe ser un entero positivo.")
+    columnas = 3 if con_pesos else 2
+
+    with open(ruta, 'rb') as archivo:
+        comprimido = archivo.read(len(_FIRMA_GZIP)) == _FIRMA_GZIP
+    with (gzip.open(ruta, 'rb') if comprimido else open(ruta, 'rb')) as archivo:
+        primera_linea = 1
+        resto = b''
+        while True:
+            datos = archivo.read(tamano_lote)
+            if datos:
+                # El bloque termina en el último salto de línea; lo que sigue pasa al próximo bloque
+                corte = datos.rfind(b'\n') + 1
+                if not corte:  # Una línea más larga que el lote: se sigue leyendo
+                    resto += datos
+                    continue
+                bloque, resto = resto + datos[:corte], datos[corte:]
+            else:
+                bloque, resto = resto, b''
+            if bloque:
+                lote = _convertir(bloque, primera_linea, columnas, solo_enteros)
+                if lote[0]:
+                    yield lote
+                primera_linea += bloque.count(b'\n')
+            if not datos:
+                return
+
+
+def leer_aristas(ruta, tamano_lote=_TAMANO_LOTE):
+    """
+    Lee un archivo de aristas `nodo1 nodo2 peso` como la lista de tuplas que recibe `kruskal`.
+
+    :return: list de tuplas (Nodo1, Nodo2, Peso) de enteros.
+
+    Lanza:
+    - ValueError como `leer_lotes` con `solo_enteros=True`.
+    """
+    aristas = []
+    for origenes, destinos, pesos in leer_lotes(ruta, solo_enteros=True, tamano_lote=tamano_lote):
+        aristas.extend(zip(origenes, destinos, pesos))
+    return aristas
+
+
+def leer_ponderado(ruta, dirigido=True, tamano_lote=_TAMANO_LOTE):
+    """
+    Lee un archivo de aristas `nodo1 nodo2 peso` como el diccionario de listas de tuplas `(destino, peso)` que
+    recibe `dijkstra`. Los nodos que solo aparecen como destino quedan como llaves con lista vacía.
+
+    :param dirigido: Si es False, cada arista se agrega en ambos sentidos.
+
+    :return: dict {nodo: [(destino, peso)]}.
+
+    Lanza:
+    - ValueError como `leer_lotes`, o si hay dos aristas del mismo nodo al mismo destino (regla de
+      `validar_grafo`).
+    """
+    grafo = {}
+    for origenes, destinos, pesos in leer_lotes(ruta, tamano_lote=tamano_lote):
+        for origen, destino, peso in zip(origenes, destinos, pesos):
+            for desde, hacia in ((origen, destino), (destino, origen)):
+                salientes = grafo.setdefault(desde, {})
+                if hacia in salientes:
+                    raise ValueError(f"Existen múltiples aristas del nodo {desde} al nodo {hacia}.")
+                salientes[hacia] = peso
+                grafo.setdefault(hacia, {})
+                if dirigido or origen == destino:
+                    break
+
+    # Cada diccionario de salientes (usado para detectar repetidas) pasa a la lista de tuplas de `dijkstra`
+    for nodo, salientes in grafo.items():
+        grafo[nodo] = list(salientes.items())
+    return grafo
+
+
+def leer_adyacencia(ruta, con_pesos=False, tamano_lote=_TAMANO_LOTE):
+    """
+    Lee un archivo de aristas no dirigidas como el diccionario de listas de adyacencia simétricas que recibe
+    `contiene_ciclo`.
+
+    :param con_pesos: Si las líneas tienen una columna de peso (que se descarta).
+
+    :return: dict {nodo: [vecinos]}.
+
+    Lanza:
+    - ValueError como `leer_lotes`.
+    """
+    grafo = {}
+    for origenes, destinos, _ in leer_lotes(ruta, con_pesos=con_pesos, tamano_lote=tamano_lote):
+        for origen, destino in zip(origenes, destinos):
+            grafo.setdefault(origen, []).append(destino)
+            if origen != destino:
+                grafo.setdefault(destino, []).append(origen)
+    return grafo
+
+
+def leer_csr(ruta, dirigido=False, tamano_lote=_TAMANO_LOTE):
+    """
+    Lee un archivo de aristas `nodo1 nodo2 peso` directamente a un `GrafoCSR`, sin pasar por listas ni
+    diccionarios: cada lote se interna con `TablaIds.internar_muchos` y se acumula en arreglos compactos de
+    enteros (24 bytes por arista), que al final se ordenan por origen en O(n + m).
+
+    :param dirigido: Si es False (por defecto, como `GrafoCSR.desde_aristas`), cada arista se almacena en
+        ambos sentidos; si es True, como en `GrafoCSR.desde_ponderado`.
+
+    :return: GrafoCSR con pesos enteros si todos lo son, o flotantes si no.
+
+    Lanza:
+    - ValueError como `leer_lotes`, o si el grafo es dirigido y hay dos aristas del mismo nodo al mismo destino.
+    """
+    tabla = TablaIds(tipo='q')
+    origenes, destinos, pesos = array('q'), array('q'), array('q')
+    for lote_origenes, lote_destinos, lote_pesos in leer_lotes(ruta, tamano_lote=tamano_lote):
+        # Se internan intercalados para numerar los nodos en el mismo orden que `GrafoCSR.desde_aristas`
+        extremos = array('q', bytes(16 * len(lote_origenes)))
+        extremos[0::2] = lote_origenes
+        extremos[1::2] = lote_destinos
+        indices = tabla.internar_muchos(extremos)
+        origenes.extend(indices[0::2])
+        destinos.extend(indices[1::2])
+        if lote_pesos.typecode != pesos.typecode:
+            if pesos.typecode == 'q':
+                pesos = array('d', pesos)
+            lote_pesos = array('d', lote_pesos)
+        pesos.extend(lote_pesos)
+
+    grafo = GrafoCSR.desde_arreglos(origenes, destinos, pesos, tabla, dirigido=dirigido)
+    if dirigido:
+        _validar_sin_repetidas(grafo)
+    return grafo
+
+
+def _convertir(bloque, primera_linea, columnas, solo_enteros):
+    """Convierte un bloque de líneas completas en `(origenes, destinos, pesos)`."""
+    campos = _separar(bloque, columnas)
+    if campos is None:
+        return _convertir_por_lineas(bloque, primera_linea, columnas, solo_enteros)
+
+    try:
+        origenes = array('q', map(int, campos[0::columnas + 1]))
+        destinos = array('q', map(int, campos[1::columnas + 1]))
+        pesos = None
+        if columnas == 3:
+            try:
+                pesos = array('q', map(int, campos[2::4]))
+            except ValueError:
+                if solo_enteros:
+                    raise
+                pesos = array('d', map(float, campos[2::4]))
+    except (ValueError, OverflowError):
+        return _convertir_por_lineas(bloque, primera_linea, columnas, solo_enteros)
+
+    if origenes and (min(origenes) <= 0 or min(destinos) <= 0 or not _pesos_validos(pesos)):
+        return _convertir_por_lineas(bloque, primera_linea, columnas, solo_enteros)
+    return origenes, destinos, pesos
+
+
+def _separar(bloque, columnas):
+    """
+    Separa los campos de todo el bloque con una sola llamada a `split`, dejando un marcador `;` al final de cada
+    línea. Si cada línea tiene exactamente `columnas` campos, los marcadores quedan cada `columnas + 1`
+    posiciones y se retorna la lista de campos; si no, None.
+    """
+    if b';' in bloque:
+        return None  # El marcador no puede aparecer en los datos
+    if b'#' in bloque:
+        bloque = _COMENTARIOS.sub(b'', bloque)
+    if not bloque.endswith(b'\n'):
+        bloque += b'\n'
+    campos = bloque.replace(b',', b' ').replace(b'\n', b' ; ').split()
+    if len(campos) % (columnas + 1) or campos[columnas::columnas + 1].count(b';') != campos.count(b';'):
+        # Puede deberse solo a líneas vacías: se quitan y se reintenta una vez
+        campos = _LINEAS_VACIAS.sub(b'', bloque).replace(b',', b' ').replace(b'\n', b' ; ').split()
+        if len(campos) % (columnas + 1) or campos[columnas::columnas + 1].count(b';') != campos.count(b';'):
+            return None
+    return campos
+
+
+def _pesos_validos(pesos):
+    """
+    Si la conversión rápida puede aceptar los pesos: todos no negativos y menores que 2**63. Ambas comparaciones
+    son falsas con NaN, y la segunda también con `inf`, que rompería después la validación de `kruskal` o
+    `dijkstra`. Un peso flotante de 2**63 o más no es un error, pero se deja a la conversión lenta, que
+    distingue un entero fuera de rango de un número con decimales.
+    """
+    if pesos is None:
+        return True
+    if pesos.typecode == 'q':
+        return min(pesos) >= 0
+    return all(map((0.0).__le__, pesos)) and all(map(_LIMITE_FLOTANTE.__gt__, pesos))
+
+
+def _convertir_por_lineas(bloque, primera_linea, columnas, solo_enteros):
+    """
+    Conversión lenta, línea por línea, de un bloque que la conversión rápida rechazó. Lanza el error de la
+    primera línea inválida, con su número.
+    """
+    origenes, destinos, pesos = array('q'), array('q'), []
+    forma = "'nodo1 nodo2 peso'" if columnas == 3 else "'nodo1 nodo2'"
+    for numero, linea in enumerate(bloque.split(b'\n'), start=primera_linea):
+        campos = linea.replace(b',', b' ').split()
+        if not campos or campos[0].startswith(b'#'):
+            continue
+        if len(campos) != columnas:
+            raise ValueError(f"Cada arista debe tener la forma {forma}. Error en la línea {numero}.")
+        try:
+            nodo1, nodo2 = int(campos[0]), int(campos[1])
+        except ValueError:
+            raise ValueError(f"Los nodos deben ser números enteros. Error en la línea {numero}.") from None
+        if nodo1 <= 0 or nodo2 <= 0:
+            raise ValueError(f"Los nodos deben ser enteros positivos. Error en la línea {numero}.")
+        if nodo1 > _MAX_ENTERO or nodo2 > _MAX_ENTERO:
+            raise ValueError(f"Los nodos deben caber en un entero de 64 bits. Error en la línea {numero}.")
+        if columnas == 3:
+            try:
+                peso = int(campos[2])
+            except ValueError:
+                if solo_enteros:
+                    raise ValueError(
+                        f"Cada elemento de la arista debe ser un número entero. Error en la línea {numero}.") from None
+                try:
+                    peso = float(campos[2])
+                except ValueError:
+                    peso = None
+            if peso is None or not 0 <= peso < math.inf:
+                raise ValueError(
+                    f"El peso de la arista debe ser un número finito no negativo. Error en la línea {numero}.")
+            if isinstance(peso, int) and peso > _MAX_ENTERO:
+                raise ValueError(
+                    f"Los pesos enteros deben caber en un entero de 64 bits. Error en la línea {numero}.")
+            pesos.append(peso)
+        origenes.append(nodo1)
+        destinos.append(nodo2)
+
+    if columnas == 2:
+        return origenes, destinos, None
+    solo_enteros = all(isinstance(peso, int) for peso in pesos)
+    return origenes, destinos, array('q' if solo_enteros else 'd', pesos)
+
+
+def _validar_sin_repetidas(grafo):
+    """Verifica que ningún nodo de un `GrafoCSR` dirigido tenga dos aristas al mismo destino."""
+    offsets, destinos, ids = grafo.offsets, grafo.destinos, grafo.ids
+    ultimo_origen = array('q', [-1]) * len(grafo)  # Último nodo desde el que se vio una arista hacia cada nodo
+    for i in range(len(grafo)):
+        for k in range(offsets[i], offsets[i + 1]):
+            j = destinos[k]
+            if ultimo_origen[j] == i:
+                raise ValueError(f"Existen múltiples aristas del nodo {ids[i]} al nodo {ids[j]}.")
+            ultimo_origen[j] = i
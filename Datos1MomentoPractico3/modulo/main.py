@@ -1,7 +1,213 @@
-def main():
-    print("Hello")
+"""
+Ejecuta los algoritmos del proyecto sobre un archivo de grafo desde la línea de comandos.
+
+Uso, desde el directorio del proyecto:
+
+    python modulo/main.py mst ARCHIVO [--algoritmo kruskal|boruvka] [--modo ordenado|heap] [--procesos N]
+    python modulo/main.py sssp ARCHIVO ORIGEN [--dirigido] [--algoritmo dijkstra|delta-stepping] [--cola heap]
+                               [--motor auto|numpy|python] [--max-distancia D] [--k K]
+    python modulo/main.py path ARCHIVO ORIGEN DESTINO [--dirigido] [--bidireccional]
+    python modulo/main.py has-cycle ARCHIVO [--con-pesos] [--testigo]
+
+(o `python -m modulo.main ...`). El archivo puede ser un archivo de texto de aristas `nodo1 nodo2 peso`, que se
+lee por lotes con `lectura_aristas` (también comprimido con gzip), o un archivo binario de `GrafoCSR.guardar`,
+que se abre con `GrafoCSR.cargar` sin copiarlo a memoria; el formato se detecta por su contenido.
+
+Los resultados se escriben en la salida estándar, en un formato de texto que se puede pasar a otro comando, y el
+tiempo de carga, el del algoritmo y la memoria pico del proceso, en la salida de error (`--silencioso` los
+omite; `--detalle` agrega los contadores de `Estadisticas` de los algoritmos que los registran). Los módulos de
+los algoritmos se importan solo dentro del subcomando que los usa, para que arrancar el programa cueste poco
+aunque se llame miles de veces desde un script.
+"""
+import argparse
+import os
+import sys
+import time
+
+if __package__ in (None, ""):
+    # Ejecutado como `python modulo/main.py`: el paquete `modulo` está en el directorio padre de este archivo
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def cargar_grafo(ruta, dirigido=False):
+    """
+    Carga el grafo de un archivo binario de `GrafoCSR.guardar` o de un archivo de texto de aristas.
+
+    :param ruta: Ruta del archivo.
+    :param dirigido: Si las aristas de un archivo de texto son dirigidas; un archivo binario ya guarda si lo es.
+    :return: GrafoCSR.
+
+    Lanza:
+    - ValueError como `GrafoCSR.cargar` o `leer_csr`, y OSError si el archivo no se puede leer.
+    """
+    if _es_binario(ruta):
+        from modulo.grafo_csr import GrafoCSR
+        return GrafoCSR.cargar(ruta)
+
+    from modulo.lectura_aristas import leer_csr
+    return leer_csr(ruta, dirigido=dirigido)
+
+
+def _es_binario(ruta):
+    """Si el archivo empieza con la firma del formato binario de `GrafoCSR.guardar`."""
+    from modulo.grafo_csr import _FIRMA
+
+    with open(ruta, "rb") as archivo:
+        return archivo.read(len(_FIRMA)) == _FIRMA
+
+
+def _mst(argumentos, estadisticas):
+    grafo = cargar_grafo(argumentos.archivo)
+    yield
+    if argumentos.algoritmo == "boruvka":
+        from modulo.boruvka import boruvka
+        arbol = boruvka(grafo, procesos=argumentos.procesos)
+    else:
+        from modulo.kruskal import kruskal
+        arbol = kruskal(grafo, modo=argumentos.modo, estadisticas=estadisticas)
+    yield
+    lineas = [f"{nodo1} {nodo2} {peso}" for nodo1, nodo2, peso in arbol]
+    lineas.append(f"# peso total: {sum(peso for _, _, peso in arbol)}")
+    yield lineas
+
+
+def _sssp(argumentos, estadisticas):
+    grafo = cargar_grafo(argumentos.archivo, argumentos.dirigido)
+    yield
+    if argumentos.algoritmo == "delta-stepping":
+        from modulo.delta_stepping import delta_stepping
+        distancias = delta_stepping(grafo, argumentos.origen, motor=argumentos.motor)
+    else:
+        from modulo.Dijkstra import dijkstra
+        distancias = dijkstra(grafo, argumentos.origen, cola=argumentos.cola, max_distance=argumentos.max_distancia,
+                              k_nearest=argumentos.k, estadisticas=estadisticas)
+    yield
+    yield [f"{nodo} {distancia}" for nodo, distancia in distancias.items()]
+
+
+def _path(argumentos, estadisticas):
+    grafo = cargar_grafo(argumentos.archivo, argumentos.dirigido)
+    yield
+    from modulo.Dijkstra import shortest_path
+    distancia, camino = shortest_path(grafo, argumentos.origen, argumentos.destino,
+                                      bidireccional=argumentos.bidireccional)
+    yield
+    yield [str(distancia), " ".join(map(str, camino))]
+
+
+def _has_cycle(argumentos, estadisticas):
+    if _es_binario(argumentos.archivo):
+        grafo = cargar_grafo(argumentos.archivo)
+    else:
+        # Las líneas pueden no tener peso, así que se leen como adyacencia en lugar de con `leer_csr`
+        from modulo.lectura_aristas import leer_adyacencia
+        grafo = leer_adyacencia(argumentos.archivo, con_pesos=argumentos.con_pesos)
+    yield
+    from modulo.contiene_ciclo import contiene_ciclo
+    ciclo = contiene_ciclo(grafo, testigo=True, estadisticas=estadisticas)
+    yield
+    lineas = [str(ciclo is not None)]
+    if argumentos.testigo and ciclo is not None:
+        lineas.append(" ".join(map(str, ciclo)))
+    yield lineas
+
+
+def _memoria_pico():
+    """Memoria residente pico del proceso en bytes, o None si el sistema no la informa (Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico if sys.platform == "darwin" else pico * 1024  # En Linux se informa en KiB
+
+
+def _crear_parser():
+    parser = argparse.ArgumentParser(prog="main.py", description=__doc__.split("\n\n")[0])
+    comunes = argparse.ArgumentParser(add_help=False)
+    comunes.add_argument("archivo", help="archivo de aristas (texto o gzip) o binario de GrafoCSR.guardar")
+    comunes.add_argument("-s", "--silencioso", action="store_true", help="no escribir tiempos ni memoria")
+    comunes.add_argument("--detalle", action="store_true",
+                         help="escribir también los contadores y fases de los algoritmos que los registran")
+    subcomandos = parser.add_subparsers(dest="subcomando", required=True)
+
+    mst = subcomandos.add_parser("mst", parents=[comunes], help="árbol generador mínimo")
+    mst.add_argument("--algoritmo", choices=("kruskal", "boruvka"), default="kruskal")
+    mst.add_argument("--modo", choices=("ordenado", "heap"), default="ordenado", help="modo de kruskal")
+    mst.add_argument("--procesos", type=int, help="procesos de boruvka (por defecto, uno por núcleo)")
+    mst.set_defaults(ejecutar=_mst)
+
+    dirigido = argparse.ArgumentParser(add_help=False)
+    dirigido.add_argument("--dirigido", action="store_true", help="las aristas de un archivo de texto son dirigidas")
+
+    sssp = subcomandos.add_parser("sssp", parents=[comunes, dirigido], help="distancias desde un nodo")
+    sssp.add_argument("origen", type=int)
+    sssp.add_argument("--algoritmo", choices=("dijkstra", "delta-stepping"), default="dijkstra")
+    sssp.add_argument("--cola", choices=("auto", "heap", "buckets", "radix", "indexada"), default="auto",
+                      help="cola de prioridad de dijkstra")
+    sssp.add_argument("--motor", choices=("auto", "numpy", "python"), default="auto", help="motor de delta-stepping")
+    sssp.add_argument("--max-distancia", type=float, help="solo los nodos hasta esta distancia (dijkstra)")
+    sssp.add_argument("--k", type=int, help="solo los k nodos más cercanos (dijkstra)")
+    sssp.set_defaults(ejecutar=_sssp)
+
+    path = subcomandos.add_parser("path", parents=[comunes, dirigido], help="camino más corto entre dos nodos")
+    path.add_argument("origen", type=int)
+    path.add_argument("destino", type=int)
+    path.add_argument("--bidireccional", action="store_true")
+    path.set_defaults(ejecutar=_path)
+
+    ciclo = subcomandos.add_parser("has-cycle", parents=[comunes], help="si el grafo no dirigido tiene ciclos")
+    ciclo.add_argument("--con-pesos", action="store_true", help="las líneas del archivo de texto tienen peso")
+    ciclo.add_argument("--testigo", action="store_true", help="escribir también los nodos del ciclo")
+    ciclo.set_defaults(ejecutar=_has_cycle)
+    return parser
+
+
+def main(argumentos=None):
+    """
+    Punto de entrada de la línea de comandos.
+
+    Cada subcomando es un generador que se detiene tras cargar el grafo y tras ejecutar el algoritmo, para medir
+    las dos fases por separado, y al final produce las líneas del resultado.
+
+    :param argumentos: Lista de argumentos; por defecto, los de `sys.argv`.
+    :return: Código de salida: 0 si terminó bien, 1 si el archivo o el grafo no son válidos.
+    """
+    parser = _crear_parser()
+    argumentos = parser.parse_args(argumentos)
+    if argumentos.subcomando == "sssp" and argumentos.algoritmo == "delta-stepping" and (
+            argumentos.max_distancia is not None or argumentos.k is not None):
+        parser.error("--max-distancia y --k solo se pueden usar con --algoritmo dijkstra")
+    estadisticas = None
+    if argumentos.detalle:
+        from modulo.estadisticas import Estadisticas
+        estadisticas = Estadisticas()
+
+    pasos = argumentos.ejecutar(argumentos, estadisticas)
+    try:
+        inicio = time.perf_counter()
+        next(pasos)
+        cargado = time.perf_counter()
+        next(pasos)
+        terminado = time.perf_counter()
+        lineas = next(pasos)
+    except (ValueError, OSError) as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+
+    print("\n".join(lineas))
+    if not argumentos.silencioso:
+        memoria = _memoria_pico()
+        memoria = f"{memoria / 2 ** 20:.1f} MiB" if memoria is not None else "no disponible"
+        print(f"# carga: {(cargado - inicio) * 1e3:.3f} ms, algoritmo: {(terminado - cargado) * 1e3:.3f} ms, "
+              f"memoria pico: {memoria}", file=sys.stderr)
+    if estadisticas is not None:
+        for nombre, valor in estadisticas.contadores.items():
+            print(f"# {nombre}: {valor}", file=sys.stderr)
+        for nombre, segundos in estadisticas.tiempos.items():
+            print(f"# fase {nombre}: {segundos * 1e3:.3f} ms", file=sys.stderr)
+    return 0
+
 
-# Press the green button in the gutter to run the script.
 if __name__ == '__main__':
-    main()
-# See PyCharm help at https://www.jetbrains.com/help/pycharm/
+    sys.exit(main())
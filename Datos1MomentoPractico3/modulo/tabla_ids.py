@@ -0,0 +1,89 @@
+from array import array
+
+
+class TablaIds:
+    """
+    Tabla de internado de identificadores de nodos.
+
+    Asigna a cada identificador original (cualquier valor hashable, por ejemplo enteros dispersos de 64 bits) un
+    índice denso `0..n-1` en orden de aparición, y permite traducir los índices de vuelta a los identificadores.
+    Es la capa que usan `kruskal` y `GrafoCSR` para trabajar con arreglos indexados sin exigir que los nodos estén
+    numerados de 1 a n.
+
+    Condiciones Previas:
+    - Los identificadores deben ser hashables.
+    - Si se indica `tipo`, los identificadores deben ser enteros representables con ese código de `array`
+      (por ejemplo 'Q' para enteros sin signo de 64 bits).
+
+    Condiciones Posteriores:
+    - `ids[indice]` retorna el identificador original e `indices[id]` su índice denso.
+
+    :param ids: iterable
+        Identificadores iniciales, que se internan en orden.
+    :param tipo: str o None
+        Código de tipo de `array` para guardar los identificadores de forma compacta; si es None se usa una lista.
+    """
+
+    def __init__(self, ids=(), tipo=None):
+        self.ids = array(tipo) if tipo is not None else []
+        self.indices = {}
+        self.internar_muchos(ids)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, nodo):
+        return nodo in self.indices
+
+    def internar(self, nodo):
+        """
+        Retorna el índice denso de `nodo`, asignándole uno nuevo si es la primera vez que aparece.
+
+        :param nodo: Identificador original del nodo.
+        :return: int con el índice del nodo.
+        """
+        indice = self.indices.get(nodo)
+        if indice is None:
+            indice = self.indices[nodo] = len(self.ids)
+            self.ids.append(nodo)
+        return indice
+
+    def internar_muchos(self, nodos):
+        """
+        Interna una secuencia o iterable de identificadores en una sola pasada, sin copias intermedias.
+
+        :param nodos: iterable de identificadores.
+        :return: array de enteros con el índice de cada identificador, en el mismo orden.
+        """
+        indices = self.indices
+        ids = self.ids
+        resultado = array('q')
+        for nodo in nodos:
+            indice = indices.get(nodo)
+            if indice is None:
+                indice = indices[nodo] = len(ids)
+                ids.append(nodo)
+            resultado.append(indice)
+        return resultado
+
+    def indice(self, nodo):
+        """
+        Retorna el índice denso de un identificador ya internado.
+
+        Excepciones:
+        - Lanza ValueError si el nodo no existe en la tabla.
+        """
+        try:
+            return self.indices[nodo]
+        except (KeyError, TypeError):
+            raise ValueError(f"El nodo {nodo} no existe en el grafo.") from None
+
+    def ids_de(self, indices):
+        """
+        Traduce una secuencia de índices densos a sus identificadores originales.
+
+        :param indices: Secuencia de enteros dentro del rango [0, n-1].
+        :return: list con los identificadores originales.
+        """
+        ids = self.ids
+        return [ids[i] for i in indices]
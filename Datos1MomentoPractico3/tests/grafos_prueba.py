@@ -0,0 +1,78 @@
+"""
+Grafos aleatorios con semilla y ayudas que comparten los tests.
+"""
+import random
+
+
+def aristas_aleatorias(n, m, semilla, pesos=lambda a: a.randint(0, 20), simples=False):
+    """
+    Lista de aristas no dirigidas `(Nodo1, Nodo2, Peso)` como la que recibe `kruskal`, de un grafo conexo con los
+    nodos 1..n: un árbol aleatorio más `m` aristas al azar.
+
+    :param pesos: Función que recibe el generador aleatorio y retorna el peso de una arista.
+    :param simples: Si es True, las aristas extra no forman lazos ni repiten un par de nodos.
+    """
+    aleatorio = random.Random(semilla)
+    aristas = [(i, aleatorio.randint(1, i - 1), pesos(aleatorio)) for i in range(2, n + 1)]
+    pares = {frozenset(arista[:2]) for arista in aristas}
+    while len(aristas) < n - 1 + m:
+        nodo1, nodo2 = aleatorio.randint(1, n), aleatorio.randint(1, n)
+        if simples:
+            if nodo1 == nodo2 or frozenset((nodo1, nodo2)) in pares:
+                continue
+            pares.add(frozenset((nodo1, nodo2)))
+        aristas.append((nodo1, nodo2, pesos(aleatorio)))
+    return aristas
+
+
+def ponderado_aleatorio(n, m, semilla, pesos=lambda a: a.randint(0, 20), conexo=True):
+    """
+    Grafo dirigido como el que recibe `dijkstra`, con los nodos 1..n y `m` aristas al azar (una arista repetida
+    se queda con el último peso).
+
+    :param pesos: Función que recibe el generador aleatorio y retorna el peso de una arista.
+    :param conexo: Si es True, se agrega además el ciclo 1 -> 2 -> ... -> n -> 1, de modo que todos los nodos son
+        alcanzables desde cualquiera.
+    """
+    aleatorio = random.Random(semilla)
+    grafo = {i: ({i % n + 1: pesos(aleatorio)} if conexo else {}) for i in range(1, n + 1)}
+    for _ in range(m):
+        grafo[aleatorio.randint(1, n)][aleatorio.randint(1, n)] = pesos(aleatorio)
+    return {nodo: list(aristas.items()) for nodo, aristas in grafo.items()}
+
+
+def rejilla_ponderada(lado, semilla):
+    """
+    Rejilla `lado` × `lado` (nodos 1..lado²) como diccionario de `dijkstra`, con aristas en ambos sentidos y
+    pesos entre 1 y 9: un caso típico de red vial.
+    """
+    aleatorio = random.Random(semilla)
+    grafo = {nodo: [] for nodo in range(1, lado * lado + 1)}
+    for fila in range(lado):
+        for columna in range(lado):
+            nodo = fila * lado + columna + 1
+            vecinos = ([nodo + 1] if columna + 1 < lado else []) + ([nodo + lado] if fila + 1 < lado else [])
+            for vecino in vecinos:
+                peso = aleatorio.randint(1, 9)
+                grafo[nodo].append((vecino, peso))
+                grafo[vecino].append((nodo, peso))
+    return grafo
+
+
+def como_ponderado(aristas):
+    """Convierte una lista de aristas no dirigidas en el diccionario simétrico que recibe `dijkstra`."""
+    grafo = {}
+    for nodo1, nodo2, peso in aristas:
+        grafo.setdefault(nodo1, []).append((nodo2, peso))
+        grafo.setdefault(nodo2, []).append((nodo1, peso))
+    return grafo
+
+
+def repartir_siempre(caso, modulo, umbral):
+    """
+    Baja a 1 el umbral `umbral` de `modulo` (por ejemplo `_MIN_ARISTAS_POR_PROCESO`) mientras dura el test `caso`,
+    para que el trabajo se reparta entre procesos aun con entradas pequeñas.
+    """
+    original = getattr(modulo, umbral)
+    setattr(modulo, umbral, 1)
+    caso.addCleanup(setattr, modulo, umbral, original)
@@ -0,0 +1,53 @@
+import random
+import unittest
+from modulo.agm_dinamico import AGMDinamico
+from modulo.kruskal import kruskal
+
+
+class TestAGMDinamico(unittest.TestCase):
+
+    def test_insercion_reemplaza_la_arista_mas_pesada(self):
+        agm = AGMDinamico([(1, 2, 1), (2, 3, 5), (3, 4, 2)])
+        self.assertTrue(agm.insertar_arista(1, 3, 3))
+        self.assertEqual(sorted(agm.aristas), [(1, 2, 1), (1, 3, 3), (3, 4, 2)])
+        self.assertEqual(agm.peso_total, 6)
+
+    def test_insercion_sin_cambios(self):
+        agm = AGMDinamico([(1, 2, 1), (2, 3, 2)])
+        self.assertFalse(agm.insertar_arista(1, 3, 2))
+        self.assertEqual(agm.peso_total, 3)
+
+    def test_nodo_nuevo(self):
+        agm = AGMDinamico([(1, 2, 1)])
+        self.assertTrue(agm.insertar_arista(2, 9, 4))
+        self.assertEqual(len(agm), 3)
+        self.assertEqual(agm.peso_total, 5)
+
+    def test_disminuir_peso(self):
+        agm = AGMDinamico([(1, 2, 4), (2, 3, 5)])
+        self.assertTrue(agm.disminuir_peso(1, 2, 1))
+        self.assertEqual(agm.peso_total, 6)
+        self.assertTrue(agm.disminuir_peso(1, 3, 2))  # Arista fuera del árbol
+        self.assertEqual(sorted(agm.aristas), [(1, 2, 1), (1, 3, 2)])
+        with self.assertRaises(ValueError):
+            agm.disminuir_peso(1, 2, 10)
+
+    def test_igual_a_recalcular_con_kruskal(self):
+        # Tras una serie de inserciones, el peso debe coincidir con el de ejecutar kruskal desde cero
+        aleatorio = random.Random(11)
+        grafo = [(i, aleatorio.randint(1, i - 1), aleatorio.randint(1, 100)) for i in range(2, 60)]
+        agm = AGMDinamico.desde_grafo(grafo)
+        for _ in range(200):
+            arista = (aleatorio.randint(1, 59), aleatorio.randint(1, 59), aleatorio.randint(1, 100))
+            grafo.append(arista)
+            agm.insertar_arista(*arista)
+        self.assertEqual(agm.peso_total, sum(p for _, _, p in kruskal(grafo)))
+        self.assertEqual(len(agm.aristas), 58)
+
+    def test_arista_invalida(self):
+        with self.assertRaises(ValueError):
+            AGMDinamico([(1, 2, 1)]).insertar_arista(1, 0, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
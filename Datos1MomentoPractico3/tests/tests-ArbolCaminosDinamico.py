@@ -0,0 +1,112 @@
+import random
+import unittest
+from modulo.arbol_caminos_dinamico import ArbolCaminosDinamico
+from modulo.Dijkstra import dijkstra
+
+from grafos_prueba import ponderado_aleatorio
+
+
+def distancias_de_referencia(salientes, origen):
+    # Dijkstra desde cero sobre el subgrafo alcanzable; el resto queda en inf
+    alcanzables = {origen}
+    pendientes = [origen]
+    while pendientes:
+        for vecino in salientes[pendientes.pop()]:
+            if vecino not in alcanzables:
+                alcanzables.add(vecino)
+                pendientes.append(vecino)
+    subgrafo = {nodo: [par for par in salientes[nodo].items() if par[0] in alcanzables] for nodo in alcanzables}
+    distancias = {nodo: float('inf') for nodo in salientes}
+    distancias.update(dijkstra(subgrafo, origen))
+    return distancias
+
+
+class TestArbolCaminosDinamico(unittest.TestCase):
+
+    def test_distancias_iniciales(self):
+        grafo = {1: [(2, 5), (3, 1)], 2: [(4, 2)], 3: [(2, 2), (4, 1)], 4: []}
+        arbol = ArbolCaminosDinamico(grafo, 1)
+        self.assertEqual({nodo: arbol.distancia(nodo) for nodo in grafo}, dijkstra(grafo, 1))
+        self.assertEqual(arbol.camino(4), [1, 3, 4])
+
+    def test_actualizaciones_aleatorias(self):
+        # Tras cada actualización, las distancias deben coincidir con recalcular desde cero
+        aleatorio = random.Random(11)
+        n = 40
+        arbol = ArbolCaminosDinamico(ponderado_aleatorio(n, 120, 11, pesos=lambda a: a.randint(0, 9)), 1)
+        for _ in range(300):
+            operacion = aleatorio.random()
+            nodo1, nodo2 = aleatorio.randint(1, n), aleatorio.randint(1, n)
+            aristas = [(u, v) for u in arbol.salientes for v in arbol.salientes[u]]
+            if operacion < 0.3 and aristas:
+                arbol.eliminar_arista(*aleatorio.choice(aristas))
+            elif operacion < 0.7 and aristas:
+                u, v = aleatorio.choice(aristas)
+                arbol.cambiar_peso(u, v, aleatorio.randint(0, 12))
+            else:
+                arbol.insertar_arista(nodo1, nodo2, aleatorio.randint(0, 9))
+
+            esperadas = distancias_de_referencia(arbol.salientes, 1)
+            self.assertEqual({nodo: arbol.distancia(nodo) for nodo in arbol.salientes}, esperadas)
+            for nodo, distancia in esperadas.items():
+                camino = arbol.camino(nodo)
+                if distancia == float('inf'):
+                    self.assertIsNone(camino)
+                else:
+                    self.assertEqual(sum(arbol.salientes[u][v] for u, v in zip(camino, camino[1:])), distancia)
+
+    def test_eliminar_deja_nodos_inalcanzables(self):
+        arbol = ArbolCaminosDinamico({1: [(2, 1)], 2: [(3, 1)], 3: []}, 1)
+        arbol.eliminar_arista(1, 2)
+        self.assertEqual(arbol.distancia(3), float('inf'))
+        arbol.insertar_arista(1, 3, 4)
+        self.assertEqual(arbol.distancia(3), 4)
+        self.assertEqual(arbol.distancia(2), float('inf'))
+
+    def test_grafo_inicial_disconexo(self):
+        # Los nodos no alcanzables al inicio empiezan en inf, el mismo estado que dejaría una eliminación
+        grafo = {1: [(2, 2)], 2: [], 3: [(4, 1)], 4: [(3, 5)]}
+        arbol = ArbolCaminosDinamico(grafo, 1)
+        self.assertEqual([arbol.distancia(nodo) for nodo in grafo], [0, 2, float('inf'), float('inf')])
+        self.assertIsNone(arbol.camino(4))
+        arbol.cambiar_peso(3, 4, 2)
+        arbol.eliminar_arista(4, 3)
+        arbol.insertar_arista(2, 3, 1)
+        self.assertEqual(arbol.distancia(4), 5)
+        self.assertEqual(arbol.camino(4), [1, 2, 3, 4])
+        with self.assertRaises(ValueError):
+            ArbolCaminosDinamico({1: [(2, -1)], 2: [], 3: [(9, 1)]}, 1)
+        with self.assertRaises(ValueError):
+            ArbolCaminosDinamico({1: [], 3: [(1, -1)]}, 1)  # También se valida la parte no alcanzable
+
+    def test_destino_sin_llave(self):
+        # Un nodo sin aristas salientes puede aparecer solo como destino: validar_grafo lo acepta
+        arbol = ArbolCaminosDinamico({1: [(2, 1), (3, 4)], 3: [(4, 2)]}, 1)
+        self.assertEqual(len(arbol), 4)
+        self.assertEqual([arbol.distancia(nodo) for nodo in (1, 2, 3, 4)], [0, 1, 4, 6])
+        self.assertEqual(arbol.camino(4), [1, 3, 4])
+        arbol.insertar_arista(2, 4, 1)
+        self.assertEqual(arbol.camino(4), [1, 2, 4])
+        arbol.eliminar_arista(1, 2)
+        self.assertEqual((arbol.distancia(2), arbol.distancia(4)), (float('inf'), 6))
+
+    def test_nodo_nuevo(self):
+        arbol = ArbolCaminosDinamico({1: [(2, 3)], 2: []}, 1)
+        arbol.insertar_arista(2, 7, 1.5)
+        self.assertEqual(len(arbol), 3)
+        self.assertEqual(arbol.distancia(7), 4.5)
+
+    def test_validaciones(self):
+        arbol = ArbolCaminosDinamico({1: [(2, 3)], 2: []}, 1)
+        with self.assertRaises(ValueError):
+            arbol.eliminar_arista(2, 1)
+        with self.assertRaises(ValueError):
+            arbol.insertar_arista(1, 2, -1)
+        with self.assertRaises(ValueError):
+            arbol.cambiar_peso(1, 9, 1)
+        with self.assertRaises(ValueError):
+            arbol.distancia(9)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+import modulo.boruvka as modulo_boruvka
+from modulo.boruvka import boruvka
+from modulo.grafo_csr import GrafoCSR
+from modulo.kruskal import kruskal
+
+from grafos_prueba import aristas_aleatorias, repartir_siempre
+
+
+class TestBoruvka(unittest.TestCase):
+
+    def setUp(self):
+        # Forzamos el reparto entre procesos aun con grafos pequeños
+        repartir_siempre(self, modulo_boruvka, "_MIN_ARISTAS_POR_PROCESO")
+
+    def test_mismo_arbol_que_kruskal_secuencial(self):
+        # Con muchos empates de peso el árbol debe coincidir arista por arista
+        grafo = aristas_aleatorias(200, 800, 3, pesos=lambda a: a.randint(0, 4))
+        self.assertEqual(boruvka(grafo, procesos=1), kruskal(grafo))
+
+    def test_mismo_arbol_que_kruskal_en_paralelo(self):
+        grafo = aristas_aleatorias(300, 1200, 4)
+        self.assertEqual(boruvka(grafo, procesos=3), kruskal(grafo))
+
+    def test_grafo_csr(self):
+        grafo = GrafoCSR.desde_aristas(aristas_aleatorias(100, 300, 5))
+        self.assertEqual(boruvka(grafo, procesos=2), kruskal(grafo))
+
+    def test_grafo_disconexo(self):
+        with self.assertRaises(ValueError):
+            boruvka([(1, 2, 10), (3, 4, 20)], procesos=2)
+
+    def test_enteros_fuera_de_rango(self):
+        for arista in ((2, 3, 2 ** 63), (2, 2 ** 64, 1)):
+            with self.assertRaises(ValueError):
+                boruvka([(1, 2, 10), arista], procesos=1)
+
+    def test_casos_borde(self):
+        self.assertEqual(boruvka([]), [])
+        self.assertEqual(boruvka([(1, 1, 3)]), [])
+        with self.assertRaises(ValueError):
+            boruvka([(1, 'b', 10)])
+        with self.assertRaises(ValueError):
+            boruvka([(1, 2, 1)], procesos=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
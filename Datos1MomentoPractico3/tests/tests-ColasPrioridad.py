@@ -0,0 +1,50 @@
+import random
+import unittest
+from modulo.colas_prioridad import ColaBuckets, ColaHeap, ColaIndexada, ColaRadix
+
+
+class TestColasPrioridad(unittest.TestCase):
+
+    def extraer_todo(self, cola):
+        resultado = []
+        while cola:
+            resultado.append(cola.extraer())
+        return resultado
+
+    def test_orden_monotono(self):
+        # Simulamos el patrón de Dijkstra: cada inserción es mayor o igual que la última extracción
+        aleatorio = random.Random(7)
+        for cola in (ColaHeap(), ColaBuckets(50), ColaRadix()):
+            ultima = 0
+            extraidas = []
+            for nodo in range(20):
+                cola.insertar(aleatorio.randint(0, 50), nodo)
+            while cola:
+                prioridad, nodo = cola.extraer()
+                self.assertGreaterEqual(prioridad, ultima)
+                ultima = prioridad
+                extraidas.append(nodo)
+                if len(extraidas) < 200:
+                    cola.insertar(prioridad + aleatorio.randint(0, 50), len(extraidas) + 100)
+            self.assertEqual(len(cola), 0)
+
+    def test_buckets_y_radix_igual_que_heap(self):
+        prioridades = [5, 3, 3, 9, 0, 7]
+        for cola in (ColaBuckets(9), ColaRadix()):
+            for nodo, prioridad in enumerate(prioridades):
+                cola.insertar(prioridad, nodo)
+            self.assertEqual([p for p, _ in self.extraer_todo(cola)], sorted(prioridades))
+
+    def test_indexada_disminuye_clave(self):
+        # Un nodo aparece una sola vez; solo se acepta una prioridad menor
+        cola = ColaIndexada()
+        cola.insertar(5.0, 'a')
+        cola.insertar(3.0, 'b')
+        cola.insertar(1.5, 'a')
+        cola.insertar(4.0, 'b')
+        self.assertEqual(len(cola), 2)
+        self.assertEqual(self.extraer_todo(cola), [(1.5, 'a'), (3.0, 'b')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import random
+import unittest
+
+from modulo.componentes import connected_components
+from modulo.Dijkstra import verificar_conectividad
+from modulo.grafo_csr import GrafoCSR
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+MOTORES = ("python", "numpy") if numpy is not None else ("python",)
+
+
+class TestComponentes(unittest.TestCase):
+
+    # 1. Grafo vacío y nodos aislados
+    def test_grafo_vacio_y_nodos_aislados(self):
+        for motor in MOTORES:
+            etiquetas, tamanos = connected_components({}, motor=motor)
+            self.assertEqual((len(etiquetas), len(tamanos)), (0, 0))
+            etiquetas, tamanos = connected_components({1: [], 2: [], 3: []}, motor=motor)
+            self.assertEqual(list(etiquetas), [0, 1, 2])
+            self.assertEqual(list(tamanos), [1, 1, 1])
+
+    # 2. Las componentes se numeran en el orden de su primer nodo
+    def test_etiquetas_en_orden_del_primer_nodo(self):
+        grafo = {1: [3], 2: [4], 3: [1, 5], 4: [2], 5: [3], 6: []}
+        for motor in MOTORES:
+            etiquetas, tamanos = connected_components(grafo, motor=motor)
+            self.assertEqual(list(etiquetas), [0, 1, 0, 1, 0, 2])
+            self.assertEqual(list(tamanos), [3, 2, 1])
+
+    # 3. Todos los formatos de entrada
+    def test_formatos_de_entrada(self):
+        aristas = [(1, 2, 4), (3, 4, 1), (2, 5, 7)]
+        for motor in MOTORES:
+            _, tamanos = connected_components(aristas, motor=motor)
+            self.assertEqual(list(tamanos), [3, 2])
+            _, tamanos = connected_components(GrafoCSR.desde_aristas(aristas), motor=motor)
+            self.assertEqual(list(tamanos), [3, 2])
+            _, tamanos = connected_components({1: [(2, 1.5)], 2: [], 3: []}, motor=motor)
+            self.assertEqual(list(tamanos), [2, 1])
+
+    # 4. En un grafo dirigido se obtienen las componentes débilmente conexas
+    def test_componentes_debiles(self):
+        grafo = {1: [(2, 1)], 3: [(2, 1)], 4: []}  # 3 no es alcanzable desde 1, pero comparten a 2
+        for motor in MOTORES:
+            etiquetas, tamanos = connected_components(grafo, motor=motor)
+            self.assertEqual(list(tamanos), [3, 1])
+
+    # 5. Grafos aleatorios: ambos motores coinciden con un recorrido simple
+    def test_grafos_aleatorios(self):
+        aleatorio = random.Random(20)
+        for _ in range(30):
+            n = aleatorio.randint(1, 200)
+            aristas = [(aleatorio.randint(1, n), aleatorio.randint(1, n), 1) for _ in range(aleatorio.randint(0, n))]
+            aristas.append((n, n, 1))  # Un lazo, para que la lista nunca quede vacía
+            grafo = GrafoCSR.desde_aristas(aristas)
+
+            esperado = [-1] * len(grafo)
+            for raiz in range(len(grafo)):
+                if esperado[raiz] == -1:
+                    etiqueta = max(esperado) + 1
+                    esperado[raiz] = etiqueta
+                    pila = [raiz]
+                    while pila:
+                        nodo = pila.pop()
+                        for k in range(grafo.offsets[nodo], grafo.offsets[nodo + 1]):
+                            if esperado[grafo.destinos[k]] == -1:
+                                esperado[grafo.destinos[k]] = etiqueta
+                                pila.append(grafo.destinos[k])
+
+            for motor in MOTORES:
+                etiquetas, tamanos = connected_components(grafo, motor=motor)
+                self.assertEqual(list(etiquetas), esperado)
+                self.assertEqual(list(tamanos), [esperado.count(c) for c in range(len(tamanos))])
+
+    # 6. Motor inválido y grafo inválido
+    def test_errores(self):
+        with self.assertRaises(ValueError):
+            connected_components({1: []}, motor="gpu")
+        with self.assertRaises(ValueError):
+            connected_components({1: [2]})  # El nodo 2 no existe
+        with self.assertRaises(ValueError):
+            connected_components([(1, 2)])
+
+    # 7. verificar_conectividad sobre un GrafoCSR no dirigido usa las componentes
+    def test_verificar_conectividad_no_dirigido(self):
+        self.assertTrue(verificar_conectividad(GrafoCSR.desde_aristas([(1, 2, 1), (2, 3, 1)]), 3))
+        self.assertFalse(verificar_conectividad(GrafoCSR.desde_aristas([(1, 2, 1), (3, 4, 1)]), 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+from modulo.contraccion import JerarquiaContraccion
+from modulo.Dijkstra import dijkstra, shortest_path
+from modulo.grafo_csr import GrafoCSR
+
+from grafos_prueba import ponderado_aleatorio
+
+
+class TestJerarquiaContraccion(unittest.TestCase):
+
+    def peso_del_camino(self, grafo, camino):
+        pesos = {(origen, destino): peso for origen, aristas in grafo.items() for destino, peso in aristas}
+        return sum(pesos[par] for par in zip(camino, camino[1:]))
+
+    def test_mismas_distancias_y_caminos_validos(self):
+        grafo = ponderado_aleatorio(150, 500, 1, pesos=lambda a: a.randint(1, 20), conexo=False)
+        jerarquia = JerarquiaContraccion.construir(grafo)
+        csr = GrafoCSR.desde_ponderado(grafo)
+        for origen in (1, 40, 99):
+            for destino in range(1, 151):
+                try:
+                    esperado = shortest_path(csr, origen, destino)[0]
+                except ValueError:
+                    with self.assertRaises(ValueError):
+                        jerarquia.shortest_path(origen, destino)
+                    continue
+                distancia, camino = jerarquia.shortest_path(origen, destino)
+                self.assertEqual(distancia, esperado)
+                self.assertEqual(jerarquia.distancia(origen, destino), esperado)
+                self.assertEqual((camino[0], camino[-1]), (origen, destino))
+                self.assertEqual(self.peso_del_camino(grafo, camino), distancia)
+
+    def test_pesos_flotantes_y_ceros(self):
+        grafo = ponderado_aleatorio(60, 250, 2, pesos=lambda a: a.choice((0, 0.5, 1.25, 3.0)), conexo=False)
+        grafo[1].append((1, 4))  # Los lazos no afectan las distancias
+        jerarquia = JerarquiaContraccion.construir(GrafoCSR.desde_ponderado(grafo))
+        for destino in range(1, 61):
+            try:
+                esperado = shortest_path(grafo, 7, destino)[0]
+            except ValueError:
+                continue
+            self.assertEqual(jerarquia.distancia(7, destino), esperado)
+
+    def test_coincide_con_dijkstra_en_grafo_conexo(self):
+        grafo = {1: [(2, 5), (3, 1)], 2: [(4, 2)], 3: [(2, 2), (4, 1)], 4: [(1, 3)]}
+        jerarquia = JerarquiaContraccion.construir(grafo)
+        for origen in grafo:
+            distancias = dijkstra(grafo, origen)
+            self.assertEqual({destino: jerarquia.distancia(origen, destino) for destino in grafo}, distancias)
+        self.assertEqual(jerarquia.shortest_path(1, 4), (2, [1, 3, 4]))
+
+    def test_nodo_inexistente(self):
+        jerarquia = JerarquiaContraccion.construir({1: [(2, 1)], 2: []})
+        with self.assertRaises(ValueError):
+            jerarquia.distancia(1, 3)
+        with self.assertRaises(ValueError):
+            jerarquia.distancia(2, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from modulo.delta_stepping import delta_stepping
+from modulo.Dijkstra import dijkstra
+from modulo.grafo_csr import GrafoCSR
+
+from grafos_prueba import ponderado_aleatorio
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestDeltaStepping(unittest.TestCase):
+
+    MOTORES = ("python",) if numpy is None else ("python", "numpy")
+
+    def test_mismas_distancias_que_dijkstra(self):
+        grafo = GrafoCSR.desde_ponderado(ponderado_aleatorio(500, 2000, 1, pesos=lambda a: a.randint(0, 100)))
+        esperado = dijkstra(grafo, 1)
+        for motor in self.MOTORES:
+            for delta in (None, 1, 7, 10 ** 6):
+                self.assertEqual(delta_stepping(grafo, 1, delta, motor), esperado)
+
+    def test_pesos_flotantes(self):
+        grafo = ponderado_aleatorio(300, 900, 2, pesos=lambda a: a.random() * 10)
+        esperado = dijkstra(grafo, 5)
+        for motor in self.MOTORES:
+            self.assertEqual(delta_stepping(grafo, 5, 0.5, motor), esperado)
+
+    @unittest.skipIf(numpy is None, "NumPy no está instalado")
+    def test_enteros_como_enteros(self):
+        distancias = delta_stepping({1: [(2, 3)], 2: [(1, 1)]}, 1, motor="numpy")
+        self.assertEqual(distancias, {1: 0, 2: 3})
+        self.assertIsInstance(distancias[2], int)
+
+    def test_enteros_grandes_exactos(self):
+        # Por encima de 2**53 un float64 ya no distingue enteros consecutivos
+        grafo = {1: [(2, 2 ** 53 + 1)], 2: [(3, 1)], 3: []}
+        for motor in self.MOTORES:
+            self.assertEqual(delta_stepping(grafo, 1, motor=motor), dijkstra(grafo, 1))
+            self.assertEqual(delta_stepping(grafo, 1, delta=float('inf'), motor=motor), dijkstra(grafo, 1))
+        # Distancias que no caben en int64: se calculan con el motor de Python
+        grafo = {1: [(2, 2 ** 62)], 2: [(3, 2 ** 62)], 3: []}
+        for motor in self.MOTORES:
+            self.assertEqual(delta_stepping(grafo, 1, motor=motor), {1: 0, 2: 2 ** 62, 3: 2 ** 63})
+
+    def test_grafo_disconexo(self):
+        for motor in self.MOTORES:
+            with self.assertRaises(ValueError):
+                delta_stepping({1: [(2, 1)], 2: [], 3: []}, 1, motor=motor)
+
+    def test_parametros_invalidos(self):
+        grafo = {1: [(2, 1)], 2: []}
+        with self.assertRaises(ValueError):
+            delta_stepping(grafo, 1, delta=0)
+        with self.assertRaises(ValueError):
+            delta_stepping(grafo, 1, motor="gpu")
+        with self.assertRaises(ValueError):
+            delta_stepping(grafo, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import random
+import unittest
+from modulo.contiene_ciclo import contiene_ciclo
+from modulo.detector_ciclos import DetectorCiclos
+from modulo.kruskal import UnionFind
+
+
+class TestDetectorCiclos(unittest.TestCase):
+
+    def test_arista_que_cierra_el_ciclo(self):
+        detector = DetectorCiclos()
+        self.assertFalse(detector.agregar_arista(1, 2))
+        self.assertFalse(detector.agregar_arista(2, 3))
+        self.assertFalse(detector.tiene_ciclo)
+        self.assertTrue(detector.agregar_arista(3, 1))
+        self.assertTrue(detector.agregar_arista(2, 1))
+        # Se conserva la primera arista que cerró un ciclo
+        self.assertEqual(detector.primera_arista_ciclo, (3, 1))
+        self.assertEqual((len(detector), detector.num_aristas), (3, 4))
+
+    def test_lazo_y_arista_repetida(self):
+        self.assertTrue(DetectorCiclos([(5, 5)]).tiene_ciclo)
+        self.assertTrue(DetectorCiclos([(5, 6), (6, 5)]).tiene_ciclo)
+
+    def test_lotes(self):
+        detector = DetectorCiclos()
+        self.assertFalse(detector.agregar_aristas([(10, 20), (20, 30)]))
+        self.assertFalse(detector.agregar_aristas([]))
+        self.assertTrue(detector.agregar_aristas([(40, 50), (30, 10), (50, 40)]))
+        self.assertEqual(detector.primera_arista_ciclo, (30, 10))
+
+    def test_coincide_con_contiene_ciclo(self):
+        # Tras cada arista, el detector debe coincidir con una DFS completa
+        aleatorio = random.Random(4)
+        detector = DetectorCiclos()
+        grafo = {}
+        vistas = set()
+        for _ in range(40):
+            nodo1, nodo2 = aleatorio.randint(1, 60), aleatorio.randint(1, 60)
+            if frozenset((nodo1, nodo2)) in vistas:
+                continue  # Las aristas repetidas son paralelas para el detector
+            vistas.add(frozenset((nodo1, nodo2)))
+            detector.agregar_arista(nodo1, nodo2)
+            grafo.setdefault(nodo1, []).append(nodo2)
+            if nodo1 != nodo2:
+                grafo.setdefault(nodo2, []).append(nodo1)
+            self.assertEqual(detector.tiene_ciclo, contiene_ciclo(grafo))
+
+    def test_nodos_invalidos(self):
+        detector = DetectorCiclos()
+        with self.assertRaises(ValueError):
+            detector.agregar_arista(1, 0)
+        with self.assertRaises(ValueError):
+            detector.agregar_aristas([(1, 2), (2, 'a')])
+        self.assertEqual(len(detector), 0)
+
+    def test_union_find_agregar(self):
+        uf = UnionFind(2)
+        self.assertEqual(uf.agregar(), 2)
+        self.assertEqual(uf.components, 3)
+        self.assertTrue(uf.union(0, 2))
+        self.assertEqual(uf.component_size(2), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,11 @@
+import random
 import unittest
-from modulo.Dijkstra import dijkstra
+from modulo.Dijkstra import dijkstra, shortest_path
+from modulo.grafo_csr import GrafoCSR
+
+from grafos_prueba import ponderado_aleatorio
+
+
 class TestDijkstra(unittest.TestCase):
 
     def test_grafo_vacio(self):
@@ -152,6 +158,141 @@ class TestDijkstra(unittest.TestCase):
                 break  # Salimos del bucle al primer error
 """
 
+class TestShortestPath(unittest.TestCase):
+
+    def peso_del_camino(self, grafo, camino):
+        pesos = {(origen, destino): peso for origen, aristas in grafo.items() for destino, peso in aristas}
+        return sum(pesos[par] for par in zip(camino, camino[1:]))
+
+    def test_camino_simple(self):
+        grafo = {1: [(2, 5), (3, 1)], 2: [(4, 2)], 3: [(2, 2), (4, 1)], 4: []}
+        self.assertEqual(shortest_path(grafo, 1, 4), (2, [1, 3, 4]))
+        self.assertEqual(shortest_path(grafo, 1, 4, bidireccional=True), (2, [1, 3, 4]))
+
+    def test_mismo_nodo(self):
+        grafo = {1: [(2, 1)], 2: []}
+        self.assertEqual(shortest_path(grafo, 1, 1), (0, [1]))
+        self.assertEqual(shortest_path(grafo, 1, 1, bidireccional=True), (0, [1]))
+
+    def test_coincide_con_dijkstra(self):
+        # Ambas variantes deben dar las distancias de dijkstra y caminos válidos
+        grafo = ponderado_aleatorio(80, 400, 5, conexo=False)
+        csr = GrafoCSR.desde_ponderado(grafo)
+        for origen in (1, 17, 42):
+            for destino, distancia in self.distancias_alcanzables(csr, origen).items():
+                for bidireccional in (False, True):
+                    resultado, camino = shortest_path(csr, origen, destino, bidireccional)
+                    self.assertEqual(resultado, distancia)
+                    self.assertEqual((camino[0], camino[-1]), (origen, destino))
+                    self.assertEqual(self.peso_del_camino(grafo, camino), distancia)
+
+    def distancias_alcanzables(self, csr, origen):
+        # dijkstra exige conectividad, así que comparamos sobre el subgrafo alcanzable
+        alcanzables = {origen}
+        pendientes = [origen]
+        while pendientes:
+            for vecino, _ in csr.vecinos(pendientes.pop()):
+                if vecino not in alcanzables:
+                    alcanzables.add(vecino)
+                    pendientes.append(vecino)
+        subgrafo = {nodo: csr.vecinos(nodo) for nodo in alcanzables}
+        return dijkstra(subgrafo, origen)
+
+    def test_sin_camino(self):
+        grafo = {1: [(2, 1)], 2: [], 3: [(1, 1)]}
+        with self.assertRaises(ValueError):
+            shortest_path(grafo, 1, 3)
+        with self.assertRaises(ValueError):
+            shortest_path(grafo, 1, 3, bidireccional=True)
+
+    def test_nodo_inexistente(self):
+        with self.assertRaises(ValueError):
+            shortest_path({1: [(2, 1)], 2: []}, 1, 5)
+
+
+class TestColasDijkstra(unittest.TestCase):
+
+    COLAS = ("heap", "buckets", "radix", "indexada")
+
+    def test_colas_dan_el_mismo_resultado(self):
+        # Todas las colas deben coincidir con heapq, con pesos pequeños, grandes y con ceros
+        for semilla, pesos in ((1, lambda a: a.randint(0, 10)), (2, lambda a: a.randint(0, 10 ** 9)),
+                               (3, lambda a: a.choice((0, 1)))):
+            grafo = ponderado_aleatorio(150, 600, semilla, pesos)
+            esperado = dijkstra(grafo, 1, cola="heap")
+            # La cola de buckets reserva un bucket por valor de peso, así que no se prueba con pesos enormes
+            colas = self.COLAS if semilla != 2 else ("heap", "radix", "indexada")
+            for cola in colas + ("auto",):
+                self.assertEqual(dijkstra(grafo, 1, cola=cola), esperado)
+                self.assertEqual(dijkstra(GrafoCSR.desde_ponderado(grafo), 1, cola=cola), esperado)
+
+    def test_pesos_flotantes(self):
+        # Con pesos flotantes solo valen heap e indexada; "auto" elige heap
+        grafo = ponderado_aleatorio(60, 200, 4, lambda a: a.random())
+        esperado = dijkstra(grafo, 1, cola="heap")
+        self.assertEqual(dijkstra(grafo, 1), esperado)
+        self.assertEqual(dijkstra(grafo, 1, cola="indexada"), esperado)
+        for cola in ("buckets", "radix"):
+            with self.assertRaises(ValueError):
+                dijkstra(grafo, 1, cola=cola)
+
+    def test_cola_invalida(self):
+        with self.assertRaises(ValueError):
+            dijkstra({1: [(2, 1)], 2: []}, 1, cola="fibonacci")
+
+
+class TestDijkstraAcotado(unittest.TestCase):
+
+    GRAFO = {1: [(2, 4), (3, 1)], 2: [(4, 1)], 3: [(2, 2), (5, 7)], 4: [], 5: [], 6: [(1, 1)]}
+
+    def test_max_distance(self):
+        # El nodo 6 no es alcanzable: la búsqueda acotada no exige conectividad
+        self.assertEqual(dijkstra(self.GRAFO, 1, max_distance=3), {1: 0, 3: 1, 2: 3})
+        self.assertEqual(dijkstra(self.GRAFO, 1, max_distance=100), {1: 0, 3: 1, 2: 3, 4: 4, 5: 8})
+
+    def test_k_nearest(self):
+        self.assertEqual(dijkstra(self.GRAFO, 1, k_nearest=2), {1: 0, 3: 1})
+        self.assertEqual(dijkstra(self.GRAFO, 1, k_nearest=1, targets=[4, 5]), {4: 4})
+
+    def test_targets(self):
+        self.assertEqual(dijkstra(self.GRAFO, 1, targets=[5, 2]), {2: 3, 5: 8})
+        # Un objetivo inalcanzable simplemente no aparece
+        self.assertEqual(dijkstra(self.GRAFO, 1, targets=[6, 4]), {4: 4})
+        with self.assertRaises(ValueError):
+            dijkstra(self.GRAFO, 1, targets=[9])
+
+    def test_csr_y_colas(self):
+        grafo = GrafoCSR.desde_ponderado(self.GRAFO)
+        for cola in ("auto", "heap", "buckets", "radix", "indexada"):
+            self.assertEqual(dijkstra(grafo, 1, cola=cola, max_distance=4), {1: 0, 3: 1, 2: 3, 4: 4})
+            self.assertEqual(dijkstra(self.GRAFO, 1, cola=cola, targets=[5]), {5: 8})
+
+    def test_coincide_con_dijkstra_completo(self):
+        aleatorio = random.Random(8)
+        grafo = {i: {i % 200 + 1: aleatorio.randint(0, 30)} for i in range(1, 201)}
+        for _ in range(800):
+            grafo[aleatorio.randint(1, 200)][aleatorio.randint(1, 200)] = aleatorio.randint(0, 30)
+        grafo = {nodo: list(aristas.items()) for nodo, aristas in grafo.items()}
+        completo = dijkstra(grafo, 1)
+        radio = dijkstra(grafo, 1, max_distance=40)
+        self.assertEqual(radio, {nodo: d for nodo, d in completo.items() if d <= 40})
+        cercanos = dijkstra(GrafoCSR.desde_ponderado(grafo), 1, k_nearest=10)
+        self.assertEqual(sorted(cercanos.values()), sorted(completo.values())[:10])
+
+    def test_solo_valida_lo_explorado(self):
+        # La lista inválida del nodo 3 no se alcanza dentro del radio
+        grafo = {1: [(2, 1)], 2: [(3, 5)], 3: [(1, -1)]}
+        self.assertEqual(dijkstra(grafo, 1, max_distance=2), {1: 0, 2: 1})
+        with self.assertRaises(ValueError):
+            dijkstra(grafo, 1, max_distance=10)
+
+    def test_limites_invalidos(self):
+        with self.assertRaises(ValueError):
+            dijkstra(self.GRAFO, 1, max_distance=-1)
+        with self.assertRaises(ValueError):
+            dijkstra(self.GRAFO, 1, k_nearest=0)
+
+
 if __name__ == '__main__':
     unittest.main()
 
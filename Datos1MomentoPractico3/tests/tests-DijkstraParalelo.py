@@ -0,0 +1,104 @@
+import unittest
+import modulo.dijkstra_paralelo as modulo_paralelo
+from modulo.Dijkstra import dijkstra
+from modulo.dijkstra_paralelo import dijkstra_many, dijkstra_many_filas
+from modulo.grafo_csr import GrafoCSR
+
+from grafos_prueba import ponderado_aleatorio, repartir_siempre
+
+
+class TestDijkstraMany(unittest.TestCase):
+
+    def setUp(self):
+        # Forzamos el reparto entre procesos aun con pocos orígenes
+        repartir_siempre(self, modulo_paralelo, "_MIN_ORIGENES_POR_PROCESO")
+
+    def test_coincide_con_dijkstra(self):
+        grafo = ponderado_aleatorio(120, 500, 1)
+        origenes = [1, 7, 50, 120, 7]
+        for workers in (1, 3):
+            matriz = dijkstra_many(grafo, origenes, workers=workers)
+            self.assertEqual(len(matriz), len(origenes))
+            for origen in origenes:
+                self.assertEqual(matriz.como_diccionario(origen), dijkstra(grafo, origen))
+
+    def test_pesos_flotantes_y_grafo_congelado(self):
+        grafo = ponderado_aleatorio(60, 200, 2, pesos=lambda a: a.random())
+        csr = GrafoCSR.desde_ponderado(grafo).congelar()
+        matriz = dijkstra_many(csr, [3, 30], workers=2)
+        self.assertEqual(matriz.distancia(3, 30), dijkstra(grafo, 3)[30])
+        self.assertEqual(matriz.como_diccionario(30), dijkstra(grafo, 30))
+
+    def test_filas_en_orden(self):
+        grafo = ponderado_aleatorio(80, 300, 3)
+        csr = GrafoCSR.desde_ponderado(grafo)
+        filas = list(dijkstra_many_filas(csr, [5, 2, 9], workers=2))
+        self.assertEqual([origen for origen, _ in filas], [5, 2, 9])
+        for origen, fila in filas:
+            self.assertEqual(dict(zip(csr.ids, fila)), dijkstra(grafo, origen))
+
+    def test_grafo_disconexo(self):
+        # Los nodos no alcanzables quedan con distancia infinita en lugar de lanzar un error
+        matriz = dijkstra_many({1: [(2, 4)], 2: [], 3: [(1, 1)]}, [1, 3], workers=1)
+        self.assertEqual(matriz.distancia(1, 2), 4)
+        self.assertEqual(matriz.distancia(1, 3), float('inf'))
+        self.assertEqual(matriz.distancia(3, 2), 5)
+
+    def test_enteros_exactos(self):
+        # Con pesos enteros las filas son enteras: por encima de 2**53 un float64 ya no coincidiría con dijkstra
+        grafo = {1: [(2, 2 ** 53 + 1)], 2: [(3, 1)], 3: [], 4: [(1, 1)]}
+        for workers in (1, 2):
+            matriz = dijkstra_many(grafo, [1, 4], workers=workers)
+            self.assertEqual(list(matriz.fila(1)), [0, 2 ** 53 + 1, 2 ** 53 + 2, modulo_paralelo.SIN_CAMINO])
+            self.assertEqual(matriz.distancia(1, 4), float('inf'))
+            self.assertEqual(matriz.como_diccionario(4), dijkstra(grafo, 4))
+            self.assertIsInstance(matriz.distancia(4, 3), int)
+        # Si las distancias pudieran no caber en int64, las filas vuelven a ser flotantes
+        matriz = dijkstra_many({1: [(2, 2 ** 62)], 2: [(3, 2 ** 62)], 3: []}, [1], workers=1)
+        self.assertEqual(matriz.fila(1).typecode, 'd')
+        self.assertEqual(matriz.distancia(1, 3), 2.0 ** 63)
+
+    def test_validaciones(self):
+        grafo = {1: [(2, 1)], 2: []}
+        with self.assertRaises(ValueError):
+            dijkstra_many(grafo, [1, 5])
+        with self.assertRaises(ValueError):
+            dijkstra_many_filas(grafo, [1], workers=0)
+        with self.assertRaises(ValueError):
+            dijkstra_many_filas(grafo, [1], cola="fibonacci")
+        with self.assertRaises(ValueError):
+            dijkstra_many(grafo, [1]).distancia(2, 1)
+
+    def test_ventana_acotada(self):
+        # Con un consumidor lento, las tareas enviadas sin consumir nunca superan la ventana
+        enviadas, consumidas, maximo = [], 0, 0
+
+        class Resultado:
+            def __init__(self, valor):
+                self.valor = valor
+
+            def get(self):
+                return self.valor
+
+        def enviar(argumento):
+            enviadas.append(argumento)
+            return Resultado(argumento * 10)
+
+        resultados = []
+        for valor in modulo_paralelo._en_ventana(enviar, range(50), 4):
+            consumidas += 1
+            maximo = max(maximo, len(enviadas) - consumidas + 1)
+            resultados.append(valor)
+        self.assertEqual(resultados, [i * 10 for i in range(50)])
+        self.assertEqual(maximo, 4)
+
+        # Con procesos reales se puede consumir solo una parte de las filas y cerrar el generador
+        grafo = ponderado_aleatorio(40, 100, 4)
+        filas = dijkstra_many_filas(grafo, list(range(1, 41)), workers=2)
+        origen, fila = next(filas)
+        self.assertEqual(dict(zip(GrafoCSR.desde_ponderado(grafo).ids, fila)), dijkstra(grafo, origen))
+        filas.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+import json
+import unittest
+
+from modulo.contiene_ciclo import contiene_ciclo
+from modulo.Dijkstra import dijkstra
+from modulo.estadisticas import Estadisticas
+from modulo.grafo_csr import GrafoCSR
+from modulo.kruskal import UnionFind, UnionFindInstrumentado, kruskal
+
+from grafos_prueba import aristas_aleatorias, como_ponderado
+
+
+def grafo_aleatorio(semilla):
+    return aristas_aleatorias(60, 120, semilla, pesos=lambda a: a.randint(1, 20), simples=True)
+
+
+class TestEstadisticas(unittest.TestCase):
+
+    # 1. Contadores, máximos, fases acumuladas y exportación a JSON
+    def test_objeto_estadisticas(self):
+        estadisticas = Estadisticas()
+        estadisticas.sumar("a")
+        estadisticas.sumar("a", 4)
+        estadisticas.maximo("b", 3)
+        estadisticas.maximo("b", 1)
+        estadisticas.maximo("c", 0)
+        for _ in range(2):
+            with estadisticas.fase("f"):
+                pass
+        with self.assertRaises(KeyError):
+            with estadisticas.fase("g"):
+                raise KeyError
+        exportado = estadisticas.como_diccionario()
+        self.assertEqual(exportado["contadores"], {"a": 5, "b": 3, "c": 0})
+        self.assertEqual(set(exportado["tiempos"]), {"f", "g"})
+        self.assertEqual(json.loads(json.dumps(exportado)), exportado)
+        estadisticas.reiniciar()
+        self.assertEqual(estadisticas.como_diccionario(), {"contadores": {}, "tiempos": {}})
+        self.assertEqual(exportado["contadores"]["a"], 5)  # La exportación es una copia
+
+    # 2. Dijkstra: mismo resultado con y sin estadísticas, y contadores coherentes con cada cola y formato
+    def test_dijkstra(self):
+        aristas = grafo_aleatorio(24)
+        ponderado = como_ponderado(aristas)
+        csr = GrafoCSR.desde_ponderado(ponderado)
+        esperado = dijkstra(ponderado, 1)
+        for grafo in (ponderado, csr):
+            for cola in ("heap", "buckets", "radix", "indexada"):
+                estadisticas = Estadisticas()
+                self.assertEqual(dijkstra(grafo, 1, cola=cola, estadisticas=estadisticas), esperado)
+                contadores = estadisticas.contadores
+                self.assertEqual(contadores["nodos_asentados"], 60)
+                self.assertEqual(contadores["aristas_revisadas"], 2 * len(aristas))
+                self.assertEqual(contadores["extracciones"],
+                                 contadores["nodos_asentados"] + contadores["extracciones_obsoletas"])
+                self.assertEqual(contadores["relajaciones"], contadores["inserciones"] - 1)
+                self.assertLessEqual(contadores["relajaciones"], contadores["aristas_revisadas"])
+                self.assertEqual(set(estadisticas.tiempos), {"validacion", "busqueda"})
+                if cola == "indexada":
+                    self.assertEqual(contadores["extracciones_obsoletas"], 0)  # Disminuye claves en lugar de repetir
+
+    # 3. Dijkstra acotado: solo cuenta la región explorada
+    def test_dijkstra_acotado(self):
+        ponderado = como_ponderado(grafo_aleatorio(25))
+        for grafo in (ponderado, GrafoCSR.desde_ponderado(ponderado)):
+            estadisticas = Estadisticas()
+            self.assertEqual(len(dijkstra(grafo, 1, k_nearest=5, estadisticas=estadisticas)), 5)
+            self.assertEqual(estadisticas.contadores["nodos_asentados"], 5)
+            self.assertLess(estadisticas.contadores["aristas_revisadas"], 2 * len(grafo_aleatorio(25)))
+
+            estadisticas = Estadisticas()
+            dijkstra(grafo, 1, max_distance=3, estadisticas=estadisticas)
+            contadores = estadisticas.contadores
+            self.assertGreaterEqual(contadores["extracciones_obsoletas"], 0)
+            cortes = contadores["extracciones"] - contadores["nodos_asentados"] - contadores["extracciones_obsoletas"]
+            self.assertIn(cortes, (0, 1))  # La extracción que superó el radio, si la hubo
+
+    # 4. UnionFindInstrumentado da los mismos resultados que UnionFind y cuenta sus operaciones
+    def test_union_find_instrumentado(self):
+        estadisticas = Estadisticas()
+        uf, base = UnionFindInstrumentado(6, estadisticas), UnionFind(6)
+        for x, y in [(0, 1), (2, 3), (1, 3), (0, 2)]:
+            self.assertEqual(uf.union(x, y), base.union(x, y))
+        self.assertEqual(list(uf.union_many([4, 0], [5, 3])), list(base.union_many([4, 0], [5, 3])))
+        self.assertEqual(list(uf.find_many(range(6))), list(base.find_many(range(6))))
+        contadores = estadisticas.contadores
+        self.assertEqual(contadores["uniones"], 4)
+        self.assertEqual(contadores["uniones_redundantes"], 2)
+        self.assertEqual(contadores["busquedas"], 2 * 6 + 6)
+        self.assertGreater(contadores["pasos_busqueda"], 0)
+        self.assertGreaterEqual(contadores["pasos_busqueda"], contadores["camino_maximo"])
+        with self.assertRaises(ValueError):
+            uf.union_many([0], [])
+
+    # 5. Kruskal: las fases, las aristas revisadas antes de completar el árbol y los contadores de UnionFind
+    def test_kruskal(self):
+        aristas = grafo_aleatorio(26)
+        aristas.append((1, 61, 1000))  # La arista más pesada es un puente: se revisan todas
+        for grafo in (aristas, GrafoCSR.desde_aristas(aristas)):
+            for modo in ("ordenado", "heap"):
+                estadisticas = Estadisticas()
+                self.assertEqual(kruskal(grafo, modo, estadisticas=estadisticas), kruskal(grafo, modo))
+                self.assertEqual(estadisticas.contadores["aristas_revisadas"], len(aristas))
+                self.assertEqual(estadisticas.contadores["uniones"], 60)
+                self.assertTrue({"ordenamiento", "union"} <= set(estadisticas.tiempos))
+
+        estadisticas = Estadisticas()
+        kruskal(aristas[:-1] + [(1, 61, 1)], estadisticas=estadisticas)  # El árbol se completa antes
+        self.assertLess(estadisticas.contadores["aristas_revisadas"], len(aristas))
+        self.assertIn("validacion", estadisticas.tiempos)
+
+    # 6. contiene_ciclo: nodos y aristas visitados hasta encontrar el ciclo o terminar
+    def test_contiene_ciclo(self):
+        camino = {i: [j for j in (i - 1, i + 1) if 1 <= j <= 50] for i in range(1, 51)}
+        estadisticas = Estadisticas()
+        self.assertFalse(contiene_ciclo(camino, estadisticas=estadisticas))
+        self.assertEqual(estadisticas.contadores, {"nodos_visitados": 50, "aristas_revisadas": 98})
+        self.assertEqual(set(estadisticas.tiempos), {"validacion", "busqueda"})
+
+        camino[50].append(1)
+        camino[1].append(50)
+        estadisticas = Estadisticas()
+        self.assertTrue(contiene_ciclo(GrafoCSR.desde_adyacencia(camino), estadisticas=estadisticas))
+        self.assertEqual(estadisticas.contadores["nodos_visitados"], 50)
+        self.assertLessEqual(estadisticas.contadores["aristas_revisadas"], 100)
+        self.assertEqual(set(estadisticas.tiempos), {"busqueda"})
+
+    # 7. Una misma instancia acumula varias ejecuciones
+    def test_acumula_ejecuciones(self):
+        grafo = {1: [(2, 1)], 2: [(1, 1)]}
+        estadisticas = Estadisticas()
+        dijkstra(grafo, 1, estadisticas=estadisticas)
+        dijkstra(grafo, 2, estadisticas=estadisticas)
+        self.assertEqual(estadisticas.contadores["nodos_asentados"], 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,185 @@
+import os
+import tempfile
+import unittest
+from modulo.componentes import connected_components
+from modulo.grafo_csr import GrafoCSR
+from modulo.kruskal import kruskal
+from modulo.contiene_ciclo import contiene_ciclo
+from modulo.Dijkstra import dijkstra, shortest_path, verificar_conectividad
+
+
+class TestGrafoCSR(unittest.TestCase):
+
+    def test_desde_aristas_almacena_ambos_sentidos(self):
+        # Cada arista no dirigida debe quedar almacenada dos veces.
+        grafo = GrafoCSR.desde_aristas([(1, 2, 5), (2, 3, 7)])
+        self.assertEqual(len(grafo), 3)
+        self.assertEqual(grafo.num_aristas, 4)
+        self.assertEqual(sorted(grafo.vecinos(2)), [(1, 5), (3, 7)])
+
+    def test_desde_ponderado_destino_sin_llave(self):
+        # Un destino que no es llave se agrega como nodo sin aristas salientes.
+        grafo = GrafoCSR.desde_ponderado({1: [(2, 1.5)]})
+        self.assertEqual(len(grafo), 2)
+        self.assertEqual(grafo.vecinos(2), [])
+        self.assertEqual(grafo.pesos.typecode, 'd')
+
+    def test_transpuesto(self):
+        grafo = GrafoCSR.desde_ponderado({1: [(2, 4), (3, 1)], 2: [(3, 2)], 3: []})
+        transpuesto = grafo.transpuesto()
+        self.assertEqual(sorted(transpuesto.vecinos(3)), [(1, 1), (2, 2)])
+        self.assertEqual(transpuesto.vecinos(1), [])
+        self.assertIs(grafo.transpuesto(), transpuesto)
+        no_dirigido = GrafoCSR.desde_aristas([(1, 2, 1)])
+        self.assertIs(no_dirigido.transpuesto(), no_dirigido)
+
+    def test_validaciones_de_los_constructores(self):
+        # Los constructores aplican las mismas reglas que las funciones originales.
+        with self.assertRaises(ValueError):
+            GrafoCSR.desde_aristas([(1, 'b', 10)])
+        with self.assertRaises(ValueError):
+            GrafoCSR.desde_adyacencia({1: [2], 2: [1], 3: [4]})
+        with self.assertRaises(ValueError):
+            GrafoCSR.desde_ponderado({1: [(2, 1), (2, 2)], 2: []})
+        with self.assertRaises(ValueError):
+            GrafoCSR.desde_ponderado({1: [(2, -1)], 2: []})
+
+    def test_kruskal_csr(self):
+        # Kruskal sobre CSR debe dar el mismo peso total que sobre la lista de aristas.
+        aristas = [(1, 2, 1), (2, 3, 2), (3, 4, 3), (1, 4, 4), (1, 3, 1)]
+        resultado = kruskal(GrafoCSR.desde_aristas(aristas))
+        self.assertEqual(len(resultado), 3)
+        self.assertEqual(sum(peso for _, _, peso in resultado), sum(peso for _, _, peso in kruskal(list(aristas))))
+
+    def test_kruskal_csr_modo_heap(self):
+        grafo = GrafoCSR.desde_ponderado({1: [(2, 1.5), (3, 0.5)], 2: [(3, 2.0)], 3: []})
+        self.assertEqual(kruskal(grafo, modo="heap"), kruskal(grafo))
+
+    def test_kruskal_csr_disconexo(self):
+        with self.assertRaises(ValueError):
+            kruskal(GrafoCSR.desde_aristas([(1, 2, 10), (3, 4, 20)]))
+
+    def test_contiene_ciclo_csr(self):
+        self.assertTrue(contiene_ciclo(GrafoCSR.desde_adyacencia({1: [2], 2: [1, 3], 3: [2, 1]})))
+        self.assertFalse(contiene_ciclo(GrafoCSR.desde_adyacencia({1: [2], 2: [1, 3], 3: [2], 4: []})))
+
+    def test_dijkstra_csr(self):
+        grafo = {1: [(2, 5), (3, 1)], 2: [(4, 2)], 3: [(2, 2), (4, 1)], 4: []}
+        self.assertEqual(dijkstra(GrafoCSR.desde_ponderado(grafo), 1), dijkstra(grafo, 1))
+
+    def test_dijkstra_csr_disconexo(self):
+        grafo = GrafoCSR.desde_ponderado({1: [(2, 1)], 2: [(3, 1)], 3: [], 4: []})
+        self.assertFalse(verificar_conectividad(grafo, 1))
+        with self.assertRaises(ValueError):
+            dijkstra(grafo, 1)
+
+    def test_dijkstra_csr_nodo_inicio_no_existe(self):
+        with self.assertRaises(ValueError):
+            dijkstra(GrafoCSR.desde_ponderado({1: [(2, 1)], 2: []}), 3)
+
+    def test_congelar(self):
+        grafo = GrafoCSR.desde_ponderado({1: [(2, 1)], 2: [(1, 3)]})
+        self.assertFalse(grafo.congelado)
+        self.assertIs(grafo.congelar(), grafo)
+        version = grafo.version
+        self.assertIsNotNone(version)
+        self.assertEqual(grafo.congelar().version, version)  # Congelar dos veces no cambia la versión
+        self.assertNotEqual(GrafoCSR.desde_aristas([(1, 2, 1)]).congelar().version, version)
+        with self.assertRaises(TypeError):
+            grafo.pesos[0] = 7
+        self.assertTrue(grafo.transpuesto().congelado)
+
+    def test_grafo_congelado_en_todas_las_funciones(self):
+        aristas = [(1, 2, 1), (2, 3, 2), (1, 3, 4)]
+        grafo = GrafoCSR.desde_aristas(aristas).congelar()
+        self.assertEqual(grafo.tipo_pesos, 'q')
+        self.assertEqual(dijkstra(grafo, 1), {1: 0, 2: 1, 3: 3})
+        self.assertEqual(shortest_path(grafo, 1, 3, bidireccional=True), (3, [1, 2, 3]))
+        self.assertEqual(kruskal(grafo), [(1, 2, 1), (2, 3, 2)])
+        self.assertTrue(contiene_ciclo(grafo))
+
+
+class TestArchivoGrafo(unittest.TestCase):
+
+    def setUp(self):
+        self.carpeta = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.carpeta.name, "grafo.bin")
+
+    def tearDown(self):
+        self.carpeta.cleanup()
+
+    def test_ida_y_vuelta_no_dirigido(self):
+        aristas = [(10, 20, 3), (20, 30, 1), (10, 30, 5), (40, 50, 2)]
+        original = GrafoCSR.desde_aristas(aristas)
+        original.guardar(self.ruta)
+        cargado = GrafoCSR.cargar(self.ruta)
+        self.assertEqual(len(cargado), len(original))
+        self.assertFalse(cargado.dirigido)
+        self.assertEqual(cargado.tipo_pesos, 'q')
+        self.assertEqual(list(cargado.ids), list(original.ids))
+        self.assertEqual(sorted(cargado.vecinos(20)), sorted(original.vecinos(20)))
+        self.assertTrue(contiene_ciclo(cargado))
+        self.assertEqual(list(connected_components(cargado)[1]), [3, 2])
+        conexo = GrafoCSR.desde_aristas(aristas[:3])
+        conexo.guardar(self.ruta)
+        self.assertEqual(kruskal(GrafoCSR.cargar(self.ruta)), kruskal(conexo))
+
+    def test_ida_y_vuelta_ponderado_y_sin_pesos(self):
+        grafo = {1: [(2, 1.5), (3, 4.0)], 2: [(3, 2.0)], 3: [(1, 0.5)]}
+        GrafoCSR.desde_ponderado(grafo).guardar(self.ruta)
+        cargado = GrafoCSR.cargar(self.ruta)
+        self.assertTrue(cargado.dirigido)
+        self.assertEqual(cargado.tipo_pesos, 'd')
+        self.assertEqual(dijkstra(cargado, 1), dijkstra(grafo, 1))
+        self.assertEqual(shortest_path(cargado, 1, 3, bidireccional=True), shortest_path(grafo, 1, 3))
+
+        GrafoCSR.desde_adyacencia({1: [2], 2: [1, 3], 3: [2]}).guardar(self.ruta)
+        cargado = GrafoCSR.cargar(self.ruta)
+        self.assertIsNone(cargado.pesos)
+        self.assertFalse(contiene_ciclo(cargado))
+
+    def test_arreglos_mapeados_de_solo_lectura(self):
+        GrafoCSR.desde_aristas([(1, 2, 1)]).guardar(self.ruta)
+        cargado = GrafoCSR.cargar(self.ruta)
+        self.assertTrue(cargado.congelado)
+        with self.assertRaises(TypeError):
+            cargado.pesos[0] = 7
+        with self.assertRaises(ValueError):
+            GrafoCSR.cargar(self.ruta).tabla.indice(3)
+
+    def test_archivos_invalidos(self):
+        with open(self.ruta, "wb") as archivo:
+            archivo.write(b"no es un grafo")
+        with self.assertRaises(ValueError):
+            GrafoCSR.cargar(self.ruta)
+        open(self.ruta, "wb").close()
+        with self.assertRaises(ValueError):
+            GrafoCSR.cargar(self.ruta)
+        # Un archivo truncado se rechaza
+        GrafoCSR.desde_aristas([(1, 2, 1), (2, 3, 1)]).guardar(self.ruta)
+        with open(self.ruta, "r+b") as archivo:
+            archivo.truncate(os.path.getsize(self.ruta) - 8)
+        with self.assertRaises(ValueError):
+            GrafoCSR.cargar(self.ruta)
+
+    def test_peso_max(self):
+        # El peso máximo se calcula al construir el grafo y se guarda en el archivo, para no recorrer los pesos
+        # en cada consulta
+        grafo = GrafoCSR.desde_ponderado({1: [(2, 7)], 2: [(3, 70000)], 3: []})
+        self.assertEqual(grafo.peso_max, 70000)
+        self.assertEqual(grafo.transpuesto().peso_max, 70000)
+        grafo.guardar(self.ruta)
+        self.assertEqual(GrafoCSR.cargar(self.ruta).peso_max, 70000)
+        GrafoCSR.desde_ponderado({1: [(2, 1.5)], 2: [(3, 0.25)], 3: []}).guardar(self.ruta)
+        self.assertEqual(GrafoCSR.cargar(self.ruta).peso_max, 1.5)
+        GrafoCSR.desde_adyacencia({1: [2], 2: [1]}).guardar(self.ruta)
+        self.assertIsNone(GrafoCSR.cargar(self.ruta).peso_max)
+        self.assertEqual(GrafoCSR([0], [], [], []).peso_max, 0)
+
+    def test_ids_no_enteros(self):
+        with self.assertRaises(ValueError):
+            GrafoCSR([0, 0], [], None, ["a"]).guardar(self.ruta)
+
+
+if __name__ == '__main__':
+    unittest.main()
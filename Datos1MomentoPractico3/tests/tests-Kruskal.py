@@ -1,6 +1,12 @@
+import random
 import unittest
 import time
-from modulo.kruskal import kruskal
+from modulo.kruskal import kruskal, prim_dense, UnionFind
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 class TestKruskal(unittest.TestCase):
 
@@ -99,6 +105,120 @@ class TestKruskal(unittest.TestCase):
         resultado = kruskal(grafo)
         self.assertEqual(resultado, [], "Un grafo con un solo nodo no tiene aristas")
 
+    def test_nodos_dispersos(self):
+        # Identificadores dispersos de 64 bits no deben provocar IndexError
+        a, b, c = 10, 2 ** 40, 2 ** 63 + 7
+        grafo = [(a, b, 3), (b, c, 1), (a, c, 2)]
+        resultado = kruskal(grafo)
+        self.assertEqual(resultado, [(b, c, 1), (a, c, 2)])
+        # Un identificador que no cabe en 64 bits es un error de la arista, como los demás
+        for modo in ("ordenado", "heap"):
+            with self.assertRaises(ValueError):
+                kruskal(grafo + [(c, 2 ** 64, 1)], modo=modo)
+
+    def test_nodos_no_consecutivos_disconexos(self):
+        grafo = [(5, 9, 1), (100, 200, 1)]
+        with self.assertRaises(ValueError):
+            kruskal(grafo)
+
+    def test_no_modifica_la_lista(self):
+        grafo = [(1, 3, 3), (2, 3, 2), (1, 2, 1)]
+        copia = list(grafo)
+        kruskal(grafo)
+        kruskal(grafo, modo="heap")
+        self.assertEqual(grafo, copia)
+
+    def test_modo_heap_igual_a_ordenado(self):
+        # Con empates de peso ambos modos deben elegir exactamente las mismas aristas
+        aleatorio = random.Random(7)
+        grafo = [(i, aleatorio.randint(1, i - 1), aleatorio.randint(0, 5)) for i in range(2, 80)]
+        grafo += [(aleatorio.randint(1, 79), aleatorio.randint(1, 79), aleatorio.randint(0, 5)) for _ in range(400)]
+        self.assertEqual(kruskal(grafo, modo="heap"), kruskal(grafo))
+
+    def test_modo_invalido(self):
+        with self.assertRaises(ValueError):
+            kruskal([(1, 2, 1)], modo="rapido")
+
+
+class TestUnionFind(unittest.TestCase):
+
+    def test_cadena_larga_sin_recursion(self):
+        # Una cadena muy larga no debe alcanzar el límite de recursión
+        n = 200000
+        uf = UnionFind(n)
+        for i in range(n - 1):
+            uf.parent[i] = i + 1  # Cadena sin comprimir: 0 -> 1 -> ... -> n-1
+        self.assertEqual(uf.find(0), n - 1)
+
+    def test_componentes_y_tamanos(self):
+        uf = UnionFind(5)
+        self.assertEqual(uf.components, 5)
+        self.assertTrue(uf.union(0, 1))
+        self.assertTrue(uf.union(1, 2))
+        self.assertFalse(uf.union(0, 2))
+        self.assertEqual(uf.components, 3)
+        self.assertEqual(uf.component_size(2), 3)
+        self.assertEqual(uf.component_size(4), 1)
+
+    def test_operaciones_en_lote(self):
+        uf = UnionFind(6)
+        unidos = uf.union_many([0, 2, 1, 4], [1, 3, 0, 5])
+        self.assertEqual(list(unidos), [1, 1, 0, 1])
+        self.assertEqual(uf.components, 3)
+        raices = uf.find_many([0, 1, 2, 3, 4, 5])
+        self.assertEqual(raices[0], raices[1])
+        self.assertEqual(raices[2], raices[3])
+        self.assertNotEqual(raices[0], raices[2])
+
+    def test_lotes_de_distinta_longitud(self):
+        with self.assertRaises(ValueError):
+            UnionFind(3).union_many([0, 1], [2])
+
+
+class TestPrimDense(unittest.TestCase):
+
+    def matriz_aleatoria(self, n, semilla):
+        aleatorio = random.Random(semilla)
+        matriz = [[0] * n for _ in range(n)]
+        for i in range(n):
+            for j in range(i + 1, n):
+                matriz[i][j] = matriz[j][i] = aleatorio.randint(1, 50)
+        return matriz
+
+    def test_mismo_peso_que_kruskal(self):
+        matriz = self.matriz_aleatoria(40, 1)
+        aristas = [(i + 1, j + 1, matriz[i][j]) for i in range(40) for j in range(i + 1, 40)]
+        resultado = prim_dense(matriz)
+        self.assertEqual(len(resultado), 39)
+        self.assertEqual(sum(p for _, _, p in resultado), sum(p for _, _, p in kruskal(aristas)))
+
+    def test_formato_de_salida(self):
+        matriz = [[0, 2, 9], [2, 0, 4], [9, 4, 0]]
+        self.assertEqual(prim_dense(matriz), [(1, 2, 2), (2, 3, 4)])
+
+    def test_grafo_disconexo(self):
+        infinito = float('inf')
+        matriz = [[0, 1, infinito], [1, 0, infinito], [infinito, infinito, 0]]
+        with self.assertRaises(ValueError):
+            prim_dense(matriz)
+
+    def test_matriz_invalida(self):
+        with self.assertRaises(ValueError):
+            prim_dense([[0, 1], [1]])
+        with self.assertRaises(ValueError):
+            prim_dense([[0, -1], [-1, 0]])
+
+    def test_casos_borde(self):
+        self.assertEqual(prim_dense([]), [])
+        self.assertEqual(prim_dense([[0]]), [])
+
+    @unittest.skipIf(numpy is None, "NumPy no está instalado")
+    def test_numpy_igual_a_listas(self):
+        matriz = self.matriz_aleatoria(60, 2)
+        self.assertEqual(prim_dense(numpy.array(matriz)), prim_dense(matriz))
+        with self.assertRaises(ValueError):
+            prim_dense(numpy.array([[0.0, numpy.inf], [numpy.inf, 0.0]]))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+from modulo.kruskal import kruskal
+from modulo.kruskal_externo import kruskal_externo, kruskal_externo_a_archivo
+
+from grafos_prueba import aristas_aleatorias
+
+
+def pesos_distintos(aleatorio):
+    # Con 2^48 valores posibles no hay empates, así que el árbol es único
+    return aleatorio.getrandbits(48)
+
+
+class TestKruskalExterno(unittest.TestCase):
+
+    def test_mismo_arbol_que_kruskal(self):
+        # Con un presupuesto mínimo se generan muchas corridas en disco
+        aristas = aristas_aleatorias(300, 1500, 1, pesos=pesos_distintos)
+        esperado = kruskal(list(aristas))
+        resultado = list(kruskal_externo(iter(aristas), memoria_max=120 * 50))
+        self.assertEqual(resultado, esperado)
+
+    def test_enteros_fuera_de_rango(self):
+        # Con cualquier presupuesto, pesos o nodos que no caben en 64 bits son errores de la arista
+        for arista in ((1, 3, 2 ** 63), (1, 2 ** 64, 1)):
+            for memoria_max in (120, 10 ** 6):
+                with self.assertRaises(ValueError):
+                    list(kruskal_externo([(1, 2, 5), arista], memoria_max=memoria_max))
+
+    def test_desde_archivo_hacia_archivo(self):
+        aristas = aristas_aleatorias(50, 100, 2, pesos=pesos_distintos)
+        with tempfile.TemporaryDirectory() as carpeta:
+            entrada = os.path.join(carpeta, "aristas.txt")
+            salida = os.path.join(carpeta, "agm.txt")
+            with open(entrada, "w") as archivo:
+                archivo.write("# nodo1 nodo2 peso\n")
+                archivo.writelines(f"{a},{b},{w}\n" for a, b, w in aristas)
+            total = kruskal_externo_a_archivo(entrada, salida, memoria_max=120 * 16)
+            with open(salida) as archivo:
+                escritas = [tuple(map(int, linea.split())) for linea in archivo]
+        self.assertEqual(total, 49)
+        self.assertEqual(escritas, kruskal(list(aristas)))
+
+    def test_grafo_vacio_y_un_nodo(self):
+        self.assertEqual(list(kruskal_externo([])), [])
+        self.assertEqual(list(kruskal_externo([(1, 1, 5)])), [])
+
+    def test_grafo_disconexo(self):
+        with self.assertRaises(ValueError):
+            list(kruskal_externo([(1, 2, 10), (3, 4, 20)], memoria_max=120))
+
+    def test_arista_invalida(self):
+        with self.assertRaises(ValueError):
+            list(kruskal_externo([(1, 2, 10), (2, 3)]))
+        with self.assertRaises(ValueError):
+            kruskal_externo([(1, 2, 10)], memoria_max=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
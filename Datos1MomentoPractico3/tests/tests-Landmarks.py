@@ -0,0 +1,81 @@
+import os
+import random
+import tempfile
+import unittest
+from modulo.Dijkstra import dijkstra, shortest_path
+from modulo.grafo_csr import GrafoCSR
+from modulo.landmarks import IndiceLandmarks
+
+from grafos_prueba import rejilla_ponderada
+
+
+class TestIndiceLandmarks(unittest.TestCase):
+
+    def test_mismas_distancias_que_dijkstra(self):
+        grafo = rejilla_ponderada(15, 1)
+        indice = IndiceLandmarks.construir(grafo, k=4, semilla=0)
+        self.assertEqual(len(indice), 4)
+        aleatorio = random.Random(2)
+        for _ in range(20):
+            origen, destino = aleatorio.randint(1, 225), aleatorio.randint(1, 225)
+            distancia, camino = indice.shortest_path(origen, destino)
+            self.assertEqual(distancia, dijkstra(grafo, origen)[destino])
+            self.assertEqual((camino[0], camino[-1]), (origen, destino))
+
+    def test_asienta_menos_nodos(self):
+        # Entre esquinas opuestas, A* con landmarks debe asentar menos nodos que Dijkstra (que asienta casi todos)
+        grafo = rejilla_ponderada(20, 3)
+        indice = IndiceLandmarks.construir(grafo, k=4, semilla=0)
+        s, t = indice.grafo.indice(1), indice.grafo.indice(210)
+        _, _, asentados = indice._a_estrella(s, t)
+        self.assertLess(asentados, len(grafo) // 2)
+
+    def test_pesos_flotantes(self):
+        grafo = {1: [(2, 0.5), (3, 2.5)], 2: [(3, 1.0)], 3: [(4, 0.25)], 4: []}
+        indice = IndiceLandmarks.construir(grafo, k=2, semilla=1)
+        self.assertEqual(indice.shortest_path(1, 4), shortest_path(grafo, 1, 4))
+
+    def test_sin_camino(self):
+        grafo = {1: [(2, 1)], 2: [], 3: [(1, 1)]}
+        indice = IndiceLandmarks.construir(grafo, k=2)
+        with self.assertRaises(ValueError):
+            indice.shortest_path(1, 3)
+        with self.assertRaises(ValueError):
+            indice.shortest_path(1, 9)
+
+    def test_guardar_y_cargar(self):
+        grafo = rejilla_ponderada(8, 4)
+        csr = GrafoCSR.desde_ponderado(grafo)
+        indice = IndiceLandmarks.construir(csr, k=3, semilla=5)
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "indice.alt")
+            indice.guardar(ruta)
+            cargado = IndiceLandmarks.cargar(ruta, grafo)
+            self.assertEqual(cargado.landmarks, indice.landmarks)
+            self.assertEqual(cargado.desde, indice.desde)
+            self.assertEqual(cargado.hacia, indice.hacia)
+            self.assertEqual(cargado.shortest_path(1, 64), indice.shortest_path(1, 64))
+
+            # Un archivo truncado, en el encabezado o en las tablas, se rechaza con ValueError
+            with open(ruta, "rb") as archivo:
+                contenido = archivo.read()
+            for largo in (len(contenido) - 8, len(contenido) // 2, 12):
+                with open(ruta, "wb") as archivo:
+                    archivo.write(contenido[:largo])
+                with self.assertRaises(ValueError):
+                    IndiceLandmarks.cargar(ruta, csr)
+
+            # Un índice no se puede usar con otro grafo
+            with open(ruta, "wb") as archivo:
+                archivo.write(contenido)
+            grafo[1] = [(2, 100)] + grafo[1][1:]
+            with self.assertRaises(ValueError):
+                IndiceLandmarks.cargar(ruta, grafo)
+
+    def test_numero_de_landmarks_invalido(self):
+        with self.assertRaises(ValueError):
+            IndiceLandmarks.construir({1: [(2, 1)], 2: []}, k=3)
+
+
+if __name__ == '__main__':
+    unittest.main()
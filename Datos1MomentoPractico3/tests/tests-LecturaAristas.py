@@ -0,0 +1,124 @@
+import gzip
+import os
+import random
+import tempfile
+import unittest
+from modulo.contiene_ciclo import contiene_ciclo
+from modulo.Dijkstra import dijkstra
+from modulo.grafo_csr import GrafoCSR
+from modulo.kruskal import kruskal
+from modulo.kruskal_externo import kruskal_externo
+from modulo.lectura_aristas import leer_adyacencia, leer_aristas, leer_csr, leer_lotes, leer_ponderado
+
+
+class TestLecturaAristas(unittest.TestCase):
+
+    def setUp(self):
+        self.carpeta = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.carpeta.cleanup()
+
+    def escribir(self, texto, nombre="aristas.txt", comprimir=False):
+        ruta = os.path.join(self.carpeta.name, nombre)
+        with (gzip.open(ruta, "wt") if comprimir else open(ruta, "w")) as archivo:
+            archivo.write(texto)
+        return ruta
+
+    # 1. Espacios, comas, comentarios y líneas vacías
+    def test_formato_de_lineas(self):
+        ruta = self.escribir("# nodo1 nodo2 peso\n1 2 5\n\n2,3,7\n  # otro comentario\n3 , 1 , 2\r\n")
+        self.assertEqual(leer_aristas(ruta), [(1, 2, 5), (2, 3, 7), (3, 1, 2)])
+
+    # 2. Los lotes pequeños cortan el archivo en cualquier punto sin perder ni partir líneas
+    def test_lotes_pequenos(self):
+        aleatorio = random.Random(22)
+        aristas = [(aleatorio.randint(1, 500), aleatorio.randint(1, 500), aleatorio.randint(0, 10 ** 6))
+                   for _ in range(2000)]
+        ruta = self.escribir("".join(f"{a} {b} {w}\n" for a, b, w in aristas))
+        for tamano in (1, 7, 64, 4096):
+            self.assertEqual(leer_aristas(ruta, tamano_lote=tamano), aristas)
+        lotes = list(leer_lotes(ruta, tamano_lote=4096))
+        self.assertGreater(len(lotes), 1)
+        self.assertEqual(lotes[0][0].typecode, 'q')
+
+    # 3. Archivos gzip (detectados por su contenido) y última línea sin salto
+    def test_gzip(self):
+        ruta = self.escribir("1 2 3\n2 3 4", nombre="aristas.bin", comprimir=True)
+        self.assertEqual(leer_aristas(ruta), [(1, 2, 3), (2, 3, 4)])
+
+    # 4. Pesos flotantes
+    def test_pesos_flotantes(self):
+        ruta = self.escribir("1 2 1.5\n2 3 2\n")
+        (_, _, pesos), = leer_lotes(ruta)
+        self.assertEqual(pesos.typecode, 'd')
+        self.assertEqual(list(pesos), [1.5, 2.0])
+        with self.assertRaises(ValueError):
+            leer_aristas(ruta)  # kruskal exige pesos enteros
+
+    # 5. Los errores indican la línea, también en lotes posteriores al primero
+    def test_errores_con_numero_de_linea(self):
+        casos = {
+            "1 2 3\n4 5\n": 2,
+            "1 2 3\n\n# c\n1 x 3\n": 4,
+            "1 2 3\n0 2 3\n": 2,
+            "1 2 3\n1 2 -1\n": 2,
+            "1 2 3\n1 2 nan\n": 2,
+            "1 2 3\n1 2 inf\n": 2,
+            "1 2 0.5\n1 2 1e400\n": 2,
+            "1 2 0.5\n1 2 9223372036854775808\n": 2,
+            "1 2 3\n1 2 3 4\n": 2,
+            "1 2 3\n9223372036854775808 2 3\n": 2,
+            "1 2 3\n1 2 9223372036854775808\n": 2,
+        }
+        for texto, linea in casos.items():
+            ruta = self.escribir("1 2 3\n" * 50 + texto)
+            with self.assertRaisesRegex(ValueError, f"línea {50 + linea}\\."):
+                list(leer_lotes(ruta, tamano_lote=32))
+        with self.assertRaises(ValueError):
+            list(leer_lotes(ruta, tamano_lote=0))
+
+    # 6. Cada constructor arma la misma representación que se construiría a mano
+    def test_representaciones(self):
+        aristas = [(1, 2, 4), (2, 3, 1), (3, 4, 2), (4, 1, 3), (2, 4, 5)]
+        ruta = self.escribir("".join(f"{a} {b} {w}\n" for a, b, w in aristas))
+
+        self.assertEqual(kruskal(leer_aristas(ruta)), kruskal(aristas))
+
+        ponderado = leer_ponderado(ruta)
+        self.assertEqual(ponderado[4], [(1, 3)])
+        self.assertEqual(dijkstra(ponderado, 1), {1: 0, 2: 4, 3: 5, 4: 7})
+        no_dirigido = leer_ponderado(ruta, dirigido=False)
+        self.assertEqual(sorted(no_dirigido[1]), [(2, 4), (4, 3)])
+
+        adyacencia = leer_adyacencia(ruta, con_pesos=True)
+        self.assertEqual(sorted(adyacencia[2]), [1, 3, 4])
+        self.assertTrue(contiene_ciclo(adyacencia))
+        sin_pesos = self.escribir("1 2\n2 3\n", nombre="sin_pesos.txt")
+        self.assertFalse(contiene_ciclo(leer_adyacencia(sin_pesos)))
+
+        csr, esperado = leer_csr(ruta), GrafoCSR.desde_aristas(aristas)
+        self.assertEqual(list(csr.ids), list(esperado.ids))
+        self.assertEqual(list(csr.offsets), list(esperado.offsets))
+        self.assertEqual(list(csr.destinos), list(esperado.destinos))
+        self.assertEqual(list(csr.pesos), list(esperado.pesos))
+        self.assertEqual(dijkstra(leer_csr(ruta, dirigido=True), 1), dijkstra(ponderado, 1))
+
+    # 7. Aristas repetidas en un grafo dirigido (regla de validar_grafo)
+    def test_aristas_repetidas(self):
+        ruta = self.escribir("1 2 1\n2 3 1\n1 2 5\n")
+        with self.assertRaises(ValueError):
+            leer_ponderado(ruta)
+        with self.assertRaises(ValueError):
+            leer_csr(ruta, dirigido=True)
+        self.assertEqual(len(leer_aristas(ruta)), 3)  # kruskal sí admite aristas repetidas
+
+    # 8. kruskal_externo lee archivos comprimidos a través de los lotes
+    def test_kruskal_externo_gzip(self):
+        aristas = [(1, 2, 3), (2, 3, 1), (1, 3, 2)]
+        ruta = self.escribir("".join(f"{a},{b},{w}\n" for a, b, w in aristas), nombre="a.gz", comprimir=True)
+        self.assertEqual(list(kruskal_externo(ruta)), [(2, 3, 1), (1, 3, 2)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+from modulo.grafo_csr import GrafoCSR
+from modulo.main import main
+
+PROYECTO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ARISTAS = [(1, 2, 4), (2, 3, 1), (3, 4, 2), (4, 1, 3), (2, 4, 5)]
+
+
+class TestMain(unittest.TestCase):
+
+    def setUp(self):
+        self.carpeta = tempfile.TemporaryDirectory()
+        self.ruta = self.escribir("".join(f"{a} {b} {w}\n" for a, b, w in ARISTAS))
+
+    def tearDown(self):
+        self.carpeta.cleanup()
+
+    def escribir(self, texto, nombre="aristas.txt"):
+        ruta = os.path.join(self.carpeta.name, nombre)
+        with open(ruta, "w") as archivo:
+            archivo.write(texto)
+        return ruta
+
+    def ejecutar(self, *argumentos):
+        salida, errores = io.StringIO(), io.StringIO()
+        with redirect_stdout(salida), redirect_stderr(errores):
+            codigo = main(list(argumentos))
+        return codigo, salida.getvalue().splitlines(), errores.getvalue()
+
+    # 1. mst: las aristas del árbol en el formato de entrada y el peso total; tiempos y memoria en stderr
+    def test_mst(self):
+        for algoritmo in ("kruskal", "boruvka"):
+            codigo, lineas, errores = self.ejecutar("mst", self.ruta, "--algoritmo", algoritmo, "--procesos", "1")
+            self.assertEqual(codigo, 0)
+            self.assertEqual(lineas, ["2 3 1", "3 4 2", "1 4 3", "# peso total: 6"])
+            self.assertIn("memoria pico", errores)
+        _, _, errores = self.ejecutar("mst", self.ruta, "--silencioso")
+        self.assertEqual(errores, "")
+
+    # 2. sssp: ambos algoritmos coinciden, y la búsqueda acotada solo retorna los nodos pedidos
+    def test_sssp(self):
+        _, lineas, _ = self.ejecutar("sssp", self.ruta, "1")
+        self.assertEqual(lineas, ["1 0", "2 4", "3 5", "4 3"])
+        _, delta, _ = self.ejecutar("sssp", self.ruta, "1", "--algoritmo", "delta-stepping", "--motor", "python")
+        self.assertEqual(sorted(delta), lineas)
+        _, lineas, _ = self.ejecutar("sssp", self.ruta, "1", "--k", "2", "--cola", "heap")
+        self.assertEqual(lineas, ["1 0", "4 3"])
+        _, lineas, _ = self.ejecutar("sssp", self.ruta, "1", "--dirigido", "--max-distancia", "4")
+        self.assertEqual(lineas, ["1 0", "2 4"])
+
+    # 3. path: distancia y nodos del camino
+    def test_path(self):
+        for extra in ([], ["--bidireccional"]):
+            _, lineas, _ = self.ejecutar("path", self.ruta, "1", "3", "--dirigido", *extra)
+            self.assertEqual(lineas, ["5", "1 2 3"])
+
+    # 4. has-cycle: archivos con o sin pesos, y el ciclo como testigo
+    def test_has_cycle(self):
+        _, lineas, _ = self.ejecutar("has-cycle", self.ruta, "--con-pesos", "--testigo")
+        self.assertEqual(lineas[0], "True")
+        self.assertEqual(sorted(map(int, lineas[1].split())), [1, 2, 3, 4])
+        _, lineas, _ = self.ejecutar("has-cycle", self.escribir("1 2\n2 3\n", nombre="arbol.txt"), "--testigo")
+        self.assertEqual(lineas, ["False"])
+
+    # 5. Los archivos binarios de GrafoCSR.guardar se detectan por su contenido
+    def test_archivo_binario(self):
+        ruta = os.path.join(self.carpeta.name, "grafo.csr")
+        GrafoCSR.desde_aristas(ARISTAS).guardar(ruta)
+        self.assertEqual(self.ejecutar("mst", ruta)[1], self.ejecutar("mst", self.ruta)[1])
+        self.assertEqual(self.ejecutar("sssp", ruta, "1")[1], self.ejecutar("sssp", self.ruta, "1")[1])
+        self.assertEqual(self.ejecutar("has-cycle", ruta)[1], ["True"])
+
+    # 6. Los errores del grafo o del archivo se informan en stderr con código 1
+    def test_errores(self):
+        for argumentos in (("sssp", self.ruta, "9"), ("mst", os.path.join(self.carpeta.name, "no_existe.txt")),
+                           ("mst", self.escribir("1 2\n", nombre="sin_pesos.txt"))):
+            codigo, lineas, errores = self.ejecutar(*argumentos)
+            self.assertEqual(codigo, 1)
+            self.assertEqual(lineas, [])
+            self.assertTrue(errores.startswith("error: "))
+        with self.assertRaises(SystemExit), redirect_stderr(io.StringIO()):
+            main(["dfs", self.ruta])
+        # delta-stepping no acota la búsqueda: se rechazan las opciones en lugar de ignorarlas
+        for opcion in (["--max-distancia", "4"], ["--k", "2"]):
+            errores = io.StringIO()
+            with self.assertRaises(SystemExit), redirect_stderr(errores):
+                main(["sssp", self.ruta, "1", "--algoritmo", "delta-stepping", *opcion])
+            self.assertIn("--max-distancia y --k", errores.getvalue())
+
+    # 7. --detalle agrega los contadores de Estadisticas
+    def test_detalle(self):
+        _, _, errores = self.ejecutar("sssp", self.ruta, "1", "--detalle")
+        self.assertIn("# nodos_asentados: 4", errores)
+        self.assertIn("# fase busqueda:", errores)
+
+    # 8. Se puede ejecutar como script y no importa ningún algoritmo hasta elegir el subcomando
+    def test_script_e_importaciones_perezosas(self):
+        resultado = subprocess.run([sys.executable, os.path.join("modulo", "main.py"), "path", self.ruta, "1", "3",
+                                    "--dirigido", "-s"], cwd=PROYECTO, capture_output=True, text=True)
+        self.assertEqual(resultado.stdout.splitlines(), ["5", "1 2 3"])
+        resultado = subprocess.run([sys.executable, "-c", "import sys, modulo.main; print(sorted(m for m in "
+                                    "sys.modules if m.startswith('modulo.')))"], cwd=PROYECTO, capture_output=True,
+                                   text=True)
+        self.assertEqual(resultado.stdout.strip(), "['modulo.main']")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from benchmarks.suite import comparar, main
+
+
+def resultado(segundos, memoria_pico, variante="ordenado", aristas=1000):
+    return {"generador": "rejilla", "aristas": aristas, "algoritmo": "kruskal", "variante": variante,
+            "segundos": segundos, "memoria_pico": memoria_pico}
+
+
+class TestComparar(unittest.TestCase):
+
+    # 1. Empeorar exactamente la tolerancia no es regresión; pasarla apenas, sí
+    def test_limite_de_tolerancia(self):
+        base = [resultado(2.0, 1000)]
+        self.assertEqual(comparar([resultado(3.0, 1500)], base, 0.5), [])
+        nuevo = resultado(3.0001, 1500)
+        self.assertEqual(comparar([nuevo], base, 0.5), [(nuevo, "segundos", 3.0001 / 2.0)])
+        nuevo = resultado(1.0, 1501)
+        self.assertEqual(comparar([nuevo], base, 0.5), [(nuevo, "memoria_pico", 1.501)])
+
+    # 2. Las mediciones que no están en la base (otra variante u otro tamaño) se ignoran
+    def test_clave_ausente_en_la_base(self):
+        base = [resultado(1.0, 1000)]
+        nuevos = [resultado(50.0, 10 ** 6, variante="heap"), resultado(50.0, 10 ** 6, aristas=2000)]
+        self.assertEqual(comparar(nuevos, base, 0.2), [])
+        self.assertEqual(comparar(nuevos, [], 0.2), [])
+
+    # 3. Sin memoria medida (None) en cualquiera de las dos ejecuciones solo se comparan los tiempos
+    def test_memoria_no_medida(self):
+        self.assertEqual(comparar([resultado(1.0, None)], [resultado(1.0, 1000)], 0.2), [])
+        self.assertEqual(comparar([resultado(1.0, 10 ** 6)], [resultado(1.0, None)], 0.2), [])
+        nuevo = resultado(2.0, None)
+        self.assertEqual(comparar([nuevo], [resultado(1.0, None)], 0.2), [(nuevo, "segundos", 2.0)])
+
+
+class TestMainSuite(unittest.TestCase):
+
+    ARGUMENTOS = ["--aristas", "100", "--generadores", "camino", "--algoritmos", "union_find", "--repeticiones", "1",
+                  "--sin-memoria"]
+
+    def ejecutar(self, carpeta, segundos_base):
+        # La base tiene las mismas claves que producirá la ejecución, con el tiempo dado
+        base = [{"generador": "camino", "aristas": 100, "algoritmo": "union_find", "variante": variante,
+                 "segundos": segundos_base, "memoria_pico": None} for variante in ("union", "union_many")]
+        ruta_base = os.path.join(carpeta, "base.json")
+        ruta_salida = os.path.join(carpeta, "resultados.json")
+        with open(ruta_base, "w", encoding="utf-8") as archivo:
+            json.dump({"resultados": base}, archivo)
+        salida = io.StringIO()
+        with redirect_stdout(salida):
+            codigo = main(self.ARGUMENTOS + ["--comparar", ruta_base, "--salida", ruta_salida])
+        with open(ruta_salida, encoding="utf-8") as archivo:
+            guardados = json.load(archivo)["resultados"]
+        return codigo, salida.getvalue(), guardados
+
+    # 4. Con una base imposible de igualar main informa las regresiones y retorna 1
+    def test_regresion_retorna_1(self):
+        with tempfile.TemporaryDirectory() as carpeta:
+            codigo, salida, guardados = self.ejecutar(carpeta, 1e-12)
+        self.assertEqual(codigo, 1)
+        self.assertEqual(salida.count("REGRESIÓN segundos"), 2)
+        self.assertEqual([r["variante"] for r in guardados], ["union", "union_many"])
+
+    # 5. Sin regresiones retorna 0
+    def test_sin_regresiones_retorna_0(self):
+        with tempfile.TemporaryDirectory() as carpeta:
+            codigo, salida, _ = self.ejecutar(carpeta, 1e6)
+        self.assertEqual(codigo, 0)
+        self.assertIn("Sin regresiones", salida)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+from modulo.tabla_ids import TablaIds
+
+
+class TestTablaIds(unittest.TestCase):
+
+    def test_internado_en_orden_de_aparicion(self):
+        tabla = TablaIds()
+        self.assertEqual(list(tabla.internar_muchos([900, 5, 900, 2 ** 50])), [0, 1, 0, 2])
+        self.assertEqual(len(tabla), 3)
+        self.assertEqual(tabla.ids_de([2, 0]), [2 ** 50, 900])
+
+    def test_identificadores_hashables(self):
+        tabla = TablaIds(["a", ("b", 1)])
+        self.assertEqual(tabla.indice(("b", 1)), 1)
+        self.assertIn("a", tabla)
+
+    def test_almacenamiento_compacto(self):
+        tabla = TablaIds([2 ** 64 - 1, 3], tipo='Q')
+        self.assertEqual(tabla.ids.typecode, 'Q')
+        self.assertEqual(tabla.internar(3), 1)
+
+    def test_nodo_inexistente(self):
+        with self.assertRaises(ValueError):
+            TablaIds([1, 2]).indice(3)
+
+
+if __name__ == '__main__':
+    unittest.main()
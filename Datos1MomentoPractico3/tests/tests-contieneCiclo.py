@@ -1,5 +1,7 @@
+import random
 import unittest
 from modulo.contiene_ciclo import contiene_ciclo
+from modulo.grafo_csr import GrafoCSR
 
 
 class TestGrafoCiclo(unittest.TestCase):
@@ -147,5 +149,90 @@ class TestGrafoCiclo(unittest.TestCase):
         self.assertFalse(contiene_ciclo(grafo))  # No tiene ciclo
 
 
+class TestTestigoCiclo(unittest.TestCase):
+
+    def assertCicloValido(self, grafo, ciclo):
+        """El testigo debe tener nodos distintos, cada uno adyacente al siguiente y el último al primero."""
+        self.assertIsNotNone(ciclo)
+        self.assertEqual(len(set(ciclo)), len(ciclo))
+        for i, nodo in enumerate(ciclo):
+            siguiente = ciclo[(i + 1) % len(ciclo)]
+            self.assertTrue(siguiente in grafo[nodo] or nodo in grafo[siguiente])
+
+    # 1. Sin ciclos el testigo es None
+    def test_sin_ciclo(self):
+        self.assertIsNone(contiene_ciclo({1: [2], 2: [1, 3], 3: [2], 4: []}, testigo=True))
+        self.assertIsNone(contiene_ciclo({}, testigo=True))
+
+    # 2. Triángulo y autociclo
+    def test_triangulo_y_autociclo(self):
+        grafo = {1: [2], 2: [1, 3], 3: [2, 1]}
+        ciclo = contiene_ciclo(grafo, testigo=True)
+        self.assertEqual(sorted(ciclo), [1, 2, 3])
+        self.assertCicloValido(grafo, ciclo)
+        self.assertEqual(contiene_ciclo({1: [2], 2: [1, 2]}, testigo=True), [2])
+
+    # 3. Una arista listada dos veces hacia el padre no es un ciclo
+    def test_arista_repetida_hacia_el_padre(self):
+        self.assertFalse(contiene_ciclo({1: [2, 2], 2: [1, 1]}))
+
+    # 4. Un nodo alcanzable por varios caminos se apila una sola vez y el ciclo se detecta igual
+    def test_nodo_alcanzado_por_varios_caminos(self):
+        grafo = {1: [2, 3, 4], 2: [1, 4], 3: [1], 4: [1, 2]}
+        ciclo = contiene_ciclo(grafo, testigo=True)
+        self.assertEqual(sorted(ciclo), [1, 2, 4])
+        self.assertCicloValido(grafo, ciclo)
+
+    # 5. El ciclo está al final de un camino largo
+    def test_ciclo_al_final_de_un_camino_largo(self):
+        n = 100_000
+        grafo = {i: [] for i in range(1, n + 1)}
+        for i in range(1, n):
+            grafo[i].append(i + 1)
+            grafo[i + 1].append(i)
+        self.assertFalse(contiene_ciclo(grafo))
+        grafo[n].append(n - 3)
+        grafo[n - 3].append(n)
+        ciclo = contiene_ciclo(grafo, testigo=True)
+        self.assertEqual(sorted(ciclo), [n - 3, n - 2, n - 1, n])
+        self.assertCicloValido(grafo, ciclo)
+
+    # 6. Igual resultado sobre GrafoCSR, con los ids originales
+    def test_testigo_en_grafo_csr(self):
+        grafo = GrafoCSR.desde_aristas([(10, 20, 1), (20, 30, 1), (30, 40, 1), (40, 20, 1)])
+        self.assertEqual(sorted(contiene_ciclo(grafo, testigo=True)), [20, 30, 40])
+
+    # 7. Grafos aleatorios: hay ciclo si y solo si hay más aristas que nodos menos componentes
+    def test_grafos_aleatorios(self):
+        aleatorio = random.Random(19)
+        for _ in range(100):
+            n = aleatorio.randint(1, 30)
+            aristas = {frozenset(aleatorio.sample(range(1, n + 1), 2)) for _ in range(aleatorio.randint(0, n))
+                       if n > 1}
+            grafo = {i: [] for i in range(1, n + 1)}
+            for nodo1, nodo2 in map(tuple, aristas):
+                grafo[nodo1].append(nodo2)
+                grafo[nodo2].append(nodo1)
+
+            componentes, visitados = 0, set()
+            for nodo in grafo:
+                if nodo not in visitados:
+                    componentes += 1
+                    pila = [nodo]
+                    visitados.add(nodo)
+                    while pila:
+                        for vecino in grafo[pila.pop()]:
+                            if vecino not in visitados:
+                                visitados.add(vecino)
+                                pila.append(vecino)
+
+            ciclo = contiene_ciclo(grafo, testigo=True)
+            self.assertEqual(ciclo is not None, len(aristas) > n - componentes)
+            self.assertEqual(contiene_ciclo(grafo), ciclo is not None)
+            if ciclo is not None:
+                self.assertGreaterEqual(len(ciclo), 3)
+                self.assertCicloValido(grafo, ciclo)
+
+
 if __name__ == '__main__':
     unittest.main()